@@ -0,0 +1,64 @@
+from logging.config import fileConfig
+
+from alembic import context
+
+from app.database import Base, engine, get_sync_database_url
+from app.config import get_settings
+import app.models  # noqa: F401 - register all models with Base metadata
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+# Created by raw SQL in migration 0008 (FTS5 on SQLite, tsvector on PostgreSQL),
+# so they have no models; FTS5 also adds search_index_* shadow tables
+UNMANAGED_TABLES = {"search_index"}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Keep autogenerate from dropping the search index tables."""
+    if type_ == "table" and (name in UNMANAGED_TABLES or name.startswith("search_index_")):
+        return False
+    table = getattr(object, "table", None)
+    if table is not None and table.name in UNMANAGED_TABLES:
+        return False
+    return True
+
+
+def run_migrations_offline() -> None:
+    """Emit SQL for the configured database without connecting."""
+    context.configure(
+        url=get_sync_database_url(get_settings().database_url),
+        target_metadata=target_metadata,
+        include_object=include_object,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=True,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Run migrations using the application's engine."""
+    with engine.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+            # SQLite can't ALTER most constraints - rebuild tables in batch mode instead
+            render_as_batch=connection.dialect.name == "sqlite",
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
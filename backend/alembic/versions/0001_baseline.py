@@ -0,0 +1,251 @@
+"""Baseline schema
+
+Creates the schema the app used to build with create_all(), and brings
+databases set up that way (plus migrate_db.py / migrate_trades.py) to the
+same state, so existing installs can be upgraded in place.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Frozen copy of the trades seeded by the old migrate_trades.py script
+SEED_TRADES = [
+    {"name": "General", "icon": "🏗️", "order": 1},
+    {"name": "Framing", "icon": "🪵", "order": 2},
+    {"name": "Concrete", "icon": "🧱", "order": 3},
+    {"name": "Electrical", "icon": "⚡", "order": 4},
+    {"name": "Plumbing", "icon": "🔧", "order": 5},
+    {"name": "HVAC", "icon": "❄️", "order": 6},
+    {"name": "Flooring", "icon": "🪨", "order": 7},
+    {"name": "Painting", "icon": "🎨", "order": 8},
+    {"name": "Drywall", "icon": "📐", "order": 9},
+    {"name": "Roofing", "icon": "🏠", "order": 10},
+    {"name": "Windows/Doors", "icon": "🚪", "order": 11},
+    {"name": "Cabinets", "icon": "🗄️", "order": 12},
+    {"name": "Countertops", "icon": "🪨", "order": 13},
+    {"name": "Appliances", "icon": "🔌", "order": 14},
+    {"name": "Landscaping", "icon": "🌳", "order": 15},
+    {"name": "Insulation", "icon": "🧊", "order": 16},
+    {"name": "Siding", "icon": "🏢", "order": 17},
+    {"name": "Gutters", "icon": "💧", "order": 18},
+    {"name": "Cleaning", "icon": "🧹", "order": 19},
+]
+
+user_role = sa.Enum("ADMIN", "PROJECT_MANAGER", "VIEWER", name="userrole")
+project_status = sa.Enum("ACTIVE", "DELIVERED", "ARCHIVED", name="projectstatus")
+issue_priority = sa.Enum("LOW", "MEDIUM", "HIGH", name="issuepriority")
+issue_status = sa.Enum(
+    "OPEN", "ASSIGNED", "IN_PROGRESS", "READY_FOR_REINSPECT", "CLOSED", name="issuestatus"
+)
+photo_type = sa.Enum("BEFORE", "AFTER", name="phototype")
+
+
+def _created_at():
+    return sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now())
+
+
+def _updated_at():
+    return sa.Column("updated_at", sa.DateTime(timezone=True))
+
+
+TABLES = [
+    ("users", lambda: [
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("email", sa.String(255), nullable=False),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("phone", sa.String(50)),
+        sa.Column("password_hash", sa.String(255), nullable=False),
+        sa.Column("role", user_role, nullable=False),
+        sa.Column("is_active", sa.Integer()),
+        _created_at(),
+        _updated_at(),
+    ]),
+    ("projects", lambda: [
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("address", sa.String(500), nullable=False),
+        sa.Column("unit", sa.String(100)),
+        sa.Column("status", project_status, nullable=False),
+        sa.Column("close_date", sa.Date()),
+        sa.Column("notes", sa.Text()),
+        sa.Column("owner_id", sa.Integer(), sa.ForeignKey("users.id")),
+        _created_at(),
+        _updated_at(),
+    ]),
+    ("trades", lambda: [
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(100), nullable=False, unique=True),
+        sa.Column("description", sa.Text()),
+        sa.Column("icon", sa.String(50)),
+        sa.Column("order", sa.Integer()),
+        sa.Column("is_active", sa.Integer()),
+        _created_at(),
+        _updated_at(),
+    ]),
+    ("areas", lambda: [
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("projects.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("order", sa.Integer()),
+        sa.Column("is_custom", sa.Integer()),
+        _created_at(),
+    ]),
+    ("contractors", lambda: [
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("company", sa.String(255), nullable=False),
+        sa.Column("contact_name", sa.String(255)),
+        sa.Column("email", sa.String(255)),
+        sa.Column("phone", sa.String(50)),
+        sa.Column("trade_id", sa.Integer(), sa.ForeignKey("trades.id", ondelete="SET NULL")),
+        sa.Column("trades", sa.JSON()),
+        sa.Column("notes", sa.Text()),
+        sa.Column("is_active", sa.Integer()),
+        _created_at(),
+        _updated_at(),
+    ]),
+    ("project_contractors", lambda: [
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("projects.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("contractor_id", sa.Integer(), sa.ForeignKey("contractors.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("trades", sa.JSON()),
+        sa.Column("notes", sa.Text()),
+        _created_at(),
+    ]),
+    ("manual_templates", lambda: [
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("version", sa.String(50)),
+        sa.Column("sections", sa.JSON()),
+        sa.Column("is_active", sa.Integer()),
+        _created_at(),
+        _updated_at(),
+    ]),
+    ("manual_instances", lambda: [
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, unique=True),
+        sa.Column("template_id", sa.Integer(), sa.ForeignKey("manual_templates.id")),
+        sa.Column("fields", sa.JSON()),
+        sa.Column("attachments", sa.JSON()),
+        _created_at(),
+        _updated_at(),
+    ]),
+    ("issues", lambda: [
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("projects.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("area_id", sa.Integer(), sa.ForeignKey("areas.id", ondelete="SET NULL")),
+        sa.Column("category", sa.String(100), nullable=False),
+        sa.Column("subcategory", sa.String(100)),
+        sa.Column("description", sa.Text()),
+        sa.Column("priority", issue_priority, nullable=False),
+        sa.Column("status", issue_status, nullable=False),
+        sa.Column("resolution_notes", sa.Text()),
+        sa.Column("trade", sa.String(100)),
+        sa.Column("contractor_id", sa.Integer(), sa.ForeignKey("contractors.id", ondelete="SET NULL")),
+        sa.Column("due_date", sa.Date()),
+        sa.Column("created_by", sa.Integer(), sa.ForeignKey("users.id")),
+        _created_at(),
+        sa.Column("closed_by", sa.Integer(), sa.ForeignKey("users.id")),
+        sa.Column("closed_at", sa.DateTime(timezone=True)),
+        _updated_at(),
+        sa.Column("notification_sent_at", sa.DateTime(timezone=True)),
+    ]),
+    ("issue_photos", lambda: [
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("issue_id", sa.Integer(), sa.ForeignKey("issues.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("url", sa.String(500), nullable=False),
+        sa.Column("filename", sa.String(255)),
+        sa.Column("photo_type", photo_type, nullable=False),
+        _created_at(),
+    ]),
+]
+
+# (index name, table, columns, unique) - the index=True columns of the models
+INDEXES = [
+    ("ix_users_id", "users", ["id"], False),
+    ("ix_users_email", "users", ["email"], True),
+    ("ix_projects_id", "projects", ["id"], False),
+    ("ix_trades_id", "trades", ["id"], False),
+    ("ix_areas_id", "areas", ["id"], False),
+    ("ix_contractors_id", "contractors", ["id"], False),
+    ("ix_project_contractors_id", "project_contractors", ["id"], False),
+    ("ix_manual_templates_id", "manual_templates", ["id"], False),
+    ("ix_manual_instances_id", "manual_instances", ["id"], False),
+    ("ix_issues_id", "issues", ["id"], False),
+    ("ix_issue_photos_id", "issue_photos", ["id"], False),
+]
+
+
+def _backfill_contractor_trades(bind):
+    """Link legacy contractors to the trade named first in their JSON trades list."""
+    trade_ids = dict(bind.execute(sa.text("SELECT name, id FROM trades")).fetchall())
+    rows = bind.execute(
+        sa.text("SELECT id, trades FROM contractors WHERE trades IS NOT NULL")
+    ).fetchall()
+    for contractor_id, trades in rows:
+        if isinstance(trades, str):
+            try:
+                trades = json.loads(trades)
+            except json.JSONDecodeError:
+                continue
+        if trades and trades[0] in trade_ids:
+            bind.execute(
+                sa.text("UPDATE contractors SET trade_id = :trade_id WHERE id = :id"),
+                {"trade_id": trade_ids[trades[0]], "id": contractor_id},
+            )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    existing = set(inspector.get_table_names())
+
+    for name, columns in TABLES:
+        if name in existing:
+            continue
+        table = op.create_table(name, *columns())
+        if name == "trades":
+            op.bulk_insert(table, [{**trade, "is_active": 1} for trade in SEED_TRADES])
+
+    # Columns added by the old ad-hoc scripts (migrate_db.py, migrate_trades.py)
+    if "issues" in existing:
+        columns = {c["name"] for c in inspector.get_columns("issues")}
+        if "resolution_notes" not in columns:
+            op.add_column("issues", sa.Column("resolution_notes", sa.Text()))
+    if "contractors" in existing:
+        columns = {c["name"] for c in inspector.get_columns("contractors")}
+        if "trade_id" not in columns:
+            with op.batch_alter_table("contractors") as batch_op:
+                batch_op.add_column(sa.Column("trade_id", sa.Integer()))
+                batch_op.create_foreign_key(
+                    "fk_contractors_trade_id_trades", "trades", ["trade_id"], ["id"],
+                    ondelete="SET NULL",
+                )
+            _backfill_contractor_trades(bind)
+
+    for index_name, table, columns, unique in INDEXES:
+        current = {ix["name"] for ix in inspector.get_indexes(table)} if table in existing else set()
+        if index_name not in current:
+            op.create_index(index_name, table, columns, unique=unique)
+
+
+def downgrade() -> None:
+    for name, _ in reversed(TABLES):
+        op.drop_table(name)
+    bind = op.get_bind()
+    for enum in (photo_type, issue_status, issue_priority, project_status, user_role):
+        enum.drop(bind, checkfirst=True)
@@ -0,0 +1,48 @@
+"""Composite indexes for issue, area and assignment hot queries
+
+Replaces migrate_indexes.py.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ("ix_issues_project_created_at", "issues", ["project_id", "created_at"]),
+    ("ix_issues_project_status_created_at", "issues", ["project_id", "status", "created_at"]),
+    ("ix_issues_project_priority_status", "issues", ["project_id", "priority", "status"]),
+    ("ix_issues_area_created_at", "issues", ["area_id", "created_at"]),
+    ("ix_issues_contractor_created_at", "issues", ["contractor_id", "created_at"]),
+    ("ix_issue_photos_issue_id", "issue_photos", ["issue_id"]),
+    ("ix_areas_project_order", "areas", ["project_id", "order"]),
+    ("ix_project_contractors_project_contractor", "project_contractors", ["project_id", "contractor_id"]),
+    ("ix_project_contractors_contractor_id", "project_contractors", ["contractor_id"]),
+]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        # Databases that already ran migrate_indexes.py have these
+        if name not in {ix["name"] for ix in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns)
+    # Refresh planner statistics so the new indexes get picked up
+    op.execute("ANALYZE")
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
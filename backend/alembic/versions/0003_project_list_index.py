@@ -0,0 +1,25 @@
+"""Index for keyset pagination of the project list
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_projects_created_at_id", "projects", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_projects_created_at_id", table_name="projects")
@@ -0,0 +1,49 @@
+"""Per-project issue counters by status and priority
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def existing_enum(name: str, *values: str) -> sa.Enum:
+    """Enum column type reusing the PostgreSQL type created by the baseline."""
+    return sa.Enum(*values, name=name).with_variant(
+        postgresql.ENUM(*values, name=name, create_type=False), "postgresql"
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "project_issue_counters",
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column(
+            "status",
+            existing_enum("issuestatus", "OPEN", "ASSIGNED", "IN_PROGRESS", "READY_FOR_REINSPECT", "CLOSED"),
+            primary_key=True,
+        ),
+        sa.Column("priority", existing_enum("issuepriority", "LOW", "MEDIUM", "HIGH"), primary_key=True),
+        sa.Column("count", sa.Integer(), nullable=False),
+    )
+    op.execute(
+        "INSERT INTO project_issue_counters (project_id, status, priority, count) "
+        "SELECT project_id, status, priority, count(id) FROM issues "
+        "GROUP BY project_id, status, priority"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("project_issue_counters")
@@ -0,0 +1,31 @@
+"""Generation counters for the in-process reference data cache
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    table = op.create_table(
+        "cache_generations",
+        sa.Column("name", sa.String(50), primary_key=True),
+        sa.Column("generation", sa.Integer(), nullable=False),
+    )
+    op.bulk_insert(table, [{"name": "reference", "generation": 0}])
+
+
+def downgrade() -> None:
+    op.drop_table("cache_generations")
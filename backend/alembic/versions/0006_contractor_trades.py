@@ -0,0 +1,57 @@
+"""Contractor/trade association table
+
+Replaces the JSON list of trade names on contractors (left in place, no
+longer written) with an indexed many-to-many table.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _backfill(bind, table):
+    """Link each contractor to its primary trade_id and the trades named in its JSON list."""
+    trade_ids = dict(bind.execute(sa.text("SELECT name, id FROM trades")).fetchall())
+    rows = bind.execute(sa.text("SELECT id, trade_id, trades FROM contractors")).fetchall()
+    links = []
+    for contractor_id, primary_id, trades in rows:
+        if isinstance(trades, str):
+            try:
+                trades = json.loads(trades)
+            except json.JSONDecodeError:
+                trades = []
+        ids = [primary_id] if primary_id is not None else []
+        ids += [trade_ids[name] for name in trades or [] if name in trade_ids]
+        for position, trade_id in enumerate(dict.fromkeys(ids)):
+            links.append({"contractor_id": contractor_id, "trade_id": trade_id, "position": position})
+    if links:
+        op.bulk_insert(table, links)
+
+
+def upgrade() -> None:
+    table = op.create_table(
+        "contractor_trades",
+        sa.Column("contractor_id", sa.Integer(), sa.ForeignKey("contractors.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("trade_id", sa.Integer(), sa.ForeignKey("trades.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("position", sa.Integer(), nullable=False),
+    )
+    op.create_index("ix_contractor_trades_trade_contractor", "contractor_trades", ["trade_id", "contractor_id"])
+    _backfill(op.get_bind(), table)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_contractor_trades_trade_contractor", table_name="contractor_trades")
+    op.drop_table("contractor_trades")
@@ -0,0 +1,40 @@
+"""Trade foreign key on issues
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("issues") as batch_op:
+        batch_op.add_column(sa.Column("trade_id", sa.Integer()))
+        batch_op.create_foreign_key(
+            "fk_issues_trade_id_trades", "trades", ["trade_id"], ["id"], ondelete="SET NULL"
+        )
+    op.create_index("ix_issues_project_trade_created_at", "issues", ["project_id", "trade_id", "created_at"])
+    # Link issues whose free-text trade names an existing trade (names are unique ignoring case)
+    op.execute(
+        "UPDATE issues SET trade_id = ("
+        "SELECT trades.id FROM trades WHERE lower(trades.name) = lower(issues.trade) LIMIT 1"
+        ") WHERE trade IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_issues_project_trade_created_at", table_name="issues")
+    with op.batch_alter_table("issues") as batch_op:
+        batch_op.drop_constraint("fk_issues_trade_id_trades", type_="foreignkey")
+        batch_op.drop_column("trade_id")
@@ -0,0 +1,73 @@
+"""Full-text search index over projects, issues and contractors
+
+SQLite uses an FTS5 virtual table, PostgreSQL a table with a generated
+tsvector column and a GIN index. Rows are kept up to date by the API
+write paths (see services/search_index.py).
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Frozen copy of the document sources in services/search_index.py
+DOCUMENT_SOURCES = [
+    "SELECT id * 4 + 1 AS doc_id, 'project' AS kind, id AS ref_id, id AS project_id, "
+    "name AS title, "
+    "coalesce(address, '') || ' ' || coalesce(unit, '') || ' ' || coalesce(notes, '') AS body "
+    "FROM projects",
+    "SELECT id * 4 + 2 AS doc_id, 'issue' AS kind, id AS ref_id, project_id, "
+    "category || coalesce(' - ' || subcategory, '') AS title, "
+    "coalesce(description, '') || ' ' || coalesce(resolution_notes, '') || ' ' || coalesce(trade, '') AS body "
+    "FROM issues",
+    "SELECT id * 4 + 3 AS doc_id, 'contractor' AS kind, id AS ref_id, NULL AS project_id, "
+    "company AS title, "
+    "coalesce(contact_name, '') || ' ' || coalesce(email, '') || ' ' || coalesce(notes, '') AS body "
+    "FROM contractors WHERE is_active = 1",
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        id_column = "doc_id"
+        op.execute(
+            "CREATE TABLE search_index ("
+            "doc_id BIGINT PRIMARY KEY, "
+            "kind VARCHAR(20) NOT NULL, "
+            "ref_id INTEGER NOT NULL, "
+            "project_id INTEGER, "
+            "title TEXT NOT NULL, "
+            "body TEXT NOT NULL, "
+            "document tsvector GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('simple', title), 'A') || setweight(to_tsvector('simple', body), 'B')"
+            ") STORED)"
+        )
+        op.execute("CREATE INDEX ix_search_index_document ON search_index USING GIN (document)")
+        op.execute("CREATE INDEX ix_search_index_project_id ON search_index (project_id)")
+    else:
+        id_column = "rowid"
+        op.execute(
+            "CREATE VIRTUAL TABLE search_index USING fts5("
+            "kind UNINDEXED, ref_id UNINDEXED, project_id UNINDEXED, title, body, "
+            "tokenize = 'unicode61 remove_diacritics 2')"
+        )
+    for source in DOCUMENT_SOURCES:
+        op.execute(
+            f"INSERT INTO search_index ({id_column}, kind, ref_id, project_id, title, body) "
+            f"SELECT doc_id, kind, ref_id, project_id, title, body FROM ({source}) AS docs"
+        )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE search_index")
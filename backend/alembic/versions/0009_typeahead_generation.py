@@ -0,0 +1,25 @@
+"""Cache generation for the typeahead prefix indexes
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("INSERT INTO cache_generations (name, generation) VALUES ('typeahead', 0)")
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM cache_generations WHERE name = 'typeahead'")
@@ -0,0 +1,40 @@
+"""Project templates
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "project_templates",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(255), nullable=False, unique=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("areas", sa.JSON(), nullable=True),
+        sa.Column("contractor_ids", sa.JSON(), nullable=True),
+        sa.Column("manual_template_id", sa.Integer(), sa.ForeignKey("manual_templates.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("manual_fields", sa.JSON(), nullable=True),
+        sa.Column("created_by", sa.Integer(), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_project_templates_id", "project_templates", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_project_templates_id", table_name="project_templates")
+    op.drop_table("project_templates")
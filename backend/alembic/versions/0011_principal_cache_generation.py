@@ -0,0 +1,25 @@
+"""Cache generation for authenticated users
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("INSERT INTO cache_generations (name, generation) VALUES ('principals', 0)")
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM cache_generations WHERE name = 'principals'")
@@ -0,0 +1,53 @@
+"""Index issues under their current trade name
+
+Issue documents took the free-text issues.trade value; they now use the
+name of the trade referenced by trade_id (falling back to the free text).
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0014"
+down_revision: Union[str, None] = "0013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Frozen copies of the issue document source in services/search_index.py
+ISSUE_SOURCE = (
+    "SELECT issues.id * 4 + 2 AS doc_id, 'issue' AS kind, issues.id AS ref_id, issues.project_id, "
+    "issues.category || coalesce(' - ' || issues.subcategory, '') AS title, "
+    "coalesce(issues.description, '') || ' ' || coalesce(issues.resolution_notes, '') || ' ' || "
+    "coalesce(trades.name, issues.trade, '') AS body "
+    "FROM issues LEFT JOIN trades ON trades.id = issues.trade_id"
+)
+PREVIOUS_ISSUE_SOURCE = (
+    "SELECT id * 4 + 2 AS doc_id, 'issue' AS kind, id AS ref_id, project_id, "
+    "category || coalesce(' - ' || subcategory, '') AS title, "
+    "coalesce(description, '') || ' ' || coalesce(resolution_notes, '') || ' ' || coalesce(trade, '') AS body "
+    "FROM issues"
+)
+
+
+def _reindex_issues(source: str) -> None:
+    id_column = "doc_id" if op.get_bind().dialect.name == "postgresql" else "rowid"
+    op.execute("DELETE FROM search_index WHERE kind = 'issue'")
+    op.execute(
+        f"INSERT INTO search_index ({id_column}, kind, ref_id, project_id, title, body) "
+        f"SELECT doc_id, kind, ref_id, project_id, title, body FROM ({source}) AS docs"
+    )
+
+
+def upgrade() -> None:
+    _reindex_issues(ISSUE_SOURCE)
+
+
+def downgrade() -> None:
+    _reindex_issues(PREVIOUS_ISSUE_SOURCE)
@@ -0,0 +1,32 @@
+"""Separate typeahead cache generations for contractors and projects
+
+The single 'typeahead' generation becomes 'typeahead_contractors'; per
+project data (areas, contractor assignments) gets the shared
+'typeahead_projects' generation plus one row per project
+('typeahead_projects:<project id>', created on first change).
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0015"
+down_revision: Union[str, None] = "0014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("UPDATE cache_generations SET name = 'typeahead_contractors' WHERE name = 'typeahead'")
+    op.execute("INSERT INTO cache_generations (name, generation) VALUES ('typeahead_projects', 0)")
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM cache_generations WHERE name = 'typeahead_projects' OR name LIKE 'typeahead_projects:%'")
+    op.execute("UPDATE cache_generations SET name = 'typeahead' WHERE name = 'typeahead_contractors'")
@@ -0,0 +1,44 @@
+"""End the issue list indexes in id for keyset pagination
+
+The cursor condition is (created_at, id) < (:created_at, :id). Without id as
+the last index column PostgreSQL can't seek to it and filters the rows
+instead, like OFFSET did. SQLite indexes end in the rowid already.
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0016"
+down_revision: Union[str, None] = "0015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (old name, new name, leading columns)
+INDEXES = [
+    ("ix_issues_project_created_at", "ix_issues_project_created_at_id", ["project_id", "created_at"]),
+    ("ix_issues_project_status_created_at", "ix_issues_project_status_created_at_id", ["project_id", "status", "created_at"]),
+    ("ix_issues_area_created_at", "ix_issues_area_created_at_id", ["area_id", "created_at"]),
+    ("ix_issues_contractor_created_at", "ix_issues_contractor_created_at_id", ["contractor_id", "created_at"]),
+    ("ix_issues_project_trade_created_at", "ix_issues_project_trade_created_at_id", ["project_id", "trade_id", "created_at"]),
+]
+
+
+def upgrade() -> None:
+    for old_name, new_name, columns in INDEXES:
+        op.create_index(new_name, "issues", columns + ["id"])
+        op.drop_index(old_name, table_name="issues")
+    op.execute("ANALYZE issues")
+
+
+def downgrade() -> None:
+    for old_name, new_name, columns in reversed(INDEXES):
+        op.create_index(old_name, "issues", columns)
+        op.drop_index(new_name, table_name="issues")
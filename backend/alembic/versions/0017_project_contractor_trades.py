@@ -0,0 +1,76 @@
+"""Project assignment/trade association table
+
+Replaces the JSON list of trade names copied onto project assignments (left
+in place, no longer written) with links to trades, so a renamed trade shows
+up on every project instead of leaving the old name behind.
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-10-17
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0017"
+down_revision: Union[str, None] = "0016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _backfill(bind, table):
+    """Link each assignment to the trades named in its JSON list (unknown names are dropped)."""
+    trade_ids = {
+        name.lower(): trade_id
+        for name, trade_id in bind.execute(sa.text("SELECT name, id FROM trades ORDER BY id DESC"))
+    }
+    rows = bind.execute(sa.text("SELECT id, trades FROM project_contractors")).fetchall()
+    links = []
+    for assignment_id, trades in rows:
+        if isinstance(trades, str):
+            try:
+                trades = json.loads(trades)
+            except json.JSONDecodeError:
+                trades = []
+        ids = [trade_ids[name.lower()] for name in trades or [] if isinstance(name, str) and name.lower() in trade_ids]
+        for position, trade_id in enumerate(dict.fromkeys(ids)):
+            links.append({"project_contractor_id": assignment_id, "trade_id": trade_id, "position": position})
+    if links:
+        op.bulk_insert(table, links)
+
+
+def upgrade() -> None:
+    table = op.create_table(
+        "project_contractor_trades",
+        sa.Column(
+            "project_contractor_id", sa.Integer(),
+            sa.ForeignKey("project_contractors.id", ondelete="CASCADE"), primary_key=True
+        ),
+        sa.Column("trade_id", sa.Integer(), sa.ForeignKey("trades.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("position", sa.Integer(), nullable=False),
+    )
+    op.create_index("ix_project_contractor_trades_trade_id", "project_contractor_trades", ["trade_id"])
+    _backfill(op.get_bind(), table)
+
+
+def downgrade() -> None:
+    # Write the current names back, so the JSON column is correct again for older code
+    bind = op.get_bind()
+    names = {}
+    for assignment_id, name in bind.execute(sa.text(
+        "SELECT l.project_contractor_id, t.name FROM project_contractor_trades l "
+        "JOIN trades t ON t.id = l.trade_id ORDER BY l.project_contractor_id, l.position"
+    )):
+        names.setdefault(assignment_id, []).append(name)
+    for assignment_id, trades in names.items():
+        bind.execute(
+            sa.text("UPDATE project_contractors SET trades = :trades WHERE id = :id"),
+            {"trades": json.dumps(trades), "id": assignment_id},
+        )
+    op.drop_index("ix_project_contractor_trades_trade_id", table_name="project_contractor_trades")
+    op.drop_table("project_contractor_trades")
@@ -7,11 +7,47 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite:///./blue_tape.db"
     
+    # Database connection pool
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30  # seconds to wait for a free connection
+    db_pool_recycle: int = 1800  # seconds before a connection is replaced
+    db_pool_pre_ping: bool = True
+    
+    # SQLite tuning (ignored for other databases)
+    sqlite_wal: bool = True
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size: int = 268435456  # 256 MB
+    sqlite_cache_size: int = -65536  # negative = KiB, i.e. 64 MB per connection
+    sqlite_read_pool_size: int = 4
+    
+    # Read replicas - comma-separated URLs used by read-only endpoints
+    database_replica_urls: str = ""
+    # Seconds a user's reads stay on the primary after they write
+    replica_read_your_writes_seconds: float = 5.0
+    
+    # Reference data cache (trades, templates) - per worker, kept coherent via the DB
+    ref_cache_ttl_seconds: int = 300
+    ref_cache_max_entries: int = 256
+    ref_cache_generation_check_seconds: float = 1.0
+    
     # Security
     secret_key: str = "your-super-secret-key-change-in-production"
     access_token_expire_minutes: int = 60
+    refresh_token_expire_days: int = 30
     algorithm: str = "HS256"
     
+    # Password hashing - bcrypt work factor (existing hashes are upgraded on
+    # login when it changes), hashing threads and hashes allowed to wait for one
+    bcrypt_rounds: int = 12
+    password_hash_workers: int = 2
+    password_hash_max_pending: int = 32
+    
+    # Authenticated user cache - per worker, dropped on every worker when a user changes
+    principal_cache_ttl_seconds: int = 60
+    principal_cache_max_entries: int = 1024
+    
     # Email (SendGrid)
     sendgrid_api_key: Optional[str] = None
     sendgrid_from_email: str = "noreply@yourdomain.com"
@@ -29,6 +65,16 @@ class Settings(BaseSettings):
     app_name: str = "Blue Tape"
     app_url: str = "http://localhost:3000"
     debug: bool = False
+    log_level: str = "INFO"
+    
+    # Request instrumentation - warn (with the statement list) above this many SQL statements
+    sql_query_warn_threshold: int = 25
+    
+    # Response compression - bodies smaller than the minimum go out as-is;
+    # brotli is preferred when the client accepts it, gzip otherwise
+    compression_min_size: int = 1024
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4
     
     # CORS - comma-separated list of allowed origins for production
     cors_origins: str = "http://localhost:3000,http://localhost:5173"
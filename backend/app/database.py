@@ -1,25 +1,274 @@
-from sqlalchemy import create_engine
+import itertools
+import time
+from pathlib import Path
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import postgresql, sqlite
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
 from .config import get_settings
+from .services.pool_metrics import instrumented_pool_class
+from .services.query_stats import track_queries
+from .services.read_your_writes import request_last_write, wrote_recently
 
 settings = get_settings()
 
+
+def get_sync_database_url(url: str) -> str:
+    """Normalize the configured URL for the synchronous engine."""
+    # Railway/Heroku hand out postgres:// URLs, which SQLAlchemy 2.0 no longer accepts
+    if url.startswith("postgres://"):
+        return "postgresql://" + url[len("postgres://"):]
+    return url
+
+
+def get_async_database_url(url: str) -> str:
+    """Map the configured URL onto its async driver (aiosqlite / asyncpg)."""
+    url = get_sync_database_url(url)
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    if url.startswith("postgresql://") or url.startswith("postgresql+psycopg2://"):
+        return "postgresql+asyncpg://" + url.split("://", 1)[1]
+    return url
+
+
+def is_sqlite_memory(url: str) -> bool:
+    return url.startswith("sqlite") and (":memory:" in url or url.rstrip("/").endswith(":"))
+
+
+def get_pool_options(url: str) -> dict:
+    """Queue pool settings from config (in-memory SQLite keeps its static pool)."""
+    if is_sqlite_memory(url):
+        return {}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+SQLITE_SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+
+def apply_sqlite_pragmas(dbapi_connection, read_only: bool = False):
+    """Apply the SQLite profile (WAL, sync mode, timeouts, caches) to a new connection."""
+    synchronous = settings.sqlite_synchronous.upper()
+    if synchronous not in SQLITE_SYNCHRONOUS_MODES:
+        raise ValueError(f"Invalid SQLITE_SYNCHRONOUS: {settings.sqlite_synchronous}")
+    
+    cursor = dbapi_connection.cursor()
+    # journal_mode is persistent for the database file, so only writers set it
+    if settings.sqlite_wal and not read_only:
+        cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute(f"PRAGMA synchronous={synchronous}")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+    cursor.execute(f"PRAGMA cache_size={int(settings.sqlite_cache_size)}")
+    if read_only:
+        cursor.execute("PRAGMA query_only=ON")
+    cursor.close()
+
+
+is_sqlite = settings.database_url.startswith("sqlite")
+# A separate read pool only helps when connections share one database file
+use_sqlite_read_pool = is_sqlite and not is_sqlite_memory(settings.database_url)
+
 # Handle SQLite connection args
 connect_args = {}
-if settings.database_url.startswith("sqlite"):
+if is_sqlite:
     connect_args = {"check_same_thread": False}
 
-engine = create_engine(settings.database_url, connect_args=connect_args)
+pool_options = get_pool_options(settings.database_url)
+write_pool_options = pool_options
+if use_sqlite_read_pool:
+    # SQLite allows one writer at a time - serialize writes through a single
+    # connection instead of letting writers collide on "database is locked"
+    write_pool_options = {**pool_options, "pool_size": 1, "max_overflow": 0}
+
+sync_engine_options = {}
+async_engine_options = {}
+if pool_options:
+    sync_engine_options = {"poolclass": QueuePool, **pool_options}
+    async_engine_options = {
+        "poolclass": instrumented_pool_class(AsyncAdaptedQueuePool, "primary"),
+        **write_pool_options,
+    }
+
+# Synchronous engine - used for schema management and maintenance scripts
+engine = create_engine(
+    get_sync_database_url(settings.database_url),
+    connect_args=connect_args,
+    **sync_engine_options
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine - used by the API so queries don't block the event loop
+async_engine = create_async_engine(
+    get_async_database_url(settings.database_url),
+    **async_engine_options
+)
+# Engines whose pools are reported by the admin pool metrics endpoint
+async_engines = {"primary": async_engine}
+
+
+class PrimarySession(Session):
+    """Session class for the primary engine; its commits are tracked for read-your-writes."""
+
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    sync_session_class=PrimarySession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# Read-only engine - a pool of query_only SQLite connections for GET endpoints
+read_engine = None
+ReadSessionLocal = None
+if use_sqlite_read_pool:
+    read_engine = create_async_engine(
+        get_async_database_url(settings.database_url),
+        poolclass=instrumented_pool_class(AsyncAdaptedQueuePool, "read"),
+        **{**pool_options, "pool_size": settings.sqlite_read_pool_size}
+    )
+    async_engines["read"] = read_engine
+    ReadSessionLocal = async_sessionmaker(
+        bind=read_engine,
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+# Read replicas - GET endpoints are spread across these round-robin
+replica_urls = [url.strip() for url in settings.database_replica_urls.split(",") if url.strip()]
+replica_session_factories = []
+for i, url in enumerate(replica_urls, start=1):
+    replica_options = {}
+    if get_pool_options(url):
+        replica_options = {
+            "poolclass": instrumented_pool_class(AsyncAdaptedQueuePool, f"replica{i}"),
+            **get_pool_options(url),
+        }
+    replica_engine = create_async_engine(get_async_database_url(url), **replica_options)
+    async_engines[f"replica{i}"] = replica_engine
+    replica_session_factories.append(async_sessionmaker(
+        bind=replica_engine,
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False,
+    ))
+_replica_cycle = itertools.cycle(replica_session_factories) if replica_session_factories else None
+
+for _async_engine in async_engines.values():
+    track_queries(_async_engine.sync_engine)
+
+if is_sqlite:
+    event.listen(engine, "connect", lambda conn, record: apply_sqlite_pragmas(conn))
+    event.listen(async_engine.sync_engine, "connect", lambda conn, record: apply_sqlite_pragmas(conn))
+if read_engine is not None:
+    event.listen(
+        read_engine.sync_engine, "connect",
+        lambda conn, record: apply_sqlite_pragmas(conn, read_only=True)
+    )
+
 Base = declarative_base()
 
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+
+
+# Dialects with upserts (issue counters) and full-text search (FTS5 / tsvector)
+SUPPORTED_DIALECTS = {"sqlite", "postgresql"}
+# INSERT constructs with ON CONFLICT, per supported dialect
+UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def verify_database_dialect():
+    """Fail fast on a database the issue counters and search index can't run on."""
+    if engine.dialect.name not in SUPPORTED_DIALECTS:
+        raise RuntimeError(
+            f"Unsupported database '{engine.dialect.name}' in DATABASE_URL; "
+            f"use one of: {', '.join(sorted(SUPPORTED_DIALECTS))}."
+        )
+
+
+def verify_schema_revision():
+    """Fail fast when the database isn't migrated to the latest Alembic revision."""
+    from alembic.config import Config
+    from alembic.runtime.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+
+    heads = set(ScriptDirectory.from_config(Config(str(ALEMBIC_INI))).get_heads())
+    with engine.connect() as connection:
+        current = set(MigrationContext.configure(connection).get_current_heads())
+    if current != heads:
+        raise RuntimeError(
+            f"Database schema is at revision {', '.join(sorted(current)) or 'none'}, "
+            f"expected {', '.join(sorted(heads))}. Run `alembic upgrade head` first."
+        )
+
 
 def get_db():
-    """Dependency for getting database session."""
+    """Dependency for getting a synchronous database session."""
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+@event.listens_for(PrimarySession, "after_flush")
+def _mark_write(session, flush_context):
+    session.info["wrote"] = True
+
+
+@event.listens_for(PrimarySession, "do_orm_execute")
+def _mark_statement_write(orm_execute_state):
+    # Core insert/update/delete statements (bulk endpoints) bypass the flush
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["wrote"] = True
+
+
+@event.listens_for(PrimarySession, "after_rollback")
+def _discard_write(session):
+    session.info.pop("wrote", None)
+
+
+@event.listens_for(PrimarySession, "after_commit")
+def _record_write(session):
+    # Picked up by ReadYourWritesMiddleware, which hands the time to the client
+    request_state = session.info.get("request_state")
+    if session.info.pop("wrote", False) and request_state is not None:
+        request_state["last_write"] = time.time()
+
+
+async def get_async_db(request: Request):
+    """Dependency for getting an async database session."""
+    async with AsyncSessionLocal() as db:
+        db.info["request_state"] = request.scope.setdefault("state", {})
+        db.info["last_write"] = request_last_write(request)
+        yield db
+
+
+async def get_read_db(db: AsyncSession = Depends(get_async_db)):
+    """Dependency for read-only endpoints.
+    
+    Routes to a read replica when replicas are configured, unless the user
+    wrote within the read-your-writes window (by the X-Last-Write time the
+    client sends back, so any worker can tell). Otherwise uses the SQLite read
+    pool if there is one, or shares the request's primary session (sessions
+    only check out a connection on first use).
+    """
+    if _replica_cycle is not None and not wrote_recently(db.info["last_write"]):
+        async with next(_replica_cycle)() as replica_db:
+            yield replica_db
+        return
+    if ReadSessionLocal is None:
+        yield db
+        return
+    async with ReadSessionLocal() as read_db:
+        yield read_db
@@ -1,20 +1,24 @@
+import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 import os
 
 from .config import get_settings
-from .database import engine, Base
+from .database import async_engines, verify_database_dialect, verify_schema_revision
+from .services.compression import CompressionMiddleware
+from .services.query_stats import QueryStatsMiddleware
+from .services.read_your_writes import LAST_WRITE_HEADER, ReadYourWritesMiddleware
 
-# Import all models to register them with Base metadata
+# Import all models so every mapper and relationship is registered
 from .models import User, Project, Area, Contractor, ProjectContractor, Issue, IssuePhoto, ManualTemplate, ManualInstance
 
-from .routers import auth, users, projects, areas, contractors, issues, reports, manual, notifications
+from .routers import auth, users, projects, areas, contractors, issues, reports, manual, notifications, admin, search, typeahead, project_templates
 
 settings = get_settings()
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+logging.basicConfig(format="%(levelname)s %(name)s: %(message)s")
+logging.getLogger("blue_tape").setLevel(settings.log_level.upper())
 
 # Create FastAPI app
 app = FastAPI(
@@ -38,12 +42,22 @@ cors_origins.extend([
 # Remove duplicates
 cors_origins = list(set(cors_origins))
 
+# gzip/brotli for JSON and HTML responses (photos and PDFs are sent as-is)
+app.add_middleware(CompressionMiddleware)
+
+# Tells clients when they last wrote, so their reads skip lagging replicas
+app.add_middleware(ReadYourWritesMiddleware)
+
+# Per-request SQL statement count and DB time (Server-Timing header + log line)
+app.add_middleware(QueryStatsMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", LAST_WRITE_HEADER],
 )
 
 # Mount static files for uploads
@@ -54,12 +68,30 @@ app.mount("/uploads", StaticFiles(directory=settings.upload_dir), name="uploads"
 app.include_router(auth.router)
 app.include_router(users.router)
 app.include_router(projects.router)
+app.include_router(project_templates.router)
 app.include_router(areas.router)
 app.include_router(contractors.router)
 app.include_router(issues.router)
 app.include_router(reports.router)
 app.include_router(manual.router)
 app.include_router(notifications.router)
+app.include_router(admin.router)
+app.include_router(search.router)
+app.include_router(typeahead.router)
+
+
+@app.on_event("startup")
+def check_schema():
+    """Refuse to start against an unsupported database or one that needs migrations."""
+    verify_database_dialect()
+    verify_schema_revision()
+
+
+@app.on_event("shutdown")
+async def dispose_engines():
+    """Close pooled async connections on shutdown."""
+    for engine in async_engines.values():
+        await engine.dispose()
 
 
 @app.get("/")
@@ -1,22 +1,29 @@
 # Models package
-from .user import User
-from .project import Project
+from .user import User, RefreshToken
+from .project import Project, ProjectTemplate
 from .area import Area
 from .trade import Trade
-from .contractor import Contractor, ProjectContractor
-from .issue import Issue, IssuePhoto
+from .contractor import Contractor, ContractorTrade, ProjectContractor, ProjectContractorTrade
+from .issue import Issue, IssuePhoto, ProjectIssueCounter
 from .manual import ManualTemplate, ManualInstance
+from .cache_generation import CacheGeneration
 
 __all__ = [
     "User",
+    "RefreshToken",
     "Project", 
+    "ProjectTemplate",
     "Area",
     "Trade",
     "Contractor",
+    "ContractorTrade",
     "ProjectContractor",
+    "ProjectContractorTrade",
     "Issue",
     "IssuePhoto",
+    "ProjectIssueCounter",
     "ManualTemplate",
     "ManualInstance",
+    "CacheGeneration",
 ]
 
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Integer, String
+from ..database import Base
+
+
+class CacheGeneration(Base):
+    """Generation counter per in-process cache; bumped on writes so every
+    worker drops its cached copy (see services/ref_cache.py)."""
+    __tablename__ = "cache_generations"
+    
+    name = Column(String(50), primary_key=True)
+    generation = Column(Integer, nullable=False, default=0)
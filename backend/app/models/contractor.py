@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, JSON
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..database import Base
@@ -13,8 +13,9 @@ class Contractor(Base):
     contact_name = Column(String(255), nullable=True)
     email = Column(String(255), nullable=True)
     phone = Column(String(50), nullable=True)
-    trade_id = Column(Integer, ForeignKey("trades.id", ondelete="SET NULL"), nullable=True)
-    trades = Column(JSON, default=list)  # DEPRECATED: kept for backward compatibility
+    trade_id = Column(Integer, ForeignKey("trades.id", ondelete="SET NULL"), nullable=True)  # Primary trade
+    # DEPRECATED: JSON trade names, superseded by contractor_trades (no longer written)
+    legacy_trades = Column("trades", JSON, default=list)
     notes = Column(Text, nullable=True)  # Access hours, rules, etc.
     is_active = Column(Integer, default=1)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -22,21 +23,109 @@ class Contractor(Base):
     
     # Relationships
     trade = relationship("Trade", back_populates="contractors")
+    # All trades of the contractor, primary first - always loaded with the contractor
+    trade_links = relationship(
+        "ContractorTrade",
+        back_populates="contractor",
+        order_by="ContractorTrade.position",
+        cascade="all, delete-orphan",
+        lazy="selectin",
+    )
     project_assignments = relationship("ProjectContractor", back_populates="contractor")
     issues = relationship("Issue", back_populates="contractor")
+    
+    @property
+    def trade_ids(self) -> list:
+        return [link.trade_id for link in self.trade_links]
+    
+    @property
+    def trades(self) -> list:
+        """Trade names, in the contractor's order."""
+        return [link.trade.name for link in self.trade_links]
+    
+    def set_trades(self, trades: list):
+        """Replace the contractor's trades (Trade rows, primary first)."""
+        self.trade_links = [
+            ContractorTrade(trade_id=trade.id, position=i) for i, trade in enumerate(trades)
+        ]
+        self.trade_id = trades[0].id if trades else None
+
+
+class ContractorTrade(Base):
+    """Many-to-many link between contractors and trades."""
+    __tablename__ = "contractor_trades"
+    __table_args__ = (
+        # Contractors by trade (list_contractors filter, trade counts)
+        Index("ix_contractor_trades_trade_contractor", "trade_id", "contractor_id"),
+    )
+    
+    contractor_id = Column(Integer, ForeignKey("contractors.id", ondelete="CASCADE"), primary_key=True)
+    trade_id = Column(Integer, ForeignKey("trades.id", ondelete="CASCADE"), primary_key=True)
+    position = Column(Integer, nullable=False, default=0)  # 0 = primary trade
+    
+    # Relationships
+    contractor = relationship("Contractor", back_populates="trade_links")
+    trade = relationship("Trade", lazy="joined")
 
 
 class ProjectContractor(Base):
     """Association table linking contractors to projects with project-specific trades."""
     __tablename__ = "project_contractors"
+    __table_args__ = (
+        Index("ix_project_contractors_project_contractor", "project_id", "contractor_id"),
+        Index("ix_project_contractors_contractor_id", "contractor_id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     contractor_id = Column(Integer, ForeignKey("contractors.id", ondelete="CASCADE"), nullable=False)
-    trades = Column(JSON, default=list)  # Trades assigned for THIS project
+    # DEPRECATED: JSON trade names, superseded by project_contractor_trades (no longer written)
+    legacy_trades = Column("trades", JSON, default=list)
     notes = Column(Text, nullable=True)  # Project-specific notes
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
     project = relationship("Project", back_populates="contractors")
     contractor = relationship("Contractor", back_populates="project_assignments")
+    # Trades assigned for THIS project, in order - always loaded with the assignment
+    trade_links = relationship(
+        "ProjectContractorTrade",
+        back_populates="assignment",
+        order_by="ProjectContractorTrade.position",
+        cascade="all, delete-orphan",
+        lazy="selectin",
+    )
+    
+    @property
+    def trade_ids(self) -> list:
+        return [link.trade_id for link in self.trade_links]
+    
+    @property
+    def trades(self) -> list:
+        """Current trade names, in the assignment's order."""
+        return [link.trade.name for link in self.trade_links]
+    
+    def set_trades(self, trades: list):
+        """Replace the assignment's trades (Trade rows)."""
+        self.trade_links = [
+            ProjectContractorTrade(trade_id=trade.id, position=i) for i, trade in enumerate(trades)
+        ]
+
+
+class ProjectContractorTrade(Base):
+    """Trades a contractor covers on one project (links to trades, so renames show up)."""
+    __tablename__ = "project_contractor_trades"
+    __table_args__ = (
+        # Assignments by trade (and the trade foreign key's cascades)
+        Index("ix_project_contractor_trades_trade_id", "trade_id"),
+    )
+    
+    project_contractor_id = Column(
+        Integer, ForeignKey("project_contractors.id", ondelete="CASCADE"), primary_key=True
+    )
+    trade_id = Column(Integer, ForeignKey("trades.id", ondelete="CASCADE"), primary_key=True)
+    position = Column(Integer, nullable=False, default=0)
+    
+    # Relationships
+    assignment = relationship("ProjectContractor", back_populates="trade_links")
+    trade = relationship("Trade", lazy="joined")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Date, Enum as SqlEnum, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Date, Enum as SqlEnum, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..database import Base
@@ -41,6 +41,20 @@ DEFAULT_CATEGORIES = [
 
 class Issue(Base):
     __tablename__ = "issues"
+    __table_args__ = (
+        # List indexes end in (created_at, id), the keyset pagination order
+        # Default issue list: project filter, newest first
+        Index("ix_issues_project_created_at_id", "project_id", "created_at", "id"),
+        # Status filter (sorted) and per-status dashboard counts
+        Index("ix_issues_project_status_created_at_id", "project_id", "status", "created_at", "id"),
+        # Priority filter and "high priority, not closed" counts
+        Index("ix_issues_project_priority_status", "project_id", "priority", "status"),
+        # Area / contractor filters (ids are project-specific enough on their own)
+        Index("ix_issues_area_created_at_id", "area_id", "created_at", "id"),
+        Index("ix_issues_contractor_created_at_id", "contractor_id", "created_at", "id"),
+        # Trade filter and per-trade punch lists
+        Index("ix_issues_project_trade_created_at_id", "project_id", "trade_id", "created_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
@@ -55,7 +69,8 @@ class Issue(Base):
     resolution_notes = Column(Text, nullable=True)
     
     # Assignment
-    trade = Column(String(100), nullable=True)
+    trade = Column(String(100), nullable=True)  # Name as entered; current name comes from trade_id
+    trade_id = Column(Integer, ForeignKey("trades.id", ondelete="SET NULL"), nullable=True)
     contractor_id = Column(Integer, ForeignKey("contractors.id", ondelete="SET NULL"), nullable=True)
     
     # Dates
@@ -74,6 +89,7 @@ class Issue(Base):
     # Relationships
     project = relationship("Project", back_populates="issues")
     area = relationship("Area", back_populates="issues")
+    trade_category = relationship("Trade")
     contractor = relationship("Contractor", back_populates="issues")
     creator = relationship("User", back_populates="created_issues", foreign_keys=[created_by])
     closer = relationship("User", back_populates="closed_issues", foreign_keys=[closed_by])
@@ -82,6 +98,9 @@ class Issue(Base):
 
 class IssuePhoto(Base):
     __tablename__ = "issue_photos"
+    __table_args__ = (
+        Index("ix_issue_photos_issue_id", "issue_id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     issue_id = Column(Integer, ForeignKey("issues.id", ondelete="CASCADE"), nullable=False)
@@ -92,3 +111,17 @@ class IssuePhoto(Base):
     
     # Relationships
     issue = relationship("Issue", back_populates="photos")
+
+
+class ProjectIssueCounter(Base):
+    """Issue count per project, status and priority - kept in step with `issues`
+    by the issue write paths (see services/issue_counters.py)."""
+    __tablename__ = "project_issue_counters"
+    
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    status = Column(SqlEnum(IssueStatus), primary_key=True)
+    priority = Column(SqlEnum(IssuePriority), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+    
+    # Relationships
+    project = relationship("Project", back_populates="issue_counters")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Date, Enum as SqlEnum, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Date, Enum as SqlEnum, DateTime, ForeignKey, Index, JSON
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..database import Base
@@ -13,6 +13,10 @@ class ProjectStatus(str, enum.Enum):
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        # Newest-first project list and its keyset cursor
+        Index("ix_projects_created_at_id", "created_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
@@ -22,6 +26,8 @@ class Project(Base):
     close_date = Column(Date, nullable=True)
     notes = Column(Text, nullable=True)
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    # Bumped by every change to the project's issues, areas, manual or dashboard (ETags)
+    revision = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
@@ -29,5 +35,22 @@ class Project(Base):
     owner = relationship("User", back_populates="projects")
     areas = relationship("Area", back_populates="project", cascade="all, delete-orphan")
     issues = relationship("Issue", back_populates="project", cascade="all, delete-orphan")
+    issue_counters = relationship("ProjectIssueCounter", back_populates="project", cascade="all, delete-orphan")
     contractors = relationship("ProjectContractor", back_populates="project", cascade="all, delete-orphan")
     manual_instance = relationship("ManualInstance", back_populates="project", uselist=False, cascade="all, delete-orphan")
+
+
+class ProjectTemplate(Base):
+    """Reusable setup applied to new projects (areas, contractors, manual prefill)."""
+    __tablename__ = "project_templates"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(255), nullable=False, unique=True)
+    description = Column(Text, nullable=True)
+    areas = Column(JSON, default=list)  # Area names, in order
+    contractor_ids = Column(JSON, nullable=True)  # None = all active contractors
+    manual_template_id = Column(Integer, ForeignKey("manual_templates.id", ondelete="SET NULL"), nullable=True)
+    manual_fields = Column(JSON, nullable=True)  # Prefilled manual field values
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Enum as SqlEnum, DateTime
+from sqlalchemy import Column, Integer, String, Enum as SqlEnum, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..database import Base
@@ -28,3 +28,23 @@ class User(Base):
     created_issues = relationship("Issue", back_populates="creator", foreign_keys="Issue.created_by")
     closed_issues = relationship("Issue", back_populates="closer", foreign_keys="Issue.closed_by")
     projects = relationship("Project", back_populates="owner")
+    refresh_tokens = relationship("RefreshToken", back_populates="user", cascade="all, delete-orphan")
+
+
+class RefreshToken(Base):
+    """Opaque refresh token, stored as a SHA-256 hash.
+    
+    Each use replaces the token with a new one in the same family; using a
+    replaced token again revokes the whole family.
+    """
+    __tablename__ = "refresh_tokens"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    token_hash = Column(String(64), nullable=False, unique=True)
+    family_id = Column(String(32), nullable=False, index=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    user = relationship("User", back_populates="refresh_tokens")
@@ -0,0 +1,82 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..database import async_engines, get_async_db
+from ..models.user import User
+from ..services.pool_metrics import get_pool_metrics
+from ..services.issue_counters import rebuild_issue_counters
+from ..services.search_index import rebuild_search_index
+from ..services.ref_cache import reference_cache
+from ..services.typeahead import project_typeahead_cache, contractor_typeahead_cache
+from ..utils.auth import principal_cache, require_admin
+
+router = APIRouter(prefix="/api/admin", tags=["Admin"])
+
+
+@router.get("/db-pool")
+async def get_db_pool_stats(current_user: User = Depends(require_admin)):
+    """Connection pool usage per engine: checked-out, overflow and wait-time statistics."""
+    metrics = get_pool_metrics()
+    result = {}
+    for name, engine in async_engines.items():
+        pool = engine.pool
+        if name in metrics:
+            result[name] = metrics[name].snapshot(pool)
+        else:
+            result[name] = {"name": name, "pool_class": type(pool).__name__, "status": pool.status()}
+    return result
+
+
+@router.post("/db-pool/reset", status_code=status.HTTP_204_NO_CONTENT)
+async def reset_db_pool_stats(current_user: User = Depends(require_admin)):
+    """Reset accumulated pool counters (live gauges are unaffected)."""
+    for metrics in get_pool_metrics().values():
+        metrics.reset()
+
+
+@router.post("/issue-counters/rebuild")
+async def rebuild_counters(
+    project_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_admin)
+):
+    """Recompute dashboard issue counters from the issues table (fixes drift)."""
+    rows = await rebuild_issue_counters(db, project_id)
+    await db.commit()
+    return {"project_id": project_id, "counter_rows": rows}
+
+
+@router.post("/search-index/rebuild")
+async def rebuild_search(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_admin)
+):
+    """Re-create the full-text search index from projects, issues and contractors."""
+    documents = await rebuild_search_index(db)
+    await db.commit()
+    return {"documents": documents}
+
+
+@router.get("/reference-cache")
+async def get_reference_cache_stats(current_user: User = Depends(require_admin)):
+    """Hit/miss/eviction counters of this worker's reference data cache."""
+    return reference_cache.stats()
+
+
+@router.get("/principal-cache")
+async def get_principal_cache_stats(current_user: User = Depends(require_admin)):
+    """Hit/miss/eviction counters of this worker's authenticated user cache."""
+    return principal_cache.stats()
+
+
+@router.post("/reference-cache/invalidate", status_code=status.HTTP_204_NO_CONTENT)
+async def invalidate_reference_cache(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_admin)
+):
+    """Drop cached reference data, typeahead indexes and users on every worker (e.g. after editing tables directly)."""
+    await reference_cache.invalidate(db)
+    await contractor_typeahead_cache.invalidate(db)
+    await project_typeahead_cache.invalidate_all(db)
+    await principal_cache.invalidate(db)
+    await db.commit()
@@ -1,73 +1,115 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import case, delete, insert, select, func, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from ..database import get_db
+from ..database import get_async_db, get_read_db
 from ..models.user import User
 from ..models.area import Area
+from ..models.issue import Issue
 from ..models.project import Project
-from ..schemas.area import AreaCreate, AreaUpdate, AreaResponse
+from ..schemas.area import AreaBulkOperation, AreaCreate, AreaUpdate, AreaResponse
 from ..utils.auth import get_current_user, require_pm_or_admin
+from ..services import project_revisions
+from ..services.typeahead import project_typeahead_cache
 
 router = APIRouter(prefix="/api/projects/{project_id}/areas", tags=["Areas"])
 
 
-def get_project_or_404(project_id: int, db: Session) -> Project:
+async def get_project_or_404(project_id: int, db: AsyncSession) -> Project:
     """Helper to get project or raise 404."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     return project
 
 
+async def get_area_or_404(project_id: int, area_id: int, db: AsyncSession) -> Area:
+    """Helper to get an area of the project or raise 404."""
+    area = await db.scalar(
+        select(Area).where(Area.id == area_id, Area.project_id == project_id)
+    )
+    if not area:
+        raise HTTPException(status_code=404, detail="Area not found")
+    return area
+
+
+async def next_area_order(project_id: int, db: AsyncSession) -> int:
+    """Order value that places a new area after the project's existing ones."""
+    return await db.scalar(
+        select(func.coalesce(func.max(Area.order), -1) + 1).where(Area.project_id == project_id)
+    )
+
+
+async def apply_area_order(project_id: int, area_ids: List[int], db: AsyncSession):
+    """Set each area's order to its position in area_ids with one UPDATE.
+    
+    Ids that don't belong to the project are ignored.
+    """
+    if not area_ids:
+        return
+    positions = {area_id: i for i, area_id in enumerate(area_ids)}
+    await db.execute(
+        update(Area)
+        .where(Area.project_id == project_id, Area.id.in_(positions))
+        .values(order=case(positions, value=Area.id))
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def list_project_areas(project_id: int, db: AsyncSession) -> List[Area]:
+    result = await db.execute(
+        select(Area).where(Area.project_id == project_id).order_by(Area.order)
+    )
+    return result.scalars().all()
+
+
 @router.get("/", response_model=List[AreaResponse])
 async def list_areas(
     project_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """List all areas for a project."""
-    get_project_or_404(project_id, db)
-    areas = db.query(Area).filter(Area.project_id == project_id).order_by(Area.order).all()
-    return areas
+    await get_project_or_404(project_id, db)
+    return await list_project_areas(project_id, db)
 
 
 @router.get("/{area_id}", response_model=AreaResponse)
 async def get_area(
     project_id: int,
     area_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get a specific area."""
-    get_project_or_404(project_id, db)
-    area = db.query(Area).filter(Area.id == area_id, Area.project_id == project_id).first()
-    if not area:
-        raise HTTPException(status_code=404, detail="Area not found")
-    return area
+    await get_project_or_404(project_id, db)
+    return await get_area_or_404(project_id, area_id, db)
 
 
 @router.post("/", response_model=AreaResponse, status_code=status.HTTP_201_CREATED)
 async def create_area(
     project_id: int,
     area_data: AreaCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin)
 ):
     """Create a new custom area."""
-    get_project_or_404(project_id, db)
+    await get_project_or_404(project_id, db)
     
-    # Get max order
-    max_order = db.query(Area).filter(Area.project_id == project_id).count()
+    order = area_data.order
+    if not order:
+        order = await next_area_order(project_id, db)
     
     area = Area(
         project_id=project_id,
         name=area_data.name,
-        order=area_data.order if area_data.order else max_order,
+        order=order,
         is_custom=1
     )
     db.add(area)
-    db.commit()
-    db.refresh(area)
+    await project_typeahead_cache.invalidate(db, [project_id])
+    await db.commit()
+    await db.refresh(area)
     return area
 
 
@@ -76,21 +118,22 @@ async def update_area(
     project_id: int,
     area_id: int,
     area_data: AreaUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin)
 ):
     """Update an area."""
-    get_project_or_404(project_id, db)
-    area = db.query(Area).filter(Area.id == area_id, Area.project_id == project_id).first()
-    if not area:
-        raise HTTPException(status_code=404, detail="Area not found")
+    await get_project_or_404(project_id, db)
+    area = await get_area_or_404(project_id, area_id, db)
     
     update_data = area_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(area, field, value)
     
-    db.commit()
-    db.refresh(area)
+    # Issue lists show area names
+    await project_revisions.bump_project_revisions(db, project_id)
+    await project_typeahead_cache.invalidate(db, [project_id])
+    await db.commit()
+    await db.refresh(area)
     return area
 
 
@@ -98,35 +141,95 @@ async def update_area(
 async def delete_area(
     project_id: int,
     area_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin)
 ):
     """Delete an area."""
-    get_project_or_404(project_id, db)
-    area = db.query(Area).filter(Area.id == area_id, Area.project_id == project_id).first()
-    if not area:
-        raise HTTPException(status_code=404, detail="Area not found")
+    await get_project_or_404(project_id, db)
+    area = await get_area_or_404(project_id, area_id, db)
     
-    db.delete(area)
-    db.commit()
+    await db.delete(area)
+    await project_revisions.bump_project_revisions(db, project_id)
+    await project_typeahead_cache.invalidate(db, [project_id])
+    await db.commit()
 
 
 @router.post("/reorder", response_model=List[AreaResponse])
 async def reorder_areas(
     project_id: int,
     area_ids: List[int],
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin)
 ):
     """Reorder areas by providing list of area IDs in desired order."""
-    get_project_or_404(project_id, db)
+    await get_project_or_404(project_id, db)
+    await apply_area_order(project_id, area_ids, db)
+    await project_typeahead_cache.invalidate(db, [project_id])
+    await db.commit()
+    return await list_project_areas(project_id, db)
+
+
+@router.post("/bulk", response_model=List[AreaResponse])
+async def bulk_update_areas(
+    project_id: int,
+    operation: AreaBulkOperation,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_pm_or_admin)
+):
+    """Create, rename, delete and reorder areas in one request.
+    
+    All changes are applied together or not at all; any id that isn't an
+    area of this project rejects the whole request. Returns the project's
+    areas in their new order.
+    """
+    await get_project_or_404(project_id, db)
+    
+    referenced = set(operation.delete) | {item.id for item in operation.rename} | set(operation.order or [])
+    if referenced:
+        found = set((await db.scalars(
+            select(Area.id).where(Area.project_id == project_id, Area.id.in_(referenced))
+        )).all())
+        if found != referenced:
+            raise HTTPException(status_code=400, detail="Invalid area for this project")
+    deleted = set(operation.delete)
+    if deleted & ({item.id for item in operation.rename} | set(operation.order or [])):
+        raise HTTPException(status_code=400, detail="Deleted areas can't be renamed or reordered")
+    
+    if deleted:
+        # Issues keep existing without an area, as with single deletes
+        await db.execute(
+            update(Issue)
+            .where(Issue.area_id.in_(deleted))
+            .values(area_id=None)
+            .execution_options(synchronize_session=False)
+        )
+        await db.execute(
+            delete(Area)
+            .where(Area.project_id == project_id, Area.id.in_(deleted))
+            .execution_options(synchronize_session=False)
+        )
+    
+    if operation.rename:
+        names = {item.id: item.name for item in operation.rename}
+        await db.execute(
+            update(Area)
+            .where(Area.project_id == project_id, Area.id.in_(names))
+            .values(name=case(names, value=Area.id))
+            .execution_options(synchronize_session=False)
+        )
     
-    for i, area_id in enumerate(area_ids):
-        area = db.query(Area).filter(Area.id == area_id, Area.project_id == project_id).first()
-        if area:
-            area.order = i
+    if operation.order is not None:
+        await apply_area_order(project_id, operation.order, db)
     
-    db.commit()
+    if operation.create:
+        start = await next_area_order(project_id, db)
+        await db.execute(insert(Area), [
+            {"project_id": project_id, "name": item.name, "order": start + i, "is_custom": 1}
+            for i, item in enumerate(operation.create)
+        ])
     
-    areas = db.query(Area).filter(Area.project_id == project_id).order_by(Area.order).all()
-    return areas
+    if deleted or operation.rename:
+        await project_revisions.bump_project_revisions(db, project_id)
+    await project_typeahead_cache.invalidate(db, [project_id])
+    await db.commit()
+    return await list_project_areas(project_id, db)
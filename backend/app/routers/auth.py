@@ -1,24 +1,46 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
-from datetime import timedelta
-from ..database import get_db
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timedelta
+from typing import Optional
+from ..database import get_async_db
 from ..config import get_settings
-from ..models.user import User
-from ..schemas.user import UserCreate, UserResponse, UserLogin, Token, ProfileUpdate, PasswordChange
+from ..services.project_revisions import bump_project_revisions
+from ..models.issue import Issue
+from ..models.user import User, RefreshToken
+from ..schemas.user import (
+    UserCreate, UserResponse, UserLogin, Token, ProfileUpdate, PasswordChange, RefreshRequest
+)
 from ..utils.auth import (
-    verify_password, get_password_hash, create_access_token, get_current_user
+    verify_password, verify_and_update_password, get_password_hash, create_access_token,
+    create_refresh_token, hash_refresh_token, revoke_refresh_tokens, get_current_user, principal_cache
 )
 
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 settings = get_settings()
 
 
+def issue_tokens(db: AsyncSession, user: User, family_id: Optional[str] = None) -> Token:
+    """Access token plus a new refresh token (added to the session; the caller commits)."""
+    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
+    access_token = create_access_token(
+        data={"sub": str(user.id), "email": user.email, "role": user.role.value},
+        expires_delta=access_token_expires
+    )
+    return Token(
+        access_token=access_token,
+        token_type="bearer",
+        refresh_token=create_refresh_token(db, user.id, family_id),
+        user=UserResponse.model_validate(user)
+    )
+
+
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """Register a new user."""
     # Check if email already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = await db.scalar(select(User).where(User.email == user_data.email))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -26,7 +48,7 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
         )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash(user_data.password)
     db_user = User(
         email=user_data.email,
         name=user_data.name,
@@ -35,16 +57,19 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
         role=user_data.role
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     return db_user
 
 
 @router.post("/login", response_model=Token)
-async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    """Login and get access token."""
-    user = db.query(User).filter(User.email == form_data.username).first()
-    if not user or not verify_password(form_data.password, user.password_hash):
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_async_db)):
+    """Login and get an access token and a refresh token."""
+    user = await db.scalar(select(User).where(User.email == form_data.username))
+    verified, new_hash = False, None
+    if user:
+        verified, new_hash = await verify_and_update_password(form_data.password, user.password_hash)
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -57,17 +82,80 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session =
             detail="User account is inactive"
         )
     
-    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
-    access_token = create_access_token(
-        data={"sub": str(user.id), "email": user.email, "role": user.role.value},
-        expires_delta=access_token_expires
+    if new_hash:
+        # Stored hash predates the current BCRYPT_ROUNDS (the old one still
+        # verifies the same password, so cached users can stay)
+        user.password_hash = new_hash
+    
+    # Drop this user's expired refresh tokens while we're here
+    await db.execute(
+        delete(RefreshToken).where(
+            RefreshToken.user_id == user.id, RefreshToken.expires_at < datetime.utcnow()
+        )
     )
+    tokens = issue_tokens(db, user)
+    await db.commit()
+    return tokens
+
+
+@router.post("/refresh", response_model=Token)
+async def refresh(refresh_data: RefreshRequest, db: AsyncSession = Depends(get_async_db)):
+    """Swap a refresh token for a new access token and refresh token.
     
-    return Token(
-        access_token=access_token,
-        token_type="bearer",
-        user=UserResponse.model_validate(user)
+    No password check - one indexed lookup. Each refresh token works once;
+    presenting a used one again revokes every token descended from the same
+    login.
+    """
+    invalid_token = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid refresh token",
+        headers={"WWW-Authenticate": "Bearer"},
     )
+    token = await db.scalar(
+        select(RefreshToken).where(RefreshToken.token_hash == hash_refresh_token(refresh_data.refresh_token))
+    )
+    if token is None:
+        raise invalid_token
+    
+    # Mark the token used - conditional, so concurrent refreshes can't both succeed
+    now = datetime.utcnow()
+    rotated = await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.id == token.id, RefreshToken.revoked_at.is_(None), RefreshToken.expires_at > now)
+        .values(revoked_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    if rotated.rowcount != 1:
+        revoked_at = await db.scalar(select(RefreshToken.revoked_at).where(RefreshToken.id == token.id))
+        if revoked_at is not None:
+            # Reuse of a replaced token - it may have been stolen
+            await revoke_refresh_tokens(db, family_id=token.family_id)
+            await db.commit()
+        raise invalid_token
+    
+    user = await db.get(User, token.user_id)
+    if user is None:
+        raise invalid_token
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User account is inactive"
+        )
+    
+    tokens = issue_tokens(db, user, token.family_id)
+    await db.commit()
+    return tokens
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(refresh_data: RefreshRequest, db: AsyncSession = Depends(get_async_db)):
+    """Revoke a refresh token and the tokens rotated from the same login."""
+    family_id = await db.scalar(
+        select(RefreshToken.family_id).where(RefreshToken.token_hash == hash_refresh_token(refresh_data.refresh_token))
+    )
+    if family_id is not None:
+        await revoke_refresh_tokens(db, family_id=family_id)
+        await db.commit()
 
 
 @router.get("/me", response_model=UserResponse)
@@ -80,35 +168,44 @@ async def get_me(current_user: User = Depends(get_current_user)):
 async def update_profile(
     profile_data: ProfileUpdate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update current user's profile."""
+    # current_user may come from the read pool - modify the primary session's copy
+    user = await db.get(User, current_user.id)
     if profile_data.name is not None:
-        current_user.name = profile_data.name
+        user.name = profile_data.name
+        # Issue lists show creator names
+        await bump_project_revisions(db, select(Issue.project_id).where(Issue.created_by == user.id))
     if profile_data.phone is not None:
-        current_user.phone = profile_data.phone
+        user.phone = profile_data.phone
     
-    db.commit()
-    db.refresh(current_user)
-    return current_user
+    await principal_cache.invalidate(db)
+    await db.commit()
+    await db.refresh(user)
+    return user
 
 
 @router.put("/me/password")
 async def change_password(
     password_data: PasswordChange,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Change current user's password."""
     # Verify current password
-    if not verify_password(password_data.current_password, current_user.password_hash):
+    if not await verify_password(password_data.current_password, current_user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect"
         )
     
     # Update to new password
-    current_user.password_hash = get_password_hash(password_data.new_password)
-    db.commit()
+    user = await db.get(User, current_user.id)
+    user.password_hash = await get_password_hash(password_data.new_password)
+    # Sessions holding a refresh token have to log in with the new password
+    await revoke_refresh_tokens(db, user_id=user.id)
+    await principal_cache.invalidate(db)
+    await db.commit()
     
     return {"message": "Password changed successfully"}
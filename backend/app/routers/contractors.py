@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func as sql_func
-from typing import List, Optional
-from ..database import get_db
+from sqlalchemy import select, func as sql_func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from typing import Dict, List, Optional
+from ..database import get_async_db, get_read_db
 from ..models.user import User
 from ..models.trade import Trade, DEFAULT_TRADES
-from ..models.contractor import Contractor, ProjectContractor
+from ..models.contractor import Contractor, ContractorTrade, ProjectContractor
+from ..models.issue import Issue
 from ..models.project import Project
 from ..schemas.contractor import (
     TradeCreate, TradeUpdate, TradeResponse, TradeWithContractors,
@@ -13,34 +15,51 @@ from ..schemas.contractor import (
     ProjectContractorCreate, ProjectContractorResponse
 )
 from ..utils.auth import get_current_user, require_pm_or_admin
+from ..services.ref_cache import reference_cache
+from ..services import project_revisions, search_index
+from ..services.typeahead import contractor_typeahead_cache, project_typeahead_cache
 
 router = APIRouter(prefix="/api", tags=["Contractors"])
 
 
-def build_contractor_response(contractor: Contractor, db: Session) -> dict:
-    """Build a contractor response dict with trade_ids derived from trades names."""
-    # Get all trades for lookup
-    all_trades = {t.name: t for t in db.query(Trade).all()}
-    
-    # If contractor has trades (list of names), compute trade_ids
-    trade_names = contractor.trades or []
-    trade_ids = [all_trades[name].id for name in trade_names if name in all_trades]
-    
-    return {
-        "id": contractor.id,
-        "company": contractor.company,
-        "contact_name": contractor.contact_name,
-        "email": contractor.email,
-        "phone": contractor.phone,
-        "trade_id": contractor.trade_id,
-        "trade_ids": trade_ids,
-        "trades": trade_names,
-        "notes": contractor.notes,
-        "is_active": contractor.is_active,
-        "created_at": contractor.created_at,
-        "updated_at": contractor.updated_at,
-        "trade": contractor.trade,
-    }
+async def count_active_contractors(db: AsyncSession, *trade_ids: int) -> Dict[int, int]:
+    """Active contractor count per trade, as one grouped query over contractor_trades."""
+    query = (
+        select(ContractorTrade.trade_id, sql_func.count(ContractorTrade.contractor_id))
+        .join(Contractor, Contractor.id == ContractorTrade.contractor_id)
+        .where(Contractor.is_active == 1)
+        .group_by(ContractorTrade.trade_id)
+    )
+    if trade_ids:
+        query = query.where(ContractorTrade.trade_id.in_(trade_ids))
+    result = await db.execute(query)
+    return dict(result.all())
+
+
+async def resolve_trades(
+    db: AsyncSession,
+    trade_ids: Optional[List[int]] = None,
+    names: Optional[List[str]] = None
+) -> List[Trade]:
+    """Trades for a contractor or project assignment, by id or (legacy clients) by name, in the given order."""
+    if trade_ids is not None:
+        result = await db.execute(select(Trade).where(Trade.id.in_(trade_ids)))
+        by_key = {trade.id: trade for trade in result.scalars()}
+        keys = trade_ids
+    else:
+        result = await db.execute(select(Trade).where(Trade.name.in_(names or [])))
+        by_key = {trade.name: trade for trade in result.scalars()}
+        keys = names or []
+    # Drop unknown and duplicate entries, keeping the first occurrence
+    return [by_key[key] for key in dict.fromkeys(keys) if key in by_key]
+
+
+async def load_contractor(contractor_id: int, db: AsyncSession) -> Optional[Contractor]:
+    """Load a contractor with its primary trade (trade links load with it)."""
+    return await db.scalar(
+        select(Contractor).options(joinedload(Contractor.trade)).where(Contractor.id == contractor_id)
+        .execution_options(populate_existing=True)
+    )
 
 
 # ==================== Trades ====================
@@ -48,57 +67,59 @@ def build_contractor_response(contractor: Contractor, db: Session) -> dict:
 @router.get("/trades", response_model=List[TradeResponse])
 async def list_trades(
     include_inactive: bool = False,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """List all trades/categories."""
-    query = db.query(Trade)
-    
-    if not include_inactive:
-        query = query.filter(Trade.is_active == 1)
-    
-    trades = query.order_by(Trade.order, Trade.name).all()
-    
-    # Build result - count contractors that have this trade in their trades array
-    result = []
-    for trade in trades:
-        # Count contractors with this trade (via trade_id or via trades JSON array)
-        contractor_count = 0
-        try:
-            # Count by trade_id relationship
-            contractor_count = len([c for c in trade.contractors if c.is_active == 1]) if trade.contractors else 0
-        except Exception:
-            contractor_count = 0
+    async def load(db: AsyncSession) -> List[dict]:
+        query = select(Trade)
+        if not include_inactive:
+            query = query.where(Trade.is_active == 1)
         
-        trade_dict = {
-            "id": trade.id,
-            "name": trade.name,
-            "description": trade.description,
-            "icon": trade.icon,
-            "order": trade.order,
-            "is_active": trade.is_active,
-            "created_at": trade.created_at,
-            "updated_at": trade.updated_at,
-            "contractor_count": contractor_count
-        }
-        result.append(trade_dict)
-    
-    return result
+        result = await db.execute(query.order_by(Trade.order, Trade.name))
+        trades = result.scalars().all()
+        
+        # Active contractors per trade (via trade_id), counted in one grouped query
+        contractor_counts = await count_active_contractors(db)
+        
+        return [
+            {
+                "id": trade.id,
+                "name": trade.name,
+                "description": trade.description,
+                "icon": trade.icon,
+                "order": trade.order,
+                "is_active": trade.is_active,
+                "created_at": trade.created_at,
+                "updated_at": trade.updated_at,
+                "contractor_count": contractor_counts.get(trade.id, 0)
+            }
+            for trade in trades
+        ]
+    
+    return await reference_cache.get_or_load(db, f"trades:{include_inactive}", load)
 
 
 @router.get("/trades/{trade_id}", response_model=TradeWithContractors)
 async def get_trade(
     trade_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get a trade with its contractors."""
-    trade = db.query(Trade).filter(Trade.id == trade_id).first()
+    trade = await db.get(Trade, trade_id)
     if not trade:
         raise HTTPException(status_code=404, detail="Trade not found")
     
-    # Build response with contractors
-    contractors = [c for c in trade.contractors if c.is_active == 1]
+    # Active contractors linked to the trade (primary or secondary)
+    result = await db.execute(
+        select(Contractor).join(
+            ContractorTrade, ContractorTrade.contractor_id == Contractor.id
+        ).where(
+            ContractorTrade.trade_id == trade_id, Contractor.is_active == 1
+        ).options(joinedload(Contractor.trade)).order_by(Contractor.company)
+    )
+    contractors = result.scalars().all()
     
     return {
         "id": trade.id,
@@ -117,19 +138,20 @@ async def get_trade(
 @router.post("/trades", response_model=TradeResponse, status_code=status.HTTP_201_CREATED)
 async def create_trade(
     trade_data: TradeCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin)
 ):
     """Create a new trade/category."""
     # Check for duplicate name
-    existing = db.query(Trade).filter(Trade.name.ilike(trade_data.name)).first()
+    existing = await db.scalar(select(Trade).where(Trade.name.ilike(trade_data.name)))
     if existing:
         raise HTTPException(status_code=400, detail="Trade with this name already exists")
     
     trade = Trade(**trade_data.model_dump())
     db.add(trade)
-    db.commit()
-    db.refresh(trade)
+    await reference_cache.invalidate(db)
+    await db.commit()
+    await db.refresh(trade)
     
     return {
         **trade_data.model_dump(),
@@ -145,11 +167,11 @@ async def create_trade(
 async def update_trade(
     trade_id: int,
     trade_data: TradeUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin)
 ):
     """Update a trade/category."""
-    trade = db.query(Trade).filter(Trade.id == trade_id).first()
+    trade = await db.get(Trade, trade_id)
     if not trade:
         raise HTTPException(status_code=404, detail="Trade not found")
     
@@ -157,8 +179,16 @@ async def update_trade(
     for field, value in update_data.items():
         setattr(trade, field, value)
     
-    db.commit()
-    db.refresh(trade)
+    if "name" in update_data:
+        # Issue lists show the current trade name
+        await project_revisions.bump_project_revisions(
+            db, select(Issue.project_id).where(Issue.trade_id == trade.id)
+        )
+        await search_index.index_trade_issues(db, trade.id)
+    await reference_cache.invalidate(db)
+    await db.commit()
+    await db.refresh(trade)
+    contractor_counts = await count_active_contractors(db, trade.id)
     
     return {
         "id": trade.id,
@@ -169,23 +199,24 @@ async def update_trade(
         "is_active": trade.is_active,
         "created_at": trade.created_at,
         "updated_at": trade.updated_at,
-        "contractor_count": len([c for c in trade.contractors if c.is_active == 1])
+        "contractor_count": contractor_counts.get(trade.id, 0)
     }
 
 
 @router.delete("/trades/{trade_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_trade(
     trade_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin)
 ):
     """Soft delete a trade (deactivate)."""
-    trade = db.query(Trade).filter(Trade.id == trade_id).first()
+    trade = await db.get(Trade, trade_id)
     if not trade:
         raise HTTPException(status_code=404, detail="Trade not found")
     
     trade.is_active = 0
-    db.commit()
+    await reference_cache.invalidate(db)
+    await db.commit()
 
 
 # ==================== Master Contractors ====================
@@ -196,190 +227,226 @@ async def list_contractors(
     limit: int = 100,
     search: Optional[str] = None,
     trade_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """List all contractors (master list)."""
-    query = db.query(Contractor).options(joinedload(Contractor.trade)).filter(Contractor.is_active == 1)
+    query = select(Contractor).options(joinedload(Contractor.trade)).where(Contractor.is_active == 1)
     
     if search:
         search_term = f"%{search}%"
-        query = query.filter(
+        query = query.where(
             (Contractor.company.ilike(search_term)) | 
             (Contractor.contact_name.ilike(search_term))
         )
     
     if trade_id:
-        # Filter by trade_id or by checking if trade name is in trades JSON
-        trade = db.query(Trade).filter(Trade.id == trade_id).first()
-        if trade:
-            query = query.filter(
-                (Contractor.trade_id == trade_id) | 
-                (Contractor.trades.contains(trade.name))
+        # Index lookup on contractor_trades (trade_id, contractor_id)
+        query = query.where(
+            Contractor.id.in_(
+                select(ContractorTrade.contractor_id).where(ContractorTrade.trade_id == trade_id)
             )
+        )
     
-    contractors = query.offset(skip).limit(limit).all()
-    return [build_contractor_response(c, db) for c in contractors]
+    result = await db.execute(query.offset(skip).limit(limit))
+    return result.scalars().all()
 
 
 @router.get("/contractors/trades", response_model=List[str])
-async def list_trade_names(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def list_trade_names(current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_read_db)):
     """Get list of trade names (for backward compatibility)."""
-    trades = db.query(Trade).filter(Trade.is_active == 1).order_by(Trade.order, Trade.name).all()
-    return [t.name for t in trades]
+    async def load(db: AsyncSession) -> List[str]:
+        result = await db.execute(
+            select(Trade.name).where(Trade.is_active == 1).order_by(Trade.order, Trade.name)
+        )
+        return list(result.scalars().all())
+    return await reference_cache.get_or_load(db, "trade_names", load)
 
 
 @router.get("/contractors/{contractor_id}", response_model=ContractorResponse)
 async def get_contractor(
     contractor_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get a specific contractor."""
-    contractor = db.query(Contractor).options(joinedload(Contractor.trade)).filter(Contractor.id == contractor_id).first()
+    contractor = await db.scalar(
+        select(Contractor).options(joinedload(Contractor.trade)).where(Contractor.id == contractor_id)
+    )
     if not contractor:
         raise HTTPException(status_code=404, detail="Contractor not found")
-    return build_contractor_response(contractor, db)
+    return contractor
 
 
 @router.post("/contractors", response_model=ContractorResponse, status_code=status.HTTP_201_CREATED)
 async def create_contractor(
     contractor_data: ContractorCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin)
 ):
     """Create a new contractor."""
-    data = contractor_data.model_dump(exclude={'trade_ids'})
+    data = contractor_data.model_dump(exclude={'trade_ids', 'trades'})
+    contractor = Contractor(**data)
     
-    # If trade_ids provided, convert to trade names
-    if contractor_data.trade_ids:
-        trades = db.query(Trade).filter(Trade.id.in_(contractor_data.trade_ids)).all()
-        data['trades'] = [t.name for t in trades]
-        # Set primary trade_id to first one
-        if trades:
-            data['trade_id'] = trades[0].id
+    # Link trades by id, or by name for older clients; the first is the primary trade
+    if contractor_data.trade_ids or contractor_data.trades:
+        contractor.set_trades(
+            await resolve_trades(db, contractor_data.trade_ids or None, contractor_data.trades)
+        )
+    elif contractor_data.trade_id:
+        contractor.set_trades(await resolve_trades(db, [contractor_data.trade_id]))
     
-    contractor = Contractor(**data)
     db.add(contractor)
-    db.commit()
-    db.refresh(contractor)
+    await search_index.index_contractor(db, contractor)
+    # Trade contractor counts and the typeahead index are cached
+    await reference_cache.invalidate(db)
+    await contractor_typeahead_cache.invalidate(db)
+    await db.commit()
     
-    # Reload with trade
-    contractor = db.query(Contractor).options(joinedload(Contractor.trade)).filter(Contractor.id == contractor.id).first()
-    return build_contractor_response(contractor, db)
+    return await load_contractor(contractor.id, db)
 
 
 @router.patch("/contractors/{contractor_id}", response_model=ContractorResponse)
 async def update_contractor(
     contractor_id: int,
     contractor_data: ContractorUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin)
 ):
     """Update a contractor."""
-    contractor = db.query(Contractor).filter(Contractor.id == contractor_id).first()
+    contractor = await db.get(Contractor, contractor_id)
     if not contractor:
         raise HTTPException(status_code=404, detail="Contractor not found")
     
-    update_data = contractor_data.model_dump(exclude_unset=True, exclude={'trade_ids'})
-    
-    # If trade_ids provided, convert to trade names
-    if contractor_data.trade_ids is not None:
-        trades = db.query(Trade).filter(Trade.id.in_(contractor_data.trade_ids)).all()
-        update_data['trades'] = [t.name for t in trades]
-        # Set primary trade_id to first one
-        if trades:
-            update_data['trade_id'] = trades[0].id
-    
+    update_data = contractor_data.model_dump(exclude_unset=True, exclude={'trade_ids', 'trades'})
     for field, value in update_data.items():
         setattr(contractor, field, value)
     
-    db.commit()
-    db.refresh(contractor)
+    # Replace the trade links when trade_ids (or legacy trade names) are sent
+    if contractor_data.trade_ids is not None:
+        contractor.set_trades(await resolve_trades(db, contractor_data.trade_ids))
+    elif contractor_data.trades is not None:
+        contractor.set_trades(await resolve_trades(db, names=contractor_data.trades))
+    
+    if "company" in update_data:
+        # Issue lists show the contractor's company name
+        await project_revisions.bump_project_revisions(
+            db, select(Issue.project_id).where(Issue.contractor_id == contractor.id)
+        )
+    await search_index.index_contractor(db, contractor)
+    await reference_cache.invalidate(db)
+    await contractor_typeahead_cache.invalidate(db)
+    await db.commit()
     
-    # Reload with trade
-    contractor = db.query(Contractor).options(joinedload(Contractor.trade)).filter(Contractor.id == contractor.id).first()
-    return build_contractor_response(contractor, db)
+    return await load_contractor(contractor.id, db)
 
 
 @router.delete("/contractors/{contractor_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_contractor(
     contractor_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin)
 ):
     """Soft delete a contractor."""
-    contractor = db.query(Contractor).filter(Contractor.id == contractor_id).first()
+    contractor = await db.get(Contractor, contractor_id)
     if not contractor:
         raise HTTPException(status_code=404, detail="Contractor not found")
     
     contractor.is_active = 0
-    db.commit()
+    await search_index.index_contractor(db, contractor)
+    await reference_cache.invalidate(db)
+    await contractor_typeahead_cache.invalidate(db)
+    await db.commit()
 
 
 # ==================== Project Contractors ====================
 
+async def get_assignment_or_404(project_id: int, assignment_id: int, db: AsyncSession) -> ProjectContractor:
+    """Helper to get a project contractor assignment or raise 404."""
+    assignment = await db.scalar(
+        select(ProjectContractor).where(
+            ProjectContractor.id == assignment_id,
+            ProjectContractor.project_id == project_id
+        )
+    )
+    if not assignment:
+        raise HTTPException(status_code=404, detail="Assignment not found")
+    return assignment
+
+
+async def load_project_contractor(assignment_id: int, db: AsyncSession) -> ProjectContractor:
+    """Reload an assignment with its contractor and trade for the response."""
+    return await db.scalar(
+        select(ProjectContractor).where(
+            ProjectContractor.id == assignment_id
+        ).options(
+            joinedload(ProjectContractor.contractor).joinedload(Contractor.trade)
+        ).execution_options(populate_existing=True)
+    )
+
+
 @router.get("/projects/{project_id}/contractors", response_model=List[ProjectContractorResponse])
 async def list_project_contractors(
     project_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """List contractors assigned to a project."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    assignments = db.query(ProjectContractor).filter(
-        ProjectContractor.project_id == project_id
-    ).options(
-        joinedload(ProjectContractor.contractor).joinedload(Contractor.trade)
-    ).all()
+    result = await db.execute(
+        select(ProjectContractor).where(
+            ProjectContractor.project_id == project_id
+        ).options(
+            joinedload(ProjectContractor.contractor).joinedload(Contractor.trade)
+        )
+    )
     
-    return assignments
+    return result.scalars().all()
 
 
 @router.post("/projects/{project_id}/contractors", response_model=ProjectContractorResponse, status_code=status.HTTP_201_CREATED)
 async def assign_contractor_to_project(
     project_id: int,
     assignment_data: ProjectContractorCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin)
 ):
     """Assign a contractor to a project."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    contractor = db.query(Contractor).filter(Contractor.id == assignment_data.contractor_id).first()
+    contractor = await db.get(Contractor, assignment_data.contractor_id)
     if not contractor:
         raise HTTPException(status_code=404, detail="Contractor not found")
     
     # Check if already assigned
-    existing = db.query(ProjectContractor).filter(
-        ProjectContractor.project_id == project_id,
-        ProjectContractor.contractor_id == assignment_data.contractor_id
-    ).first()
+    existing = await db.scalar(
+        select(ProjectContractor).where(
+            ProjectContractor.project_id == project_id,
+            ProjectContractor.contractor_id == assignment_data.contractor_id
+        )
+    )
     if existing:
         raise HTTPException(status_code=400, detail="Contractor already assigned to project")
     
     assignment = ProjectContractor(
         project_id=project_id,
         contractor_id=assignment_data.contractor_id,
-        trades=assignment_data.trades,
         notes=assignment_data.notes
     )
+    # Linked by id (or name), so renaming a trade updates the assignment too
+    assignment.set_trades(await resolve_trades(db, assignment_data.trade_ids, assignment_data.trades))
     db.add(assignment)
-    db.commit()
+    # Contractor suggestions within the project come from its assignments
+    await project_typeahead_cache.invalidate(db, [project_id])
+    await db.commit()
     
     # Reload with contractor and trade
-    assignment = db.query(ProjectContractor).filter(
-        ProjectContractor.id == assignment.id
-    ).options(
-        joinedload(ProjectContractor.contractor).joinedload(Contractor.trade)
-    ).first()
-    
-    return assignment
+    return await load_project_contractor(assignment.id, db)
 
 
 @router.patch("/projects/{project_id}/contractors/{assignment_id}", response_model=ProjectContractorResponse)
@@ -387,44 +454,29 @@ async def update_project_contractor(
     project_id: int,
     assignment_id: int,
     update_data: ProjectContractorCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin)
 ):
     """Update a project contractor assignment."""
-    assignment = db.query(ProjectContractor).filter(
-        ProjectContractor.id == assignment_id,
-        ProjectContractor.project_id == project_id
-    ).first()
-    if not assignment:
-        raise HTTPException(status_code=404, detail="Assignment not found")
+    assignment = await get_assignment_or_404(project_id, assignment_id, db)
     
-    assignment.trades = update_data.trades
+    assignment.set_trades(await resolve_trades(db, update_data.trade_ids, update_data.trades))
     assignment.notes = update_data.notes
-    db.commit()
-    
-    assignment = db.query(ProjectContractor).filter(
-        ProjectContractor.id == assignment_id
-    ).options(
-        joinedload(ProjectContractor.contractor).joinedload(Contractor.trade)
-    ).first()
+    await db.commit()
     
-    return assignment
+    return await load_project_contractor(assignment_id, db)
 
 
 @router.delete("/projects/{project_id}/contractors/{assignment_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def remove_contractor_from_project(
     project_id: int,
     assignment_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin)
 ):
     """Remove a contractor from a project."""
-    assignment = db.query(ProjectContractor).filter(
-        ProjectContractor.id == assignment_id,
-        ProjectContractor.project_id == project_id
-    ).first()
-    if not assignment:
-        raise HTTPException(status_code=404, detail="Assignment not found")
+    assignment = await get_assignment_or_404(project_id, assignment_id, db)
     
-    db.delete(assignment)
-    db.commit()
+    await db.delete(assignment)
+    await project_typeahead_cache.invalidate(db, [project_id])
+    await db.commit()
@@ -1,31 +1,95 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response, UploadFile, File
+from sqlalchemy import insert, or_, select, func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from collections import Counter
+from typing import List, Optional, Tuple
 from datetime import datetime
-from ..database import get_db
+from ..database import get_async_db, get_read_db
 from ..models.user import User
 from ..models.project import Project
 from ..models.area import Area
 from ..models.contractor import Contractor
+from ..models.trade import Trade
 from ..models.issue import Issue, IssuePhoto, IssueStatus, IssuePriority, PhotoType, DEFAULT_CATEGORIES
 from ..schemas.issue import (
     IssueCreate, IssueUpdate, IssueResponse, IssueListResponse,
-    IssuePhotoResponse, IssueStatusUpdate
+    IssuePhotoResponse, IssueStatusUpdate,
+    IssueBulkCreate, IssueBulkItemResult, IssueBulkCreateResponse,
+    IssueBulkSelection, IssueBulkStatusUpdate, IssueBulkAssign, IssueBulkSkipped, IssueBulkUpdateResponse
 )
 from ..utils.auth import get_current_user, require_pm_or_admin
+from ..utils.pagination import MAX_PAGE_SIZE, TotalMode, apply_cursor, count_total, order_newest_first, page_results
 from ..services.storage_service import get_storage_service, StorageService
+from ..services import issue_counters, project_revisions, search_index
+from ..utils.etags import not_modified, set_etag
 
 router = APIRouter(prefix="/api/projects/{project_id}/issues", tags=["Issues"])
 
 
-def get_project_or_404(project_id: int, db: Session) -> Project:
-    project = db.query(Project).filter(Project.id == project_id).first()
+# Relationships read by enrich_issue_response - must be eager-loaded under AsyncSession
+ISSUE_RESPONSE_OPTIONS = (
+    joinedload(Issue.area),
+    joinedload(Issue.contractor),
+    joinedload(Issue.creator),
+    joinedload(Issue.trade_category),
+    selectinload(Issue.photos),
+)
+
+
+async def get_project_or_404(project_id: int, db: AsyncSession) -> Project:
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     return project
 
 
+async def get_issue_or_404(project_id: int, issue_id: int, db: AsyncSession, *options) -> Issue:
+    issue = await db.scalar(
+        select(Issue).where(
+            Issue.id == issue_id,
+            Issue.project_id == project_id
+        ).options(*options)
+    )
+    if not issue:
+        raise HTTPException(status_code=404, detail="Issue not found")
+    return issue
+
+
+async def load_issue_response(issue_id: int, db: AsyncSession) -> IssueResponse:
+    """Reload an issue with its relationships and build the response."""
+    issue = await db.scalar(
+        select(Issue).where(Issue.id == issue_id).options(*ISSUE_RESPONSE_OPTIONS)
+        .execution_options(populate_existing=True)
+    )
+    return IssueResponse(**enrich_issue_response(issue))
+
+
+async def find_trade(db: AsyncSession, name: str) -> Optional[Trade]:
+    """Trade with the given name (trade names are unique ignoring case)."""
+    return await db.scalar(select(Trade).where(func.lower(Trade.name) == name.lower()))
+
+
+async def resolve_trade(
+    db: AsyncSession,
+    trade_id: Optional[int],
+    trade_name: Optional[str]
+) -> Tuple[Optional[int], Optional[str]]:
+    """Normalize an issue's trade to (trade_id, name).
+    
+    Names that don't match a trade are kept as free text without an id.
+    """
+    if trade_id is not None:
+        trade = await db.get(Trade, trade_id)
+        if not trade:
+            raise HTTPException(status_code=400, detail="Trade not found")
+        return trade.id, trade.name
+    if not trade_name:
+        return None, None
+    trade = await find_trade(db, trade_name)
+    return (trade.id, trade.name) if trade else (None, trade_name)
+
+
 def enrich_issue_response(issue: Issue) -> dict:
     """Add computed fields to issue response."""
     data = {
@@ -38,7 +102,8 @@ def enrich_issue_response(issue: Issue) -> dict:
         "priority": issue.priority,
         "status": issue.status,
         "resolution_notes": issue.resolution_notes,
-        "trade": issue.trade,
+        "trade": issue.trade_category.name if issue.trade_category else issue.trade,
+        "trade_id": issue.trade_id,
         "contractor_id": issue.contractor_id,
         "due_date": issue.due_date,
         "created_by": issue.created_by,
@@ -55,6 +120,28 @@ def enrich_issue_response(issue: Issue) -> dict:
     return data
 
 
+def filter_issues(
+    query,
+    status: Optional[IssueStatus] = None,
+    priority: Optional[IssuePriority] = None,
+    area_id: Optional[int] = None,
+    contractor_id: Optional[int] = None,
+    trade_id: Optional[int] = None
+):
+    """Apply the issue list filters to a query."""
+    if status:
+        query = query.where(Issue.status == status)
+    if priority:
+        query = query.where(Issue.priority == priority)
+    if area_id:
+        query = query.where(Issue.area_id == area_id)
+    if contractor_id:
+        query = query.where(Issue.contractor_id == contractor_id)
+    if trade_id:
+        query = query.where(Issue.trade_id == trade_id)
+    return query
+
+
 @router.get("/categories", response_model=List[str])
 async def list_categories(current_user: User = Depends(get_current_user)):
     """Get list of default issue categories."""
@@ -64,68 +151,72 @@ async def list_categories(current_user: User = Depends(get_current_user)):
 @router.get("/", response_model=IssueListResponse)
 async def list_issues(
     project_id: int,
+    request: Request,
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    total: TotalMode = TotalMode.EXACT,
     status: Optional[IssueStatus] = None,
     priority: Optional[IssuePriority] = None,
     area_id: Optional[int] = None,
     contractor_id: Optional[int] = None,
+    trade_id: Optional[int] = None,
     trade: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
-    """List issues for a project with filters."""
-    get_project_or_404(project_id, db)
-    
-    query = db.query(Issue).filter(Issue.project_id == project_id)
-    
-    if status:
-        query = query.filter(Issue.status == status)
-    if priority:
-        query = query.filter(Issue.priority == priority)
-    if area_id:
-        query = query.filter(Issue.area_id == area_id)
-    if contractor_id:
-        query = query.filter(Issue.contractor_id == contractor_id)
-    if trade:
-        query = query.filter(Issue.trade == trade)
-    
-    total = query.count()
-    
-    issues = query.options(
-        joinedload(Issue.area),
-        joinedload(Issue.contractor),
-        joinedload(Issue.creator),
-        joinedload(Issue.photos)
-    ).order_by(Issue.created_at.desc()).offset(skip).limit(limit).all()
+    """List issues for a project with filters, newest first.
+    
+    Pass `next_cursor` from the previous page as `cursor` to continue
+    (`skip` is still accepted but gets slower on deep pages). Returns 304
+    when If-None-Match has the project's current ETag.
+    """
+    etag = await project_revisions.project_etag(db, project_id, "issues")
+    if etag is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    set_etag(response, etag)
+    
+    query = filter_issues(
+        select(Issue).where(Issue.project_id == project_id),
+        status, priority, area_id, contractor_id, trade_id
+    )
+    if trade and not trade_id:
+        # Known trade names filter by id, so renamed trades still match
+        trade_row = await find_trade(db, trade)
+        if trade_row:
+            query = query.where(Issue.trade_id == trade_row.id)
+        else:
+            query = query.where(Issue.trade == trade)
+    
+    total_count = await count_total(db, query, total)
+    
+    page_query = order_newest_first(query.options(*ISSUE_RESPONSE_OPTIONS), Issue)
+    if cursor:
+        page_query = apply_cursor(page_query, Issue, cursor, db)
+    elif skip:
+        page_query = page_query.offset(skip)
+    issues, next_cursor = await page_results(db, page_query, limit)
     
     items = [IssueResponse(**enrich_issue_response(issue)) for issue in issues]
     
-    return IssueListResponse(items=items, total=total)
+    return IssueListResponse(items=items, total=total_count, next_cursor=next_cursor)
 
 
 @router.get("/{issue_id}", response_model=IssueResponse)
 async def get_issue(
     project_id: int,
     issue_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get a specific issue."""
-    get_project_or_404(project_id, db)
-    
-    issue = db.query(Issue).filter(
-        Issue.id == issue_id,
-        Issue.project_id == project_id
-    ).options(
-        joinedload(Issue.area),
-        joinedload(Issue.contractor),
-        joinedload(Issue.creator),
-        joinedload(Issue.photos)
-    ).first()
+    await get_project_or_404(project_id, db)
     
-    if not issue:
-        raise HTTPException(status_code=404, detail="Issue not found")
+    issue = await get_issue_or_404(project_id, issue_id, db, *ISSUE_RESPONSE_OPTIONS)
     
     return IssueResponse(**enrich_issue_response(issue))
 
@@ -134,23 +225,27 @@ async def get_issue(
 async def create_issue(
     project_id: int,
     issue_data: IssueCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin)
 ):
     """Create a new issue."""
-    get_project_or_404(project_id, db)
+    await get_project_or_404(project_id, db)
     
     # Validate area exists
-    area = db.query(Area).filter(Area.id == issue_data.area_id, Area.project_id == project_id).first()
+    area = await db.scalar(
+        select(Area).where(Area.id == issue_data.area_id, Area.project_id == project_id)
+    )
     if not area:
         raise HTTPException(status_code=400, detail="Invalid area for this project")
     
     # Validate contractor if provided
     if issue_data.contractor_id:
-        contractor = db.query(Contractor).filter(Contractor.id == issue_data.contractor_id).first()
+        contractor = await db.get(Contractor, issue_data.contractor_id)
         if not contractor:
             raise HTTPException(status_code=400, detail="Contractor not found")
     
+    trade_id, trade_name = await resolve_trade(db, issue_data.trade_id, issue_data.trade)
+    
     # Determine initial status
     initial_status = IssueStatus.ASSIGNED if issue_data.contractor_id else IssueStatus.OPEN
     
@@ -161,25 +256,233 @@ async def create_issue(
         subcategory=issue_data.subcategory,
         description=issue_data.description,
         priority=issue_data.priority,
-        trade=issue_data.trade,
+        trade=trade_name,
+        trade_id=trade_id,
         contractor_id=issue_data.contractor_id,
         due_date=issue_data.due_date,
         status=initial_status,
         created_by=current_user.id
     )
     db.add(issue)
-    db.commit()
-    db.refresh(issue)
+    await issue_counters.issue_created(db, issue)
+    await search_index.index_issue(db, issue)
+    await project_revisions.bump_project_revisions(db, project_id)
+    await db.commit()
     
     # Reload with relationships
-    issue = db.query(Issue).filter(Issue.id == issue.id).options(
-        joinedload(Issue.area),
-        joinedload(Issue.contractor),
-        joinedload(Issue.creator),
-        joinedload(Issue.photos)
-    ).first()
+    return await load_issue_response(issue.id, db)
+
+
+@router.post("/bulk", response_model=IssueBulkCreateResponse)
+async def bulk_create_issues(
+    project_id: int,
+    bulk_data: IssueBulkCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_pm_or_admin)
+):
+    """Create many issues in one transaction (e.g. at the end of a walkthrough).
     
-    return IssueResponse(**enrich_issue_response(issue))
+    Items with an invalid area, contractor or trade are reported per item and
+    skipped; the others are created.
+    """
+    await get_project_or_404(project_id, db)
+    items = bulk_data.items
+    
+    # Validate all referenced ids with one query per table
+    result = await db.execute(
+        select(Area.id).where(Area.project_id == project_id, Area.id.in_({item.area_id for item in items}))
+    )
+    area_ids = set(result.scalars())
+    
+    contractor_ids = {item.contractor_id for item in items if item.contractor_id}
+    if contractor_ids:
+        result = await db.execute(select(Contractor.id).where(Contractor.id.in_(contractor_ids)))
+        contractor_ids = set(result.scalars())
+    
+    trade_ids = {item.trade_id for item in items if item.trade_id is not None}
+    trade_names = {item.trade.lower() for item in items if item.trade_id is None and item.trade}
+    trades_by_id, trades_by_name = {}, {}
+    if trade_ids or trade_names:
+        result = await db.execute(
+            select(Trade).where(or_(Trade.id.in_(trade_ids), func.lower(Trade.name).in_(trade_names)))
+        )
+        for trade in result.scalars():
+            trades_by_id[trade.id] = trade
+            trades_by_name[trade.name.lower()] = trade
+    
+    results: List[Optional[IssueBulkItemResult]] = [None] * len(items)
+    rows, positions = [], []
+    for index, item in enumerate(items):
+        if item.area_id not in area_ids:
+            error = "Invalid area for this project"
+        elif item.contractor_id and item.contractor_id not in contractor_ids:
+            error = "Contractor not found"
+        elif item.trade_id is not None and item.trade_id not in trades_by_id:
+            error = "Trade not found"
+        else:
+            error = None
+        if error:
+            results[index] = IssueBulkItemResult(index=index, error=error)
+            continue
+        
+        # Same trade normalization as resolve_trade
+        if item.trade_id is not None:
+            trade = trades_by_id[item.trade_id]
+        else:
+            trade = trades_by_name.get(item.trade.lower()) if item.trade else None
+        rows.append({
+            "project_id": project_id,
+            "area_id": item.area_id,
+            "category": item.category,
+            "subcategory": item.subcategory,
+            "description": item.description,
+            "priority": item.priority,
+            "trade": trade.name if trade else (item.trade or None),
+            "trade_id": trade.id if trade else None,
+            "contractor_id": item.contractor_id,
+            "due_date": item.due_date,
+            "status": IssueStatus.ASSIGNED if item.contractor_id else IssueStatus.OPEN,
+            "created_by": current_user.id,
+        })
+        positions.append(index)
+    
+    if rows:
+        # Multi-row INSERT ... RETURNING (batched by SQLAlchemy's insertmanyvalues). Core
+        # insert on the table, since ORM bulk insert splits runs of rows with different None columns
+        is_sqlite = db.get_bind().dialect.name == "sqlite"
+        issues_table = Issue.__table__
+        result = await db.execute(
+            insert(issues_table).returning(issues_table.c.id, sort_by_parameter_order=not is_sqlite), rows
+        )
+        ids = list(result.scalars())
+        if is_sqlite:
+            # SQLite can't order RETURNING rows (SQLAlchemy would fall back to one INSERT
+            # per row), but it assigns ascending rowids in insert order under the write lock
+            ids.sort()
+        await issue_counters.adjust_issue_counters(
+            db, Counter((project_id, row["status"], row["priority"]) for row in rows)
+        )
+        await search_index.index_documents(db, "issue", ids)
+        await project_revisions.bump_project_revisions(db, project_id)
+        await db.commit()
+        for index, issue_id in zip(positions, ids):
+            results[index] = IssueBulkItemResult(index=index, id=issue_id)
+    
+    return IssueBulkCreateResponse(created=len(rows), failed=len(items) - len(rows), results=results)
+
+
+async def select_bulk_issues(project_id: int, selection: IssueBulkSelection, db: AsyncSession):
+    """(id, status, priority) of the issues picked by a bulk request, and requested ids that weren't found."""
+    if (selection.issue_ids is None) == (selection.filter is None):
+        raise HTTPException(status_code=400, detail="Provide either issue_ids or filter")
+    
+    query = select(Issue.id, Issue.status, Issue.priority).where(Issue.project_id == project_id)
+    if selection.issue_ids is not None:
+        query = query.where(Issue.id.in_(selection.issue_ids))
+    else:
+        issue_filter = selection.filter
+        query = filter_issues(
+            query, issue_filter.status, issue_filter.priority, issue_filter.area_id,
+            issue_filter.contractor_id, issue_filter.trade_id
+        )
+    result = await db.execute(query.order_by(Issue.id))
+    rows = result.all()
+    
+    not_found = []
+    if selection.issue_ids is not None:
+        not_found = sorted(set(selection.issue_ids) - {row.id for row in rows})
+    return rows, not_found
+
+
+@router.patch("/bulk/status", response_model=IssueBulkUpdateResponse)
+async def bulk_update_issue_status(
+    project_id: int,
+    status_data: IssueBulkStatusUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_pm_or_admin)
+):
+    """Move many issues to one status with a single UPDATE.
+    
+    Closing still requires at least one "after" photo; issues without one
+    are skipped and reported.
+    """
+    await get_project_or_404(project_id, db)
+    rows, not_found = await select_bulk_issues(project_id, status_data, db)
+    
+    skipped = []
+    if status_data.status == IssueStatus.CLOSED and rows:
+        # One grouped query instead of loading the photos of every issue
+        result = await db.execute(
+            select(IssuePhoto.issue_id).where(
+                IssuePhoto.issue_id.in_([row.id for row in rows]),
+                IssuePhoto.photo_type == PhotoType.AFTER
+            ).group_by(IssuePhoto.issue_id)
+        )
+        with_after_photo = set(result.scalars())
+        skipped = [
+            IssueBulkSkipped(id=row.id, error="Cannot close issue without at least one 'after' photo")
+            for row in rows if row.id not in with_after_photo
+        ]
+        rows = [row for row in rows if row.id in with_after_photo]
+    
+    if rows:
+        values = {"status": status_data.status}
+        if status_data.status == IssueStatus.CLOSED:
+            values["closed_by"] = current_user.id
+            values["closed_at"] = datetime.utcnow()
+        if status_data.notes:
+            values["resolution_notes"] = status_data.notes
+        
+        issue_ids = [row.id for row in rows]
+        await db.execute(
+            update(Issue).where(Issue.id.in_(issue_ids)).values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        
+        deltas = Counter()
+        for row in rows:
+            deltas[(project_id, row.status, row.priority)] -= 1
+            deltas[(project_id, status_data.status, row.priority)] += 1
+        await issue_counters.adjust_issue_counters(db, deltas)
+        await project_revisions.bump_project_revisions(db, project_id)
+        if status_data.notes:
+            await search_index.index_documents(db, "issue", issue_ids)
+        await db.commit()
+    
+    return IssueBulkUpdateResponse(
+        matched=len(rows) + len(skipped),
+        updated=len(rows),
+        skipped=skipped,
+        not_found=not_found
+    )
+
+
+@router.patch("/bulk/assign", response_model=IssueBulkUpdateResponse)
+async def bulk_assign_issues(
+    project_id: int,
+    assign_data: IssueBulkAssign,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_pm_or_admin)
+):
+    """Assign many issues to one contractor (or unassign them) with a single UPDATE."""
+    await get_project_or_404(project_id, db)
+    
+    if assign_data.contractor_id is not None:
+        contractor = await db.get(Contractor, assign_data.contractor_id)
+        if not contractor:
+            raise HTTPException(status_code=400, detail="Contractor not found")
+    
+    rows, not_found = await select_bulk_issues(project_id, assign_data, db)
+    if rows:
+        await db.execute(
+            update(Issue).where(Issue.id.in_([row.id for row in rows]))
+            .values(contractor_id=assign_data.contractor_id)
+            .execution_options(synchronize_session=False)
+        )
+        await project_revisions.bump_project_revisions(db, project_id)
+        await db.commit()
+    
+    return IssueBulkUpdateResponse(matched=len(rows), updated=len(rows), not_found=not_found)
 
 
 @router.patch("/{issue_id}", response_model=IssueResponse)
@@ -187,45 +490,43 @@ async def update_issue(
     project_id: int,
     issue_id: int,
     issue_data: IssueUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin)
 ):
     """Update an issue."""
-    get_project_or_404(project_id, db)
+    await get_project_or_404(project_id, db)
     
-    issue = db.query(Issue).filter(
-        Issue.id == issue_id,
-        Issue.project_id == project_id
-    ).first()
-    
-    if not issue:
-        raise HTTPException(status_code=404, detail="Issue not found")
+    issue = await get_issue_or_404(project_id, issue_id, db)
     
     update_data = issue_data.model_dump(exclude_unset=True)
     
     # Validate area if being updated
     if "area_id" in update_data:
-        area = db.query(Area).filter(
-            Area.id == update_data["area_id"],
-            Area.project_id == project_id
-        ).first()
+        area = await db.scalar(
+            select(Area).where(
+                Area.id == update_data["area_id"],
+                Area.project_id == project_id
+            )
+        )
         if not area:
             raise HTTPException(status_code=400, detail="Invalid area for this project")
     
+    if "trade_id" in update_data or "trade" in update_data:
+        update_data["trade_id"], update_data["trade"] = await resolve_trade(
+            db, update_data.get("trade_id"), update_data.get("trade")
+        )
+    
+    old_priority = issue.priority
     for field, value in update_data.items():
         setattr(issue, field, value)
     
-    db.commit()
+    await issue_counters.issue_moved(db, issue, issue.status, old_priority)
+    await search_index.index_issue(db, issue)
+    await project_revisions.bump_project_revisions(db, project_id)
+    await db.commit()
     
     # Reload with relationships
-    issue = db.query(Issue).filter(Issue.id == issue.id).options(
-        joinedload(Issue.area),
-        joinedload(Issue.contractor),
-        joinedload(Issue.creator),
-        joinedload(Issue.photos)
-    ).first()
-    
-    return IssueResponse(**enrich_issue_response(issue))
+    return await load_issue_response(issue.id, db)
 
 
 @router.patch("/{issue_id}/status", response_model=IssueResponse)
@@ -233,19 +534,13 @@ async def update_issue_status(
     project_id: int,
     issue_id: int,
     status_data: IssueStatusUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin)
 ):
     """Update issue status."""
-    get_project_or_404(project_id, db)
+    await get_project_or_404(project_id, db)
     
-    issue = db.query(Issue).filter(
-        Issue.id == issue_id,
-        Issue.project_id == project_id
-    ).first()
-    
-    if not issue:
-        raise HTTPException(status_code=404, detail="Issue not found")
+    issue = await get_issue_or_404(project_id, issue_id, db, selectinload(Issue.photos))
     
     # If closing, require at least one "after" photo
     if status_data.status == IssueStatus.CLOSED:
@@ -261,18 +556,16 @@ async def update_issue_status(
     if status_data.notes:
         issue.resolution_notes = status_data.notes
     
+    old_status = issue.status
     issue.status = status_data.status
-    db.commit()
+    await issue_counters.issue_moved(db, issue, old_status, issue.priority)
+    await project_revisions.bump_project_revisions(db, project_id)
+    if status_data.notes:
+        await search_index.index_issue(db, issue)
+    await db.commit()
     
     # Reload with relationships
-    issue = db.query(Issue).filter(Issue.id == issue.id).options(
-        joinedload(Issue.area),
-        joinedload(Issue.contractor),
-        joinedload(Issue.creator),
-        joinedload(Issue.photos)
-    ).first()
-    
-    return IssueResponse(**enrich_issue_response(issue))
+    return await load_issue_response(issue.id, db)
 
 
 @router.post("/{issue_id}/photos", response_model=IssuePhotoResponse, status_code=status.HTTP_201_CREATED)
@@ -281,26 +574,25 @@ async def upload_issue_photo(
     issue_id: int,
     photo_type: PhotoType = Query(PhotoType.BEFORE),
     file: UploadFile = File(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin),
     storage: StorageService = Depends(get_storage_service)
 ):
     """Upload a photo to an issue."""
-    get_project_or_404(project_id, db)
-    
-    issue = db.query(Issue).filter(
-        Issue.id == issue_id,
-        Issue.project_id == project_id
-    ).first()
+    await get_project_or_404(project_id, db)
     
-    if not issue:
-        raise HTTPException(status_code=404, detail="Issue not found")
+    await get_issue_or_404(project_id, issue_id, db)
     
     # Check photo limit
-    existing_photos = db.query(IssuePhoto).filter(IssuePhoto.issue_id == issue_id).count()
+    existing_photos = await db.scalar(
+        select(func.count(IssuePhoto.id)).where(IssuePhoto.issue_id == issue_id)
+    )
     if existing_photos >= 10:
         raise HTTPException(status_code=400, detail="Maximum 10 photos per issue")
     
+    # End the read transaction so the connection isn't held while the image is processed
+    await db.commit()
+    
     # Save photo
     result = await storage.save_photo(file, project_id, issue_id)
     
@@ -312,8 +604,9 @@ async def upload_issue_photo(
         photo_type=photo_type
     )
     db.add(photo)
-    db.commit()
-    db.refresh(photo)
+    await project_revisions.bump_project_revisions(db, project_id)
+    await db.commit()
+    await db.refresh(photo)
     
     return photo
 
@@ -323,17 +616,19 @@ async def delete_issue_photo(
     project_id: int,
     issue_id: int,
     photo_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin),
     storage: StorageService = Depends(get_storage_service)
 ):
     """Delete a photo from an issue."""
-    get_project_or_404(project_id, db)
+    await get_project_or_404(project_id, db)
     
-    photo = db.query(IssuePhoto).filter(
-        IssuePhoto.id == photo_id,
-        IssuePhoto.issue_id == issue_id
-    ).first()
+    photo = await db.scalar(
+        select(IssuePhoto).where(
+            IssuePhoto.id == photo_id,
+            IssuePhoto.issue_id == issue_id
+        )
+    )
     
     if not photo:
         raise HTTPException(status_code=404, detail="Photo not found")
@@ -342,32 +637,30 @@ async def delete_issue_photo(
     storage.delete_file(photo.url)
     
     # Delete record
-    db.delete(photo)
-    db.commit()
+    await db.delete(photo)
+    await project_revisions.bump_project_revisions(db, project_id)
+    await db.commit()
 
 
 @router.delete("/{issue_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_issue(
     project_id: int,
     issue_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin),
     storage: StorageService = Depends(get_storage_service)
 ):
     """Delete an issue and its photos."""
-    get_project_or_404(project_id, db)
-    
-    issue = db.query(Issue).filter(
-        Issue.id == issue_id,
-        Issue.project_id == project_id
-    ).options(joinedload(Issue.photos)).first()
+    await get_project_or_404(project_id, db)
     
-    if not issue:
-        raise HTTPException(status_code=404, detail="Issue not found")
+    issue = await get_issue_or_404(project_id, issue_id, db, selectinload(Issue.photos))
     
     # Delete all photos
     for photo in issue.photos:
         storage.delete_file(photo.url)
     
-    db.delete(issue)
-    db.commit()
+    await issue_counters.issue_deleted(db, issue)
+    await search_index.remove_document(db, "issue", issue.id)
+    await project_revisions.bump_project_revisions(db, project_id)
+    await db.delete(issue)
+    await db.commit()
@@ -1,8 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from fastapi.responses import Response
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response, UploadFile, File
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from ..database import get_db
+from ..database import get_async_db, get_read_db
 from ..models.user import User
 from ..models.project import Project
 from ..models.manual import ManualTemplate, ManualInstance, DEFAULT_MANUAL_SECTIONS
@@ -12,6 +12,9 @@ from ..schemas.manual import (
 from ..services.pdf_service import get_pdf_service, PDFService
 from ..services.storage_service import get_storage_service, StorageService
 from ..utils.auth import get_current_user, require_pm_or_admin
+from ..services.ref_cache import reference_cache
+from ..services import project_revisions
+from ..utils.etags import not_modified, set_etag
 
 router = APIRouter(prefix="/api", tags=["Home Owner Manual"])
 
@@ -20,12 +23,14 @@ router = APIRouter(prefix="/api", tags=["Home Owner Manual"])
 
 @router.get("/manual-templates", response_model=List[ManualTemplateResponse])
 async def list_templates(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """List available manual templates."""
-    templates = db.query(ManualTemplate).filter(ManualTemplate.is_active == 1).all()
-    return templates
+    async def load(db: AsyncSession) -> List[dict]:
+        result = await db.execute(select(ManualTemplate).where(ManualTemplate.is_active == 1))
+        return [ManualTemplateResponse.model_validate(t).model_dump() for t in result.scalars().all()]
+    return await reference_cache.get_or_load(db, "manual_templates", load)
 
 
 @router.get("/manual-templates/default-sections")
@@ -39,15 +44,21 @@ async def get_default_sections(current_user: User = Depends(get_current_user)):
 @router.get("/projects/{project_id}/manual", response_model=ManualInstanceResponse)
 async def get_project_manual(
     project_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get the manual instance for a project."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
+    """Get the manual instance for a project (304 when If-None-Match is current)."""
+    etag = await project_revisions.project_etag(db, project_id, "manual")
+    if etag is None:
         raise HTTPException(status_code=404, detail="Project not found")
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    set_etag(response, etag)
     
-    manual = db.query(ManualInstance).filter(ManualInstance.project_id == project_id).first()
+    manual = await db.scalar(select(ManualInstance).where(ManualInstance.project_id == project_id))
     
     if not manual:
         # Create empty instance
@@ -57,8 +68,8 @@ async def get_project_manual(
             attachments=[]
         )
         db.add(manual)
-        db.commit()
-        db.refresh(manual)
+        await db.commit()
+        await db.refresh(manual)
     
     return manual
 
@@ -67,15 +78,15 @@ async def get_project_manual(
 async def update_project_manual(
     project_id: int,
     manual_data: ManualInstanceUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin)
 ):
     """Update the manual instance for a project."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    manual = db.query(ManualInstance).filter(ManualInstance.project_id == project_id).first()
+    manual = await db.scalar(select(ManualInstance).where(ManualInstance.project_id == project_id))
     
     if not manual:
         manual = ManualInstance(
@@ -90,8 +101,9 @@ async def update_project_manual(
         if manual_data.attachments is not None:
             manual.attachments = manual_data.attachments
     
-    db.commit()
-    db.refresh(manual)
+    await project_revisions.bump_project_revisions(db, project_id)
+    await db.commit()
+    await db.refresh(manual)
     return manual
 
 
@@ -100,20 +112,23 @@ async def upload_manual_attachment(
     project_id: int,
     section: str,
     file: UploadFile = File(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin),
     storage: StorageService = Depends(get_storage_service)
 ):
     """Upload an attachment to the manual."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
+    # End the read transaction so the connection isn't held during the upload
+    await db.commit()
+    
     # Save file
     result = await storage.save_document(file, project_id)
     
     # Get or create manual instance
-    manual = db.query(ManualInstance).filter(ManualInstance.project_id == project_id).first()
+    manual = await db.scalar(select(ManualInstance).where(ManualInstance.project_id == project_id))
     if not manual:
         manual = ManualInstance(project_id=project_id, fields={}, attachments=[])
         db.add(manual)
@@ -130,7 +145,8 @@ async def upload_manual_attachment(
     attachments.append(attachment)
     manual.attachments = attachments
     
-    db.commit()
+    await project_revisions.bump_project_revisions(db, project_id)
+    await db.commit()
     
     return attachment
 
@@ -141,12 +157,12 @@ async def upload_item_photo(
     section: str,
     item_index: int,
     file: UploadFile = File(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin),
     storage: StorageService = Depends(get_storage_service)
 ):
     """Upload a photo for a specific item in a list section (appliances, finishes)."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
@@ -154,16 +170,19 @@ async def upload_item_photo(
     if not file.content_type or not file.content_type.startswith('image/'):
         raise HTTPException(status_code=400, detail="Only image files are allowed")
     
+    # End the read transaction so the connection isn't held during the upload
+    await db.commit()
+    
     # Save file
     result = await storage.save_document(file, project_id)
     
     # Get or create manual instance
-    manual = db.query(ManualInstance).filter(ManualInstance.project_id == project_id).first()
+    manual = await db.scalar(select(ManualInstance).where(ManualInstance.project_id == project_id))
     if not manual:
         manual = ManualInstance(project_id=project_id, fields={}, attachments=[])
         db.add(manual)
-        db.commit()
-        db.refresh(manual)
+        await db.commit()
+        await db.refresh(manual)
     
     # Update the item's photo_url
     fields = dict(manual.fields) if manual.fields else {}
@@ -192,7 +211,8 @@ async def upload_item_photo(
     fields[section] = section_data
     manual.fields = fields
     
-    db.commit()
+    await project_revisions.bump_project_revisions(db, project_id)
+    await db.commit()
     
     return {"url": result["url"], "item_index": item_index, "section": section}
 
@@ -200,16 +220,16 @@ async def upload_item_photo(
 @router.get("/projects/{project_id}/manual/export")
 async def export_manual_pdf(
     project_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
     pdf_service: PDFService = Depends(get_pdf_service)
 ):
     """Export the home owner manual as PDF."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    manual = db.query(ManualInstance).filter(ManualInstance.project_id == project_id).first()
+    manual = await db.scalar(select(ManualInstance).where(ManualInstance.project_id == project_id))
     
     if not manual:
         raise HTTPException(status_code=404, detail="Manual not configured for this project")
@@ -221,10 +241,10 @@ async def export_manual_pdf(
         attachments=manual.attachments or []
     )
     
-    filename = f"home_owner_manual_{project.name.replace(' ', '_')}.pdf"
+    filename = f"home_owner_manual_{project.name.replace(' ', '_')}.{pdf_service.file_extension}"
     
     return Response(
         content=pdf_bytes,
-        media_type="application/pdf",
+        media_type=pdf_service.media_type,
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
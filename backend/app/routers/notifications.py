@@ -1,12 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 from datetime import datetime
-from ..database import get_db
+from ..database import get_async_db
 from ..models.user import User
 from ..models.project import Project
 from ..models.issue import Issue
 from ..models.contractor import Contractor
 from ..services.notification_service import get_notification_service, NotificationService
+from ..services import project_revisions
 from ..utils.auth import get_current_user, require_pm_or_admin
 
 router = APIRouter(prefix="/api/projects/{project_id}/issues/{issue_id}/notify", tags=["Notifications"])
@@ -16,19 +19,21 @@ router = APIRouter(prefix="/api/projects/{project_id}/issues/{issue_id}/notify",
 async def send_issue_notification(
     project_id: int,
     issue_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin),
     notification_service: NotificationService = Depends(get_notification_service)
 ):
     """Send or resend notification to contractor about an issue."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    issue = db.query(Issue).filter(
-        Issue.id == issue_id,
-        Issue.project_id == project_id
-    ).first()
+    issue = await db.scalar(
+        select(Issue).where(
+            Issue.id == issue_id,
+            Issue.project_id == project_id
+        ).options(joinedload(Issue.area), selectinload(Issue.photos))
+    )
     
     if not issue:
         raise HTTPException(status_code=404, detail="Issue not found")
@@ -36,7 +41,7 @@ async def send_issue_notification(
     if not issue.contractor_id:
         raise HTTPException(status_code=400, detail="Issue has no contractor assigned")
     
-    contractor = db.query(Contractor).filter(Contractor.id == issue.contractor_id).first()
+    contractor = await db.get(Contractor, issue.contractor_id)
     if not contractor:
         raise HTTPException(status_code=400, detail="Contractor not found")
     
@@ -61,7 +66,8 @@ async def send_issue_notification(
     
     # Update issue notification timestamp
     issue.notification_sent_at = datetime.utcnow()
-    db.commit()
+    await project_revisions.bump_project_revisions(db, project_id)
+    await db.commit()
     
     return {
         "message": "Notification sent",
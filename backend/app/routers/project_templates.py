@@ -0,0 +1,155 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from ..database import get_async_db, get_read_db
+from ..models.user import User
+from ..models.area import Area
+from ..models.contractor import Contractor, ProjectContractor
+from ..models.manual import ManualTemplate, ManualInstance
+from ..models.project import Project, ProjectTemplate
+from ..schemas.project import (
+    ProjectTemplateCreate, ProjectTemplateUpdate, ProjectTemplateResponse, ProjectTemplateFromProject
+)
+from ..utils.auth import get_current_user, require_pm_or_admin
+
+router = APIRouter(prefix="/api/project-templates", tags=["Project Templates"])
+
+
+async def get_template_or_404(template_id: int, db: AsyncSession) -> ProjectTemplate:
+    template = await db.get(ProjectTemplate, template_id)
+    if not template:
+        raise HTTPException(status_code=404, detail="Project template not found")
+    return template
+
+
+async def check_template_name(db: AsyncSession, name: str, template_id: Optional[int] = None):
+    query = select(ProjectTemplate.id).where(ProjectTemplate.name == name)
+    if template_id is not None:
+        query = query.where(ProjectTemplate.id != template_id)
+    if await db.scalar(query):
+        raise HTTPException(status_code=400, detail="Project template with this name already exists")
+
+
+async def check_template_references(
+    db: AsyncSession,
+    contractor_ids: Optional[List[int]],
+    manual_template_id: Optional[int]
+):
+    """Reject contractor or manual template ids that don't exist."""
+    if contractor_ids:
+        found = set((await db.scalars(
+            select(Contractor.id).where(Contractor.id.in_(contractor_ids))
+        )).all())
+        if found != set(contractor_ids):
+            raise HTTPException(status_code=400, detail="Contractor not found")
+    if manual_template_id is not None and not await db.get(ManualTemplate, manual_template_id):
+        raise HTTPException(status_code=400, detail="Manual template not found")
+
+
+@router.get("/", response_model=List[ProjectTemplateResponse])
+async def list_project_templates(
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """List project templates."""
+    result = await db.execute(select(ProjectTemplate).order_by(ProjectTemplate.name))
+    return result.scalars().all()
+
+
+@router.get("/{template_id}", response_model=ProjectTemplateResponse)
+async def get_project_template(
+    template_id: int,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get a specific project template."""
+    return await get_template_or_404(template_id, db)
+
+
+@router.post("/", response_model=ProjectTemplateResponse, status_code=status.HTTP_201_CREATED)
+async def create_project_template(
+    template_data: ProjectTemplateCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_pm_or_admin)
+):
+    """Create a project template."""
+    await check_template_name(db, template_data.name)
+    await check_template_references(db, template_data.contractor_ids, template_data.manual_template_id)
+    
+    template = ProjectTemplate(**template_data.model_dump(), created_by=current_user.id)
+    db.add(template)
+    await db.commit()
+    await db.refresh(template)
+    return template
+
+
+@router.post("/from-project/{project_id}", response_model=ProjectTemplateResponse, status_code=status.HTTP_201_CREATED)
+async def create_template_from_project(
+    project_id: int,
+    template_data: ProjectTemplateFromProject,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_pm_or_admin)
+):
+    """Save a project's areas, contractors and manual field values as a template."""
+    if not await db.get(Project, project_id):
+        raise HTTPException(status_code=404, detail="Project not found")
+    await check_template_name(db, template_data.name)
+    
+    areas = await db.scalars(
+        select(Area.name).where(Area.project_id == project_id).order_by(Area.order, Area.id)
+    )
+    contractor_ids = await db.scalars(
+        select(ProjectContractor.contractor_id)
+        .where(ProjectContractor.project_id == project_id)
+        .order_by(ProjectContractor.id)
+    )
+    manual = await db.scalar(select(ManualInstance).where(ManualInstance.project_id == project_id))
+    
+    template = ProjectTemplate(
+        **template_data.model_dump(),
+        areas=list(areas),
+        contractor_ids=list(contractor_ids),
+        manual_template_id=manual.template_id if manual else None,
+        manual_fields=manual.fields if manual else None,
+        created_by=current_user.id
+    )
+    db.add(template)
+    await db.commit()
+    await db.refresh(template)
+    return template
+
+
+@router.patch("/{template_id}", response_model=ProjectTemplateResponse)
+async def update_project_template(
+    template_id: int,
+    template_data: ProjectTemplateUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_pm_or_admin)
+):
+    """Update a project template."""
+    template = await get_template_or_404(template_id, db)
+    
+    update_data = template_data.model_dump(exclude_unset=True)
+    if update_data.get("name"):
+        await check_template_name(db, update_data["name"], template_id)
+    await check_template_references(db, update_data.get("contractor_ids"), update_data.get("manual_template_id"))
+    
+    for field, value in update_data.items():
+        setattr(template, field, value)
+    
+    await db.commit()
+    await db.refresh(template)
+    return template
+
+
+@router.delete("/{template_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_project_template(
+    template_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_pm_or_admin)
+):
+    """Delete a project template (projects created from it are unaffected)."""
+    template = await get_template_or_404(template_id, db)
+    await db.delete(template)
+    await db.commit()
@@ -1,55 +1,134 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from ..database import get_db
+from ..database import get_async_db, get_read_db
 from ..models.user import User
-from ..models.project import Project, ProjectStatus
-from ..models.area import Area, DEFAULT_AREAS
-from ..models.issue import Issue, IssueStatus, IssuePriority
+from ..models.project import Project, ProjectStatus, ProjectTemplate
+from ..models.issue import IssueStatus, IssuePriority
 from ..schemas.project import (
-    ProjectCreate, ProjectUpdate, ProjectResponse, ProjectListResponse, ProjectDashboard
+    ProjectCreate, ProjectUpdate, ProjectResponse, ProjectListResponse, ProjectDashboard,
+    ProjectPortfolioItem, ProjectPortfolioResponse, ProjectSetupOptions, ProjectBulkCreate
 )
 from ..utils.auth import get_current_user, require_pm_or_admin
+from ..utils.etags import not_modified, set_etag
+from ..utils.pagination import MAX_PAGE_SIZE, TotalMode, apply_cursor, count_total, order_newest_first, page_results
+from ..services import issue_counters, portfolio, project_revisions, project_setup, search_index
+from ..services.typeahead import project_typeahead_cache
 
 router = APIRouter(prefix="/api/projects", tags=["Projects"])
 
 
+def filter_projects(query, status: Optional[ProjectStatus], search: Optional[str]):
+    """Apply the project list's status and search filters."""
+    if status:
+        query = query.where(Project.status == status)
+    
+    if search:
+        search_term = f"%{search}%"
+        query = query.where(
+            (Project.name.ilike(search_term)) | (Project.address.ilike(search_term))
+        )
+    return query
+
+
+async def resolve_project_setup(db: AsyncSession, options: ProjectSetupOptions) -> project_setup.ProjectSetup:
+    """Areas, contractors and manual to give new projects, from a template, a project or the defaults."""
+    if options.template_id is not None and options.clone_from is not None:
+        raise HTTPException(status_code=400, detail="Use either a template or a project to clone, not both")
+    if options.template_id is not None:
+        template = await db.get(ProjectTemplate, options.template_id)
+        if not template:
+            raise HTTPException(status_code=400, detail="Project template not found")
+        return await project_setup.template_setup(db, template)
+    if options.clone_from is not None:
+        if not await db.get(Project, options.clone_from):
+            raise HTTPException(status_code=400, detail="Project to clone not found")
+        return await project_setup.clone_setup(db, options.clone_from)
+    return await project_setup.default_setup(
+        db, options.create_default_areas, options.assign_all_contractors
+    )
+
+
 @router.get("/", response_model=ProjectListResponse)
 async def list_projects(
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    total: TotalMode = TotalMode.EXACT,
     status: Optional[ProjectStatus] = None,
     search: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
-    """List all projects with optional filters."""
-    query = db.query(Project)
+    """List all projects with optional filters, newest first.
     
-    if status:
-        query = query.filter(Project.status == status)
+    Pass `next_cursor` from the previous page as `cursor` to continue.
+    """
+    query = filter_projects(select(Project), status, search)
     
-    if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            (Project.name.ilike(search_term)) | (Project.address.ilike(search_term))
-        )
+    total_count = await count_total(db, query, total)
     
-    total = query.count()
-    projects = query.order_by(Project.created_at.desc()).offset(skip).limit(limit).all()
+    page_query = order_newest_first(query, Project)
+    if cursor:
+        page_query = apply_cursor(page_query, Project, cursor, db)
+    elif skip:
+        page_query = page_query.offset(skip)
+    projects, next_cursor = await page_results(db, page_query, limit)
     
-    return ProjectListResponse(items=projects, total=total)
+    return ProjectListResponse(items=projects, total=total_count, next_cursor=next_cursor)
+
+
+@router.get("/portfolio", response_model=ProjectPortfolioResponse)
+async def get_portfolio(
+    status: Optional[ProjectStatus] = None,
+    search: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """All projects with issue counts, last activity and manual completeness.
+    
+    Aggregates come from grouped queries over all listed projects, so this
+    replaces one /dashboard call per project.
+    """
+    result = await db.execute(
+        order_newest_first(filter_projects(select(Project), status, search), Project)
+    )
+    projects = result.scalars().all()
+    
+    project_ids = filter_projects(select(Project.id), status, search)
+    issue_stats = await portfolio.issue_aggregates(db, project_ids)
+    issue_activity = await portfolio.last_issue_activity(db, project_ids)
+    manuals = await portfolio.manual_summaries(db, project_ids)
+    
+    items = []
+    for project in projects:
+        manual = manuals.get(project.id) or portfolio.empty_manual_summary()
+        activity = [
+            project.updated_at or project.created_at,
+            issue_activity.get(project.id),
+            manual["updated_at"],
+        ]
+        items.append(ProjectPortfolioItem(
+            **ProjectResponse.model_validate(project).model_dump(),
+            **issue_stats.get(project.id, {}),
+            last_activity_at=max((t for t in activity if t is not None), default=None),
+            manual_sections_completed=manual["completed"],
+            manual_sections_total=manual["total"],
+            manual_completion=round(manual["completed"] / manual["total"], 2) if manual["total"] else 0.0,
+        ))
+    
+    return ProjectPortfolioResponse(items=items, total=len(items))
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(
     project_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get a specific project."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     return project
@@ -58,36 +137,41 @@ async def get_project(
 @router.get("/{project_id}/dashboard", response_model=ProjectDashboard)
 async def get_project_dashboard(
     project_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get project dashboard with issue counts."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
+    """Get project dashboard with issue counts (304 when If-None-Match is current)."""
+    etag = await project_revisions.project_etag(db, project_id, "dashboard")
+    if etag is None:
         raise HTTPException(status_code=404, detail="Project not found")
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    set_etag(response, etag)
+    
+    project = await db.get(Project, project_id)
     
-    # Get issue counts by status
-    base_query = db.query(Issue).filter(Issue.project_id == project_id)
+    # Maintained counters - one indexed read instead of a COUNT per status
+    counts = await issue_counters.get_issue_counts(db, project_id)
     
-    total = base_query.count()
-    open_count = base_query.filter(Issue.status == IssueStatus.OPEN).count()
-    assigned_count = base_query.filter(Issue.status == IssueStatus.ASSIGNED).count()
-    in_progress = base_query.filter(Issue.status == IssueStatus.IN_PROGRESS).count()
-    ready_reinspect = base_query.filter(Issue.status == IssueStatus.READY_FOR_REINSPECT).count()
-    closed_count = base_query.filter(Issue.status == IssueStatus.CLOSED).count()
-    high_priority = base_query.filter(
-        Issue.priority == IssuePriority.HIGH,
-        Issue.status != IssueStatus.CLOSED
-    ).count()
+    def count_status(issue_status: IssueStatus) -> int:
+        return sum(n for (s, _), n in counts.items() if s == issue_status)
+    
+    high_priority = sum(
+        n for (s, p), n in counts.items()
+        if p == IssuePriority.HIGH and s != IssueStatus.CLOSED
+    )
     
     return ProjectDashboard(
         project=ProjectResponse.model_validate(project),
-        total_issues=total,
-        open_issues=open_count,
-        assigned_issues=assigned_count,
-        in_progress_issues=in_progress,
-        ready_for_reinspect=ready_reinspect,
-        closed_issues=closed_count,
+        total_issues=sum(counts.values()),
+        open_issues=count_status(IssueStatus.OPEN),
+        assigned_issues=count_status(IssueStatus.ASSIGNED),
+        in_progress_issues=count_status(IssueStatus.IN_PROGRESS),
+        ready_for_reinspect=count_status(IssueStatus.READY_FOR_REINSPECT),
+        closed_issues=count_status(IssueStatus.CLOSED),
         high_priority_open=high_priority
     )
 
@@ -97,56 +181,76 @@ async def create_project(
     project_data: ProjectCreate,
     create_default_areas: bool = Query(True, description="Create default areas"),
     assign_all_contractors: bool = Query(True, description="Assign all existing contractors"),
-    db: Session = Depends(get_db),
+    template_id: Optional[int] = Query(None, description="Set up areas, contractors and manual from a template"),
+    clone_from: Optional[int] = Query(None, description="Copy areas, contractors and manual from a project"),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin)
 ):
     """Create a new project with optional default areas and auto-assign contractors."""
-    from ..models.contractor import Contractor, ProjectContractor
+    setup = await resolve_project_setup(db, ProjectSetupOptions(
+        create_default_areas=create_default_areas,
+        assign_all_contractors=assign_all_contractors,
+        template_id=template_id,
+        clone_from=clone_from,
+    ))
     
     db_project = Project(
         **project_data.model_dump(),
         owner_id=current_user.id
     )
     db.add(db_project)
-    db.commit()
-    db.refresh(db_project)
-    
-    # Create default areas if requested
-    if create_default_areas:
-        for i, area_name in enumerate(DEFAULT_AREAS):
-            area = Area(
-                project_id=db_project.id,
-                name=area_name,
-                order=i,
-                is_custom=0
-            )
-            db.add(area)
-        db.commit()
-    
-    # Auto-assign all existing contractors if requested
-    if assign_all_contractors:
-        contractors = db.query(Contractor).filter(Contractor.is_active == 1).all()
-        for contractor in contractors:
-            project_contractor = ProjectContractor(
-                project_id=db_project.id,
-                contractor_id=contractor.id,
-                trades=contractor.trades or []
-            )
-            db.add(project_contractor)
-        db.commit()
-    
+    await db.flush()
+    await project_setup.apply_setup(db, [db_project.id], setup)
+    await search_index.index_project(db, db_project)
+    # Area suggestions for the new project id must not come from a stale entry
+    await project_typeahead_cache.invalidate(db, [db_project.id])
+    await db.commit()
+    await db.refresh(db_project)
     return db_project
 
 
+@router.post("/bulk", response_model=List[ProjectResponse], status_code=status.HTTP_201_CREATED)
+async def bulk_create_projects(
+    bulk_data: ProjectBulkCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_pm_or_admin)
+):
+    """Create many projects (e.g. every unit of a subdivision) in one transaction.
+    
+    All projects get the same setup. Projects, areas, contractor assignments
+    and manuals are each inserted with one multi-row statement.
+    """
+    setup = await resolve_project_setup(db, bulk_data)
+    
+    rows = [{**project.model_dump(), "owner_id": current_user.id} for project in bulk_data.projects]
+    is_sqlite = db.get_bind().dialect.name == "sqlite"
+    projects_table = Project.__table__
+    result = await db.execute(
+        insert(projects_table).returning(projects_table.c.id, sort_by_parameter_order=not is_sqlite), rows
+    )
+    ids = list(result.scalars())
+    if is_sqlite:
+        # See bulk_create_issues - SQLite assigns ascending rowids in insert order
+        ids.sort()
+    
+    await project_setup.apply_setup(db, ids, setup)
+    await search_index.index_documents(db, "project", ids)
+    await project_typeahead_cache.invalidate(db, ids)
+    await db.commit()
+    
+    result = await db.execute(select(Project).where(Project.id.in_(ids)).order_by(Project.id))
+    return result.scalars().all()
+
+
 @router.patch("/{project_id}", response_model=ProjectResponse)
 async def update_project(
     project_id: int,
     project_data: ProjectUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin)
 ):
     """Update a project."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
@@ -154,21 +258,25 @@ async def update_project(
     for field, value in update_data.items():
         setattr(project, field, value)
     
-    db.commit()
-    db.refresh(project)
+    await search_index.index_project(db, project)
+    await project_revisions.bump_project_revisions(db, project.id)
+    await db.commit()
+    await db.refresh(project)
     return project
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_project(
     project_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_pm_or_admin)
 ):
     """Delete a project and all related data."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    db.delete(project)
-    db.commit()
+    await search_index.remove_project_documents(db, project.id)
+    await project_typeahead_cache.invalidate(db, [project.id])
+    await db.delete(project)
+    await db.commit()
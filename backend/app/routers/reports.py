@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import Response
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from typing import Optional
-from ..database import get_db
+from ..database import get_read_db
 from ..models.user import User
 from ..models.project import Project
 from ..models.issue import Issue, IssueStatus
@@ -18,27 +20,29 @@ async def export_punch_list_pdf(
     group_by: str = Query("area", enum=["area", "trade", "priority"]),
     status: Optional[IssueStatus] = None,
     include_closed: bool = Query(False, description="Include closed issues"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
     pdf_service: PDFService = Depends(get_pdf_service)
 ):
     """Export punch list as PDF."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
     # Build query
-    query = db.query(Issue).filter(Issue.project_id == project_id)
+    query = select(Issue).where(Issue.project_id == project_id)
     
     if status:
-        query = query.filter(Issue.status == status)
+        query = query.where(Issue.status == status)
     elif not include_closed:
-        query = query.filter(Issue.status != IssueStatus.CLOSED)
+        query = query.where(Issue.status != IssueStatus.CLOSED)
     
-    issues = query.options(
+    result = await db.execute(query.options(
         joinedload(Issue.area),
-        joinedload(Issue.contractor)
-    ).all()
+        joinedload(Issue.contractor),
+        joinedload(Issue.trade_category)
+    ))
+    issues = result.scalars().all()
     
     # Generate PDF
     pdf_bytes = pdf_service.generate_punch_list_pdf(
@@ -47,10 +51,10 @@ async def export_punch_list_pdf(
         group_by=group_by
     )
     
-    filename = f"punch_list_{project.name.replace(' ', '_')}_{group_by}.pdf"
+    filename = f"punch_list_{project.name.replace(' ', '_')}_{group_by}.{pdf_service.file_extension}"
     
     return Response(
         content=pdf_bytes,
-        media_type="application/pdf",
+        media_type=pdf_service.media_type,
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from ..database import get_read_db
+from ..models.user import User
+from ..schemas.search import SearchKind, SearchResponse
+from ..services.search_index import search as search_documents
+from ..utils.auth import get_current_user
+
+router = APIRouter(prefix="/api/search", tags=["Search"])
+
+
+@router.get("/", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., min_length=1, description="Words to find (prefixes match too)"),
+    kind: Optional[List[SearchKind]] = Query(None, description="Restrict to these result kinds"),
+    project_id: Optional[int] = Query(None, description="Only the project and its issues"),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Full-text search over projects, issues and contractors, best matches first."""
+    kinds = [k.value for k in kind] if kind else None
+    items = await search_documents(db, q, kinds=kinds, project_id=project_id, limit=limit)
+    return SearchResponse(items=items)
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from ..database import get_read_db
+from ..models.user import User
+from ..schemas.typeahead import TypeaheadKind, TypeaheadResponse
+from ..services.typeahead import suggest
+from ..utils.auth import get_current_user
+
+router = APIRouter(prefix="/api/typeahead", tags=["Typeahead"])
+
+
+@router.get("/", response_model=TypeaheadResponse)
+async def typeahead(
+    q: str = "",
+    kind: Optional[List[TypeaheadKind]] = Query(None, description="Defaults to all kinds"),
+    project_id: Optional[int] = Query(
+        None, description="Required for area suggestions; limits contractor suggestions to its assignments"
+    ),
+    limit: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Prefix suggestions for pickers: contractors, a project's areas and issue categories."""
+    kinds = [k.value for k in kind] if kind else [k.value for k in TypeaheadKind]
+    items = await suggest(db, q, kinds, project_id=project_id, limit=limit)
+    return TypeaheadResponse(items=items)
@@ -1,10 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from ..database import get_db
+from ..database import get_async_db, get_read_db
+from ..models.issue import Issue
 from ..models.user import User, UserRole
 from ..schemas.user import UserCreate, UserUpdate, UserResponse
-from ..utils.auth import get_password_hash, get_current_user, require_admin
+from ..services.project_revisions import bump_project_revisions
+from ..utils.auth import (
+    get_password_hash, get_current_user, principal_cache, require_admin, revoke_refresh_tokens
+)
 
 router = APIRouter(prefix="/api/users", tags=["Users"])
 
@@ -13,18 +18,19 @@ router = APIRouter(prefix="/api/users", tags=["Users"])
 async def list_users(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_admin)
 ):
     """List all users (admin only)."""
-    users = db.query(User).offset(skip).limit(limit).all()
+    result = await db.execute(select(User).offset(skip).limit(limit))
+    users = result.scalars().all()
     return users
 
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get a specific user."""
@@ -35,7 +41,7 @@ async def get_user(
             detail="Not authorized to view this user"
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
@@ -44,11 +50,11 @@ async def get_user(
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def create_user(
     user_data: UserCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin)
 ):
     """Create a new user (admin only)."""
-    existing = db.query(User).filter(User.email == user_data.email).first()
+    existing = await db.scalar(select(User).where(User.email == user_data.email))
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
     
@@ -56,12 +62,12 @@ async def create_user(
         email=user_data.email,
         name=user_data.name,
         phone=user_data.phone,
-        password_hash=get_password_hash(user_data.password),
+        password_hash=await get_password_hash(user_data.password),
         role=user_data.role
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     return db_user
 
 
@@ -69,7 +75,7 @@ async def create_user(
 async def update_user(
     user_id: int,
     user_data: UserUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Update a user."""
@@ -80,7 +86,7 @@ async def update_user(
             detail="Not authorized to update this user"
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
@@ -92,24 +98,32 @@ async def update_user(
     
     # Hash password if being updated
     if "password" in update_data:
-        update_data["password_hash"] = get_password_hash(update_data.pop("password"))
+        update_data["password_hash"] = await get_password_hash(update_data.pop("password"))
     
     for field, value in update_data.items():
         setattr(user, field, value)
     
-    db.commit()
-    db.refresh(user)
+    if "password_hash" in update_data or update_data.get("is_active") == 0:
+        await revoke_refresh_tokens(db, user_id=user.id)
+    if "name" in update_data:
+        # Issue lists show creator names
+        await bump_project_revisions(db, select(Issue.project_id).where(Issue.created_by == user.id))
+    
+    # Role, active flag and password changes must reach every worker's cache
+    await principal_cache.invalidate(db)
+    await db.commit()
+    await db.refresh(user)
     return user
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin)
 ):
     """Delete a user (admin only)."""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
@@ -117,5 +131,7 @@ async def delete_user(
     if user.id == current_user.id:
         raise HTTPException(status_code=400, detail="Cannot delete yourself")
     
-    db.delete(user)
-    db.commit()
+    await bump_project_revisions(db, select(Issue.project_id).where(Issue.created_by == user.id))
+    await db.delete(user)
+    await principal_cache.invalidate(db)
+    await db.commit()
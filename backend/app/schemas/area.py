@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -25,3 +25,20 @@ class AreaResponse(AreaBase):
     
     class Config:
         from_attributes = True
+
+
+class AreaRename(BaseModel):
+    id: int
+    name: str
+
+
+class AreaBulkOperation(BaseModel):
+    """Changes applied to a project's areas in one transaction.
+
+    Deletes run first, then renames and the reorder (`order` lists existing
+    area ids in their new order); created areas are appended at the end.
+    """
+    create: List[AreaCreate] = Field(default_factory=list, max_length=500)
+    rename: List[AreaRename] = Field(default_factory=list, max_length=500)
+    delete: List[int] = Field(default_factory=list, max_length=500)
+    order: Optional[List[int]] = None
@@ -91,7 +91,8 @@ class ContractorResponse(BaseModel):
 
 class ProjectContractorCreate(BaseModel):
     contractor_id: int
-    trades: List[str] = []
+    trade_ids: Optional[List[int]] = None
+    trades: List[str] = []  # Trade names (older clients)
     notes: Optional[str] = None
 
 
@@ -100,7 +101,8 @@ class ProjectContractorResponse(BaseModel):
     project_id: int
     contractor_id: int
     contractor: ContractorResponse
-    trades: List[str]
+    trade_ids: List[int] = []
+    trades: List[str] = []
     notes: Optional[str] = None
     created_at: Optional[datetime] = None
     
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import date, datetime
 from ..models.issue import IssuePriority, IssueStatus, PhotoType
@@ -29,6 +29,7 @@ class IssueBase(BaseModel):
     description: Optional[str] = None
     priority: IssuePriority = IssuePriority.MEDIUM
     trade: Optional[str] = None
+    trade_id: Optional[int] = None
     contractor_id: Optional[int] = None
     due_date: Optional[date] = None
 
@@ -37,6 +38,58 @@ class IssueCreate(IssueBase):
     project_id: Optional[int] = None  # Can be set from path
 
 
+class IssueBulkCreate(BaseModel):
+    items: List[IssueCreate] = Field(..., min_length=1, max_length=500)
+
+
+class IssueBulkItemResult(BaseModel):
+    index: int  # Position in the request's items
+    id: Optional[int] = None  # Set when created
+    error: Optional[str] = None
+
+
+class IssueBulkCreateResponse(BaseModel):
+    created: int
+    failed: int
+    results: List[IssueBulkItemResult]
+
+
+class IssueBulkFilter(BaseModel):
+    """Same filters as the issue list."""
+    status: Optional[IssueStatus] = None
+    priority: Optional[IssuePriority] = None
+    area_id: Optional[int] = None
+    contractor_id: Optional[int] = None
+    trade_id: Optional[int] = None
+
+
+class IssueBulkSelection(BaseModel):
+    # Either explicit ids or a filter over the project's issues
+    issue_ids: Optional[List[int]] = Field(None, max_length=1000)
+    filter: Optional[IssueBulkFilter] = None
+
+
+class IssueBulkStatusUpdate(IssueBulkSelection):
+    status: IssueStatus
+    notes: Optional[str] = None
+
+
+class IssueBulkAssign(IssueBulkSelection):
+    contractor_id: Optional[int] = None  # None unassigns
+
+
+class IssueBulkSkipped(BaseModel):
+    id: int
+    error: str
+
+
+class IssueBulkUpdateResponse(BaseModel):
+    matched: int
+    updated: int
+    skipped: List[IssueBulkSkipped] = []
+    not_found: List[int] = []  # Requested ids that aren't issues of the project
+
+
 class IssueUpdate(BaseModel):
     area_id: Optional[int] = None
     category: Optional[str] = None
@@ -44,6 +97,7 @@ class IssueUpdate(BaseModel):
     description: Optional[str] = None
     priority: Optional[IssuePriority] = None
     trade: Optional[str] = None
+    trade_id: Optional[int] = None
     contractor_id: Optional[int] = None
     due_date: Optional[date] = None
 
@@ -56,6 +110,7 @@ class IssueStatusUpdate(BaseModel):
 class IssueResponse(IssueBase):
     id: int
     project_id: int
+    area_id: Optional[int] = None  # None once the issue's area is deleted
     status: IssueStatus
     resolution_notes: Optional[str] = None
     created_by: Optional[int] = None
@@ -77,4 +132,5 @@ class IssueResponse(IssueBase):
 
 class IssueListResponse(BaseModel):
     items: List[IssueResponse]
-    total: int
+    total: Optional[int] = None  # None when requested with total=none
+    next_cursor: Optional[str] = None
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, Field
+from typing import Any, Dict, Optional, List
 from datetime import date, datetime
 from ..models.project import ProjectStatus
 
@@ -38,6 +38,24 @@ class ProjectResponse(ProjectBase):
 
 class ProjectListResponse(BaseModel):
     items: List[ProjectResponse]
+    total: Optional[int] = None  # None when requested with total=none
+    next_cursor: Optional[str] = None
+
+
+class ProjectPortfolioItem(ProjectResponse):
+    total_issues: int = 0
+    open_issues: int = 0
+    high_priority_open: int = 0
+    ready_for_reinspect: int = 0
+    closed_issues: int = 0
+    last_activity_at: Optional[datetime] = None
+    manual_sections_completed: int = 0
+    manual_sections_total: int = 0
+    manual_completion: float = 0.0  # 0-1
+
+
+class ProjectPortfolioResponse(BaseModel):
+    items: List[ProjectPortfolioItem]
     total: int
 
 
@@ -50,3 +68,56 @@ class ProjectDashboard(BaseModel):
     ready_for_reinspect: int
     closed_issues: int
     high_priority_open: int
+
+
+class ProjectSetupOptions(BaseModel):
+    """How new projects are populated.
+
+    `template_id` and `clone_from` are mutually exclusive and take the place
+    of the default areas / all contractors flags.
+    """
+    create_default_areas: bool = True
+    assign_all_contractors: bool = True
+    template_id: Optional[int] = None
+    clone_from: Optional[int] = None  # Copy areas, contractors and manual from this project
+
+
+class ProjectBulkCreate(ProjectSetupOptions):
+    projects: List[ProjectCreate] = Field(..., min_length=1, max_length=200)
+
+
+class ProjectTemplateBase(BaseModel):
+    name: str
+    description: Optional[str] = None
+    areas: List[str] = []
+    contractor_ids: Optional[List[int]] = None  # None = all active contractors
+    manual_template_id: Optional[int] = None
+    manual_fields: Optional[Dict[str, Any]] = None
+
+
+class ProjectTemplateCreate(ProjectTemplateBase):
+    pass
+
+
+class ProjectTemplateFromProject(BaseModel):
+    name: str
+    description: Optional[str] = None
+
+
+class ProjectTemplateUpdate(BaseModel):
+    name: Optional[str] = None
+    description: Optional[str] = None
+    areas: Optional[List[str]] = None
+    contractor_ids: Optional[List[int]] = None
+    manual_template_id: Optional[int] = None
+    manual_fields: Optional[Dict[str, Any]] = None
+
+
+class ProjectTemplateResponse(ProjectTemplateBase):
+    id: int
+    created_by: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+from typing import Optional, List
+import enum
+
+
+class SearchKind(str, enum.Enum):
+    PROJECT = "project"
+    ISSUE = "issue"
+    CONTRACTOR = "contractor"
+
+
+class SearchResult(BaseModel):
+    kind: SearchKind
+    id: int
+    project_id: Optional[int] = None  # None for contractors
+    title: str
+    snippet: Optional[str] = None  # Matched words wrapped in **
+    rank: float
+
+
+class SearchResponse(BaseModel):
+    items: List[SearchResult]
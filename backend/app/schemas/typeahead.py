@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+from typing import Optional, List
+import enum
+
+
+class TypeaheadKind(str, enum.Enum):
+    CONTRACTOR = "contractor"
+    AREA = "area"
+    CATEGORY = "category"
+
+
+class TypeaheadItem(BaseModel):
+    kind: TypeaheadKind
+    id: Optional[int] = None  # None for categories
+    label: str
+    detail: Optional[str] = None  # Contact name for contractors
+
+
+class TypeaheadResponse(BaseModel):
+    items: List[TypeaheadItem]
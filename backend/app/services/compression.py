@@ -0,0 +1,172 @@
+import zlib
+from typing import Optional
+from ..config import get_settings
+
+# Brotli is a dependency, but responses fall back to gzip if it's missing
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+settings = get_settings()
+
+# Content types that are already compressed (photos, PDFs, archives)
+INCOMPRESSIBLE_TYPES = (
+    "image/",
+    "video/",
+    "audio/",
+    "font/woff",
+    "application/pdf",
+    "application/zip",
+    "application/gzip",
+    "application/octet-stream",
+    "text/event-stream",
+)
+
+# Responses without a body, or with a byte range that compression would break
+SKIPPED_STATUSES = {204, 206, 304}
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Best supported coding in an Accept-Encoding header ("br", "gzip" or None)."""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+
+    def acceptable(coding: str) -> bool:
+        return accepted.get(coding, accepted.get("*", 0.0)) > 0
+
+    if BROTLI_AVAILABLE and acceptable("br"):
+        return "br"
+    if acceptable("gzip"):
+        return "gzip"
+    return None
+
+
+class _Compressor:
+    """Streaming encoder for one response body."""
+
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._encoder = brotli.Compressor(quality=settings.compression_brotli_quality)
+            self._compress = self._encoder.process
+            self._finish = self._encoder.finish
+        else:
+            self._encoder = zlib.compressobj(settings.compression_gzip_level, zlib.DEFLATED, 31)
+            self._compress = self._encoder.compress
+            self._finish = self._encoder.flush
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        body = self._compress(data) if data else b""
+        return body + self._finish() if final else body
+
+
+class CompressionMiddleware:
+    """Negotiated gzip/brotli compression of text responses (JSON, HTML reports).
+
+    Bodies below COMPRESSION_MIN_SIZE, already compressed content types and
+    responses that already carry a Content-Encoding are sent unchanged.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = ""
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+        encoding = choose_encoding(accept_encoding)
+
+        start_message = None
+        compressor: Optional[_Compressor] = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, compressor, passthrough
+            if message["type"] == "http.response.start":
+                headers = message.get("headers", [])
+                eligible = message["status"] not in SKIPPED_STATUSES and self._compressible(headers)
+                if eligible:
+                    message = {**message, "headers": self._add_vary(headers)}
+                if not eligible or encoding is None:
+                    passthrough = True
+                    await send(message)
+                else:
+                    # Held until the first body chunk shows whether it's worth compressing
+                    start_message = message
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                if not more_body and len(body) < settings.compression_min_size:
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+                compressor = _Compressor(encoding)
+                await send({**start_message, "headers": self._encoded_headers(start_message["headers"], encoding)})
+
+            await send({
+                "type": "http.response.body",
+                "body": compressor.compress(body, final=not more_body),
+                "more_body": more_body,
+            })
+
+        await self.app(scope, receive, send_compressed)
+
+    @staticmethod
+    def _compressible(headers) -> bool:
+        content_type = ""
+        for name, value in headers:
+            name = name.lower()
+            if name == b"content-encoding":
+                return False
+            if name == b"content-type":
+                content_type = value.decode("latin-1").lower()
+        return bool(content_type) and not content_type.startswith(INCOMPRESSIBLE_TYPES)
+
+    @staticmethod
+    def _add_vary(headers):
+        headers = list(headers)
+        for i, (name, value) in enumerate(headers):
+            if name.lower() == b"vary":
+                if b"accept-encoding" not in value.lower():
+                    headers[i] = (name, value + b", Accept-Encoding")
+                return headers
+        headers.append((b"vary", b"Accept-Encoding"))
+        return headers
+
+    @staticmethod
+    def _encoded_headers(headers, encoding: str):
+        """Headers for the compressed body: no Content-Length, strong ETags made weak."""
+        result = []
+        for name, value in headers:
+            lowered = name.lower()
+            if lowered == b"content-length":
+                continue
+            if lowered == b"etag" and not value.startswith(b"W/"):
+                value = b"W/" + value
+            result.append((name, value))
+        result.append((b"content-encoding", encoding.encode()))
+        return result
@@ -0,0 +1,82 @@
+from typing import Dict, Optional, Tuple
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..database import UPSERT_INSERTS
+from ..models.issue import Issue, IssueStatus, IssuePriority, ProjectIssueCounter
+from ..models.project import Project
+from .project_revisions import bump_project_revisions
+
+CounterKey = Tuple[IssueStatus, IssuePriority]
+
+
+async def adjust_issue_counter(
+    db: AsyncSession,
+    project_id: int,
+    status: IssueStatus,
+    priority: IssuePriority,
+    delta: int
+):
+    """Add `delta` to one counter row in the session's transaction (atomic upsert)."""
+    stmt = UPSERT_INSERTS[db.get_bind().dialect.name](ProjectIssueCounter)
+    stmt = stmt.values(project_id=project_id, status=status, priority=priority, count=delta)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["project_id", "status", "priority"],
+        set_={"count": ProjectIssueCounter.count + delta},
+    )
+    await db.execute(stmt)
+
+
+async def adjust_issue_counters(db: AsyncSession, deltas: Dict[Tuple[int, IssueStatus, IssuePriority], int]):
+    """Apply several counter changes keyed by (project_id, status, priority), one upsert each."""
+    for (project_id, status, priority), delta in deltas.items():
+        if delta:
+            await adjust_issue_counter(db, project_id, status, priority, delta)
+
+
+async def issue_created(db: AsyncSession, issue: Issue):
+    await adjust_issue_counter(db, issue.project_id, issue.status, issue.priority, 1)
+
+
+async def issue_deleted(db: AsyncSession, issue: Issue):
+    await adjust_issue_counter(db, issue.project_id, issue.status, issue.priority, -1)
+
+
+async def issue_moved(db: AsyncSession, issue: Issue, old_status: IssueStatus, old_priority: IssuePriority):
+    """Move an issue between counters after its status and/or priority changed."""
+    if (old_status, old_priority) == (issue.status, issue.priority):
+        return
+    await adjust_issue_counter(db, issue.project_id, old_status, old_priority, -1)
+    await adjust_issue_counter(db, issue.project_id, issue.status, issue.priority, 1)
+
+
+async def get_issue_counts(db: AsyncSession, project_id: int) -> Dict[CounterKey, int]:
+    result = await db.execute(
+        select(ProjectIssueCounter.status, ProjectIssueCounter.priority, ProjectIssueCounter.count)
+        .where(ProjectIssueCounter.project_id == project_id)
+    )
+    return {(status, priority): count for status, priority, count in result.all()}
+
+
+async def rebuild_issue_counters(db: AsyncSession, project_id: Optional[int] = None) -> int:
+    """Recompute counters from the issues table (all projects, or just one).
+
+    Also bumps the projects' revisions so clients drop cached dashboards.
+    Returns the number of counter rows written. The caller commits.
+    """
+    clear = delete(ProjectIssueCounter)
+    grouped = (
+        select(Issue.project_id, Issue.status, Issue.priority, func.count(Issue.id))
+        .group_by(Issue.project_id, Issue.status, Issue.priority)
+    )
+    if project_id is not None:
+        clear = clear.where(ProjectIssueCounter.project_id == project_id)
+        grouped = grouped.where(Issue.project_id == project_id)
+    
+    await db.execute(clear)
+    result = await db.execute(
+        insert(ProjectIssueCounter).from_select(
+            ["project_id", "status", "priority", "count"], grouped
+        )
+    )
+    await bump_project_revisions(db, project_id if project_id is not None else select(Project.id))
+    return result.rowcount
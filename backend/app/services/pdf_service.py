@@ -27,6 +27,9 @@ class PDFService:
     def __init__(self):
         self.output_dir = os.path.join(settings.upload_dir, "reports")
         os.makedirs(self.output_dir, exist_ok=True)
+        # Reports are HTML when WeasyPrint isn't installed
+        self.media_type = "application/pdf" if WEASYPRINT_AVAILABLE else "text/html"
+        self.file_extension = "pdf" if WEASYPRINT_AVAILABLE else "html"
     
     def generate_punch_list_pdf(
         self,
@@ -90,7 +93,8 @@ class PDFService:
             if group_by == "area":
                 key = issue.area.name if issue.area else "Unassigned"
             elif group_by == "trade":
-                key = issue.trade or "Unassigned"
+                # Linked issues group by trade id under the trade's current name
+                key = issue.trade_category.name if issue.trade_category else (issue.trade or "Unassigned")
             elif group_by == "priority":
                 key = issue.priority.value.upper() if issue.priority else "MEDIUM"
             else:
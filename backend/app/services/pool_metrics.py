@@ -0,0 +1,95 @@
+import threading
+import time
+from typing import Dict, Type
+from sqlalchemy import exc
+from sqlalchemy.pool import Pool, QueuePool
+
+
+class PoolMetrics:
+    """Running statistics for a connection pool (checkouts, overflow, wait time)."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear accumulated counters (pool gauges are read live)."""
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.wait_total = 0.0
+            self.wait_max = 0.0
+            self.peak_checked_out = 0
+
+    def record_checkout(self, wait: float, checked_out: int):
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+
+    def record_timeout(self, wait: float):
+        with self._lock:
+            self.timeouts += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+
+    def snapshot(self, pool: Pool) -> dict:
+        """Combine live pool gauges with the accumulated wait statistics."""
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            data = {
+                "name": self.name,
+                "pool_class": type(pool).__name__,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "peak_checked_out": self.peak_checked_out,
+                # Same precision throughout, so the rounded average never exceeds the max
+                "wait_ms_total": round(self.wait_total * 1000, 3),
+                "wait_ms_avg": round(self.wait_total * 1000 / attempts, 3) if attempts else 0.0,
+                "wait_ms_max": round(self.wait_max * 1000, 3),
+            }
+        if isinstance(pool, QueuePool):
+            data.update({
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "open_connections": pool.checkedin() + pool.checkedout(),
+                # QueuePool counts overflow from -size until the pool is full
+                "overflow": max(pool.overflow(), 0),
+                "max_overflow": pool._max_overflow,
+                "timeout": pool.timeout(),
+            })
+        return data
+
+
+class InstrumentedPoolMixin:
+    """Times every checkout so pool pressure shows up as wait time, not just errors."""
+
+    metrics: PoolMetrics
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.record_timeout(time.perf_counter() - start)
+            raise
+        checked_out = self.checkedout() if isinstance(self, QueuePool) else 0
+        self.metrics.record_checkout(time.perf_counter() - start, checked_out)
+        return connection
+
+
+# Metrics per named pool, kept across pool re-creation (engine.dispose())
+_registry: Dict[str, PoolMetrics] = {}
+
+
+def instrumented_pool_class(base: Type[Pool], name: str) -> Type[Pool]:
+    """Build a pool class that reports into the metrics registered under `name`."""
+    metrics = _registry.setdefault(name, PoolMetrics(name))
+    return type(f"Instrumented{base.__name__}", (InstrumentedPoolMixin, base), {"metrics": metrics})
+
+
+def get_pool_metrics() -> Dict[str, PoolMetrics]:
+    return _registry
@@ -0,0 +1,97 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy import Select, case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..models.issue import Issue, IssueStatus, IssuePriority, ProjectIssueCounter
+from ..models.manual import ManualTemplate, ManualInstance, DEFAULT_MANUAL_SECTIONS
+
+# Keys of pre-seeded list items (default_items) that don't count as filled in
+PLACEHOLDER_KEYS = {"item", "example"}
+
+
+def _has_content(value) -> bool:
+    if isinstance(value, dict):
+        return any(_has_content(v) for k, v in value.items() if k not in PLACEHOLDER_KEYS)
+    if isinstance(value, list):
+        return any(_has_content(v) for v in value)
+    if isinstance(value, str):
+        return bool(value.strip())
+    return value is not None and value is not False
+
+
+def manual_progress(sections: List[dict], fields: Optional[dict], attachments: Optional[list]) -> tuple:
+    """(completed, total) manual sections - a section counts once it has any
+    filled-in value or an attachment."""
+    fields = fields or {}
+    attached = {a.get("section") for a in attachments or [] if isinstance(a, dict)}
+    completed = sum(
+        1 for section in sections
+        if section.get("id") in attached or _has_content(fields.get(section.get("id")))
+    )
+    return completed, len(sections)
+
+
+def empty_manual_summary() -> dict:
+    """Summary for a project whose manual hasn't been started."""
+    return {"completed": 0, "total": len(DEFAULT_MANUAL_SECTIONS), "updated_at": None}
+
+
+async def issue_aggregates(db: AsyncSession, project_ids: Select) -> Dict[int, dict]:
+    """Dashboard counts for many projects in one grouped read of the issue counters."""
+    counter = ProjectIssueCounter
+    
+    def total_where(condition):
+        return func.sum(case((condition, counter.count), else_=0))
+    
+    result = await db.execute(
+        select(
+            counter.project_id,
+            func.sum(counter.count),
+            total_where(counter.status == IssueStatus.OPEN),
+            total_where((counter.priority == IssuePriority.HIGH) & (counter.status != IssueStatus.CLOSED)),
+            total_where(counter.status == IssueStatus.READY_FOR_REINSPECT),
+            total_where(counter.status == IssueStatus.CLOSED),
+        )
+        .where(counter.project_id.in_(project_ids))
+        .group_by(counter.project_id)
+    )
+    return {
+        row[0]: {
+            "total_issues": int(row[1] or 0),
+            "open_issues": int(row[2] or 0),
+            "high_priority_open": int(row[3] or 0),
+            "ready_for_reinspect": int(row[4] or 0),
+            "closed_issues": int(row[5] or 0),
+        }
+        for row in result.all()
+    }
+
+
+async def last_issue_activity(db: AsyncSession, project_ids: Select) -> Dict[int, datetime]:
+    """Latest issue create/update time per project."""
+    result = await db.execute(
+        select(Issue.project_id, func.max(func.coalesce(Issue.updated_at, Issue.created_at)))
+        .where(Issue.project_id.in_(project_ids))
+        .group_by(Issue.project_id)
+    )
+    return dict(result.all())
+
+
+async def manual_summaries(db: AsyncSession, project_ids: Select) -> Dict[int, dict]:
+    """Manual completeness and last update per project, from one joined read."""
+    result = await db.execute(
+        select(
+            ManualInstance.project_id,
+            ManualInstance.fields,
+            ManualInstance.attachments,
+            func.coalesce(ManualInstance.updated_at, ManualInstance.created_at),
+            ManualTemplate.sections,
+        )
+        .outerjoin(ManualTemplate, ManualTemplate.id == ManualInstance.template_id)
+        .where(ManualInstance.project_id.in_(project_ids))
+    )
+    summaries = {}
+    for project_id, fields, attachments, updated_at, template_sections in result.all():
+        completed, total = manual_progress(template_sections or DEFAULT_MANUAL_SECTIONS, fields, attachments)
+        summaries[project_id] = {"completed": completed, "total": total, "updated_at": updated_at}
+    return summaries
@@ -0,0 +1,29 @@
+from typing import Optional, Union
+from sqlalchemy import Select, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..models.project import Project
+
+
+async def bump_project_revisions(db: AsyncSession, project_ids: Union[int, Select]):
+    """Mark projects as changed, for ETags on their issue list, dashboard and manual.
+
+    `project_ids` is one id or a SELECT of project ids (e.g. the projects with
+    issues assigned to a renamed contractor). Call this in the transaction of
+    every write that changes what those endpoints return.
+    """
+    condition = Project.id == project_ids if isinstance(project_ids, int) else Project.id.in_(project_ids)
+    await db.execute(
+        update(Project)
+        .where(condition)
+        # Keep updated_at - it's the project's own last edit
+        .values(revision=Project.revision + 1, updated_at=Project.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def project_etag(db: AsyncSession, project_id: int, resource: str) -> Optional[str]:
+    """Weak ETag of a project-scoped resource, or None if the project doesn't exist."""
+    revision = await db.scalar(select(Project.revision).where(Project.id == project_id))
+    if revision is None:
+        return None
+    return f'W/"{resource}-{project_id}-{revision}"'
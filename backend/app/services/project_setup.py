@@ -0,0 +1,144 @@
+from typing import List, Optional
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..models.area import Area, DEFAULT_AREAS
+from ..models.contractor import Contractor, ProjectContractor, ProjectContractorTrade
+from ..models.manual import ManualInstance
+from ..models.project import ProjectTemplate
+
+
+class ProjectSetup:
+    """Rows copied into every new project: areas, contractor assignments and a manual."""
+
+    def __init__(
+        self,
+        areas: Optional[List[dict]] = None,
+        contractors: Optional[List[dict]] = None,
+        manual: Optional[dict] = None
+    ):
+        self.areas = areas or []  # name, order, is_custom
+        self.contractors = contractors or []  # contractor_id, trade_ids, notes
+        self.manual = manual  # template_id, fields
+
+
+async def contractor_assignments(
+    db: AsyncSession,
+    contractor_ids: Optional[List[int]] = None
+) -> List[dict]:
+    """Assignments for active contractors (all, or only `contractor_ids`) with their linked trades."""
+    query = select(Contractor).where(Contractor.is_active == 1).order_by(Contractor.id)
+    if contractor_ids is not None:
+        if not contractor_ids:
+            return []
+        query = query.where(Contractor.id.in_(contractor_ids))
+    result = await db.execute(query)
+    return [
+        {"contractor_id": contractor.id, "trade_ids": contractor.trade_ids, "notes": None}
+        for contractor in result.scalars()
+    ]
+
+
+async def default_setup(
+    db: AsyncSession,
+    create_default_areas: bool,
+    assign_all_contractors: bool
+) -> ProjectSetup:
+    areas = []
+    if create_default_areas:
+        areas = [{"name": name, "order": i, "is_custom": 0} for i, name in enumerate(DEFAULT_AREAS)]
+    contractors = await contractor_assignments(db) if assign_all_contractors else []
+    return ProjectSetup(areas, contractors)
+
+
+async def template_setup(db: AsyncSession, template: ProjectTemplate) -> ProjectSetup:
+    areas = [
+        {"name": name, "order": i, "is_custom": 0 if name in DEFAULT_AREAS else 1}
+        for i, name in enumerate(template.areas or [])
+    ]
+    contractors = await contractor_assignments(db, template.contractor_ids)
+    manual = None
+    if template.manual_template_id is not None or template.manual_fields:
+        manual = {"template_id": template.manual_template_id, "fields": template.manual_fields or {}}
+    return ProjectSetup(areas, contractors, manual)
+
+
+async def clone_setup(db: AsyncSession, project_id: int) -> ProjectSetup:
+    """Setup copied from an existing project (attachments and issues are not copied)."""
+    areas = await db.execute(
+        select(Area.name, Area.order, Area.is_custom)
+        .where(Area.project_id == project_id)
+        .order_by(Area.order, Area.id)
+    )
+    contractors = await db.execute(
+        select(ProjectContractor.id, ProjectContractor.contractor_id, ProjectContractor.notes)
+        .where(ProjectContractor.project_id == project_id)
+        .order_by(ProjectContractor.id)
+    )
+    trade_links = await db.execute(
+        select(ProjectContractorTrade.project_contractor_id, ProjectContractorTrade.trade_id)
+        .join(ProjectContractor, ProjectContractor.id == ProjectContractorTrade.project_contractor_id)
+        .where(ProjectContractor.project_id == project_id)
+        .order_by(ProjectContractorTrade.project_contractor_id, ProjectContractorTrade.position)
+    )
+    trade_ids = {}
+    for assignment_id, trade_id in trade_links:
+        trade_ids.setdefault(assignment_id, []).append(trade_id)
+    manual = await db.execute(
+        select(ManualInstance.template_id, ManualInstance.fields)
+        .where(ManualInstance.project_id == project_id)
+    )
+    manual = manual.mappings().first()
+    return ProjectSetup(
+        [dict(row) for row in areas.mappings()],
+        [
+            {"contractor_id": row.contractor_id, "trade_ids": trade_ids.get(row.id, []), "notes": row.notes}
+            for row in contractors
+        ],
+        dict(manual) if manual else None,
+    )
+
+
+async def apply_setup(db: AsyncSession, project_ids: List[int], setup: ProjectSetup):
+    """Insert the setup's rows for each project, one multi-row statement per table.
+
+    Core table inserts, so the rows don't go through the unit of work. The
+    caller commits.
+    """
+    if setup.areas:
+        await db.execute(insert(Area.__table__), [
+            {"project_id": project_id, **area}
+            for project_id in project_ids for area in setup.areas
+        ])
+    if setup.contractors:
+        await db.execute(insert(ProjectContractor.__table__), [
+            {"project_id": project_id, "contractor_id": assignment["contractor_id"], "notes": assignment["notes"]}
+            for project_id in project_ids for assignment in setup.contractors
+        ])
+        await _insert_trade_links(db, project_ids, setup.contractors)
+    if setup.manual is not None:
+        await db.execute(insert(ManualInstance.__table__), [
+            {"project_id": project_id, "attachments": [], **setup.manual}
+            for project_id in project_ids
+        ])
+
+
+async def _insert_trade_links(db: AsyncSession, project_ids: List[int], contractors: List[dict]):
+    """Link the new assignments to their trades (one contractor per project, so
+    (project_id, contractor_id) identifies each new assignment)."""
+    trade_ids = {
+        assignment["contractor_id"]: assignment["trade_ids"]
+        for assignment in contractors if assignment["trade_ids"]
+    }
+    if not trade_ids:
+        return
+    assignments = await db.execute(
+        select(ProjectContractor.id, ProjectContractor.contractor_id)
+        .where(ProjectContractor.project_id.in_(project_ids))
+    )
+    links = [
+        {"project_contractor_id": assignment_id, "trade_id": trade_id, "position": position}
+        for assignment_id, contractor_id in assignments
+        for position, trade_id in enumerate(trade_ids.get(contractor_id, []))
+    ]
+    if links:
+        await db.execute(insert(ProjectContractorTrade.__table__), links)
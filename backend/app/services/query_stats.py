@@ -0,0 +1,112 @@
+import json
+import logging
+import time
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from ..config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger("blue_tape.sql")
+
+# Statements kept per request for the threshold warning
+MAX_RECORDED_STATEMENTS = 100
+
+
+class QueryStats:
+    """SQL statements executed while handling one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.statements: List[Tuple[str, float]] = []
+
+    def record(self, statement: str, duration: float):
+        self.count += 1
+        self.total_time += duration
+        if len(self.statements) < MAX_RECORDED_STATEMENTS:
+            self.statements.append((" ".join(statement.split())[:300], duration))
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_stats_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - context._query_stats_start)
+
+
+def track_queries(engine: Engine):
+    """Count statements and DB time on `engine` into the current request's stats."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryStatsMiddleware:
+    """Adds a Server-Timing header with the request's SQL statement count and DB
+    time, logs a structured line per request, and warns with the statement list
+    when SQL_QUERY_WARN_THRESHOLD is exceeded."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current.set(stats)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed = (time.perf_counter() - start) * 1000
+                headers = list(message.get("headers", []))
+                headers.append((
+                    b"server-timing",
+                    (f'db;dur={stats.total_time * 1000:.1f};desc="{stats.count} queries", '
+                     f"app;dur={elapsed:.1f}").encode(),
+                ))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            self._log(scope, status_code, stats, time.perf_counter() - start)
+
+    @staticmethod
+    def _log(scope, status_code: int, stats: QueryStats, elapsed: float):
+        if stats.count == 0:
+            return
+        record = {
+            "method": scope["method"],
+            "path": scope["path"],
+            "status": status_code,
+            "queries": stats.count,
+            "db_ms": round(stats.total_time * 1000, 1),
+            "total_ms": round(elapsed * 1000, 1),
+        }
+        threshold = settings.sql_query_warn_threshold
+        if threshold and stats.count > threshold:
+            record["statements"] = [
+                {"sql": sql, "ms": round(duration * 1000, 2)} for sql, duration in stats.statements
+            ]
+            logger.warning("sql query threshold exceeded %s", json.dumps(record))
+        else:
+            logger.info("sql %s", json.dumps(record))
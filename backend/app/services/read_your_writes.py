@@ -0,0 +1,67 @@
+import math
+import time
+from typing import Optional
+from starlette.requests import HTTPConnection
+from ..config import get_settings
+
+settings = get_settings()
+
+# Time of the client's last committed write, in epoch milliseconds. Sent back
+# on responses to writes; clients echo the header (or the cookie) on later requests.
+LAST_WRITE_HEADER = "X-Last-Write"
+LAST_WRITE_COOKIE = "last_write"
+
+
+def request_last_write(request: HTTPConnection) -> Optional[float]:
+    """Last write time (epoch seconds) the client reported, if any.
+
+    Clients can send any value - it only decides whether the request's reads
+    may go to a replica, so it isn't signed.
+    """
+    value = request.headers.get(LAST_WRITE_HEADER) or request.cookies.get(LAST_WRITE_COOKIE)
+    try:
+        last_write = float(value) / 1000
+    except (TypeError, ValueError):
+        return None
+    return last_write if math.isfinite(last_write) else None
+
+
+def wrote_recently(last_write: Optional[float]) -> bool:
+    """Whether a write at `last_write` is still inside the read-your-writes window.
+
+    Works across workers and hosts since the time travels with the client;
+    values in the future (clock skew, tampering) count for one window at most.
+    """
+    if last_write is None:
+        return False
+    return abs(time.time() - last_write) < settings.replica_read_your_writes_seconds
+
+
+class ReadYourWritesMiddleware:
+    """Adds the X-Last-Write header and cookie to responses of requests that
+    committed a write on the primary (see database.get_async_db)."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_last_write(message):
+            if message["type"] == "http.response.start":
+                last_write = scope.get("state", {}).get("last_write")
+                if last_write is not None:
+                    value = str(int(last_write * 1000))
+                    max_age = math.ceil(settings.replica_read_your_writes_seconds)
+                    message = {**message, "headers": [
+                        *message.get("headers", []),
+                        (LAST_WRITE_HEADER.lower().encode(), value.encode()),
+                        (b"set-cookie", (
+                            f"{LAST_WRITE_COOKIE}={value}; Max-Age={max_age}; Path=/; HttpOnly; SameSite=Lax"
+                        ).encode()),
+                    ]}
+            await send(message)
+
+        await self.app(scope, receive, send_with_last_write)
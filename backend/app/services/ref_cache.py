@@ -0,0 +1,232 @@
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+from sqlalchemy import event, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..config import get_settings
+from ..database import UPSERT_INSERTS
+from ..models.cache_generation import CacheGeneration
+
+settings = get_settings()
+
+
+class GenerationCache:
+    """Per-worker TTL/LRU cache for reference data (trades, templates).
+    
+    Every entry belongs to a generation stored in the cache_generations table.
+    Writers bump the generation in their transaction, and every worker drops
+    its entries once it sees the new value, so no shared cache server is needed.
+    """
+
+    def __init__(self, name: str, ttl: float, max_entries: int, check_interval: float):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.check_interval = check_interval
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._generation: Optional[int] = None
+        self._checked_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    async def _sync_generation(self, db: AsyncSession):
+        """Re-read the generation row at most every `check_interval` seconds."""
+        now = time.monotonic()
+        if self._generation is not None and now - self._checked_at < self.check_interval:
+            return
+        generation = await db.scalar(
+            select(CacheGeneration.generation).where(CacheGeneration.name == self.name)
+        )
+        self._checked_at = now
+        if generation != self._generation:
+            self._entries.clear()
+            self._generation = generation
+
+    async def get_or_load(self, db: AsyncSession, key: str, loader: Callable[[AsyncSession], Awaitable[Any]]) -> Any:
+        """Return the cached value for `key`, calling `loader(db)` on a miss.
+        
+        Cached values are shared between requests - treat them as read-only.
+        """
+        await self._sync_generation(db)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        
+        self.misses += 1
+        generation = self._generation
+        value = await loader(db)
+        # Skip storing if an invalidation happened while loading
+        if generation is not None and generation == self._generation:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    async def invalidate(self, db: AsyncSession):
+        """Bump the generation as part of the caller's transaction.
+        
+        Local entries are dropped when that transaction commits; other workers
+        drop theirs on their next generation check.
+        """
+        await db.execute(
+            update(CacheGeneration)
+            .where(CacheGeneration.name == self.name)
+            .values(generation=CacheGeneration.generation + 1)
+        )
+        event.listen(db.sync_session, "after_commit", lambda session: self.clear(), once=True)
+
+    def clear(self):
+        self._entries.clear()
+        self._generation = None
+
+    def stats(self) -> dict:
+        return {
+            "name": self.name,
+            "generation": self._generation,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class ScopedGenerationCache:
+    """Per-worker TTL/LRU cache with a separate generation per scope (e.g. project).
+    
+    Works like GenerationCache, but invalidating one scope leaves the others
+    cached. A scope holds several values (by key) that expire and are dropped
+    together. Its generation is the sum of the cache_generations rows
+    "<name>" (bumped to drop every scope) and "<name>:<scope>" (created on
+    the scope's first invalidation).
+    """
+
+    def __init__(self, name: str, ttl: float, max_entries: int, check_interval: float):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.check_interval = check_interval
+        # scope -> (expires_at, generation, checked_at, {key: value})
+        self._entries: "OrderedDict[str, Tuple[float, int, float, Dict[str, Any]]]" = OrderedDict()
+        self._dropped = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _row_name(self, scope) -> str:
+        return f"{self.name}:{scope}"
+
+    async def _read_generation(self, db: AsyncSession, scope) -> int:
+        generation = await db.scalar(
+            select(func.sum(CacheGeneration.generation))
+            .where(CacheGeneration.name.in_([self.name, self._row_name(scope)]))
+        )
+        return generation or 0
+
+    async def _current_values(self, db: AsyncSession, scope: str) -> Optional[Dict[str, Any]]:
+        """The scope's cached values if they are still valid, re-checking its generation when due."""
+        entry = self._entries.get(scope)
+        now = time.monotonic()
+        if entry is None or entry[0] <= now:
+            return None
+        expires_at, generation, checked_at, values = entry
+        if now - checked_at >= self.check_interval:
+            if await self._read_generation(db, scope) != generation:
+                return None
+            self._entries[scope] = (expires_at, generation, now, values)
+        self._entries.move_to_end(scope)
+        return values
+
+    async def get_or_load(
+        self,
+        db: AsyncSession,
+        scope,
+        key: str,
+        loader: Callable[[AsyncSession], Awaitable[Any]]
+    ) -> Any:
+        """Return the value cached for `key` in `scope`, calling `loader(db)` on a miss.
+        
+        Cached values are shared between requests - treat them as read-only.
+        """
+        scope = str(scope)
+        values = await self._current_values(db, scope)
+        if values is not None and key in values:
+            self.hits += 1
+            return values[key]
+        
+        self.misses += 1
+        dropped = self._dropped
+        if values is None:
+            generation = await self._read_generation(db, scope)
+        value = await loader(db)
+        # Skip storing if a local invalidation happened while loading
+        if dropped == self._dropped:
+            if values is None:
+                values = {}
+                now = time.monotonic()
+                self._entries[scope] = (now + self.ttl, generation, now, values)
+            values[key] = value
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    async def invalidate(self, db: AsyncSession, scopes: Iterable):
+        """Bump the generation of each scope as part of the caller's transaction.
+        
+        Local entries for the scopes are dropped when that transaction
+        commits; other workers drop theirs on their next generation check.
+        """
+        scopes = list(dict.fromkeys(str(scope) for scope in scopes))
+        if not scopes:
+            return
+        table = CacheGeneration.__table__
+        stmt = UPSERT_INSERTS[db.get_bind().dialect.name](table).on_conflict_do_update(
+            index_elements=["name"],
+            set_={"generation": table.c.generation + 1},
+        )
+        await db.execute(stmt, [{"name": self._row_name(scope), "generation": 1} for scope in scopes])
+        event.listen(db.sync_session, "after_commit", lambda session: self.discard(scopes), once=True)
+
+    async def invalidate_all(self, db: AsyncSession):
+        """Bump the shared generation, dropping every scope on every worker."""
+        await db.execute(
+            update(CacheGeneration)
+            .where(CacheGeneration.name == self.name)
+            .values(generation=CacheGeneration.generation + 1)
+        )
+        event.listen(db.sync_session, "after_commit", lambda session: self.clear(), once=True)
+
+    def discard(self, scopes: Iterable):
+        for scope in scopes:
+            self._entries.pop(str(scope), None)
+        self._dropped += 1
+
+    def clear(self):
+        self._entries.clear()
+        self._dropped += 1
+
+    def stats(self) -> dict:
+        return {
+            "name": self.name,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+reference_cache = GenerationCache(
+    "reference",
+    ttl=settings.ref_cache_ttl_seconds,
+    max_entries=settings.ref_cache_max_entries,
+    check_interval=settings.ref_cache_generation_check_seconds,
+)
@@ -0,0 +1,193 @@
+import re
+from typing import List, Optional
+from sqlalchemy import bindparam, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..models.contractor import Contractor
+from ..models.issue import Issue
+from ..models.project import Project
+
+# Documents are keyed by ref_id * 4 + kind code, so one row can be replaced
+# through the primary key (the FTS5 rowid on SQLite)
+KIND_CODES = {"project": 1, "issue": 2, "contractor": 3}
+
+# One SELECT per kind producing the indexed documents; used for single rows
+# (filtered on ref_id) and for full rebuilds
+DOCUMENT_SOURCES = {
+    "project": (
+        "SELECT id * 4 + 1 AS doc_id, 'project' AS kind, id AS ref_id, id AS project_id, "
+        "name AS title, "
+        "coalesce(address, '') || ' ' || coalesce(unit, '') || ' ' || coalesce(notes, '') AS body "
+        "FROM projects"
+    ),
+    "issue": (
+        "SELECT issues.id * 4 + 2 AS doc_id, 'issue' AS kind, issues.id AS ref_id, issues.project_id, "
+        "issues.category || coalesce(' - ' || issues.subcategory, '') AS title, "
+        "coalesce(issues.description, '') || ' ' || coalesce(issues.resolution_notes, '') || ' ' || "
+        "coalesce(trades.name, issues.trade, '') AS body "
+        "FROM issues LEFT JOIN trades ON trades.id = issues.trade_id"
+    ),
+    "contractor": (
+        "SELECT id * 4 + 3 AS doc_id, 'contractor' AS kind, id AS ref_id, NULL AS project_id, "
+        "company AS title, "
+        "coalesce(contact_name, '') || ' ' || coalesce(email, '') || ' ' || coalesce(notes, '') AS body "
+        "FROM contractors WHERE is_active = 1"
+    ),
+}
+
+DOCUMENT_COLUMNS = "kind, ref_id, project_id, title, body"
+
+
+def _id_column(db: AsyncSession) -> str:
+    # FTS5 keys documents by rowid; other dialects are rejected at startup
+    return "doc_id" if db.get_bind().dialect.name == "postgresql" else "rowid"
+
+
+def build_query_terms(q: str) -> List[str]:
+    """Word tokens of a search string (punctuation is dropped, so input can't inject syntax)."""
+    return re.findall(r"[^\W_]+", q.lower())
+
+
+async def index_documents(db: AsyncSession, kind: str, ref_ids: List[int]):
+    """(Re)index rows from their flushed state, in the session's transaction.
+
+    Rows that are no longer searchable (e.g. deactivated contractors) just
+    drop out of the index. The caller commits.
+    """
+    if not ref_ids:
+        return
+    id_column = _id_column(db)
+    await remove_documents(db, kind, ref_ids)
+    await db.execute(
+        text(
+            f"INSERT INTO search_index ({id_column}, {DOCUMENT_COLUMNS}) "
+            f"SELECT doc_id, {DOCUMENT_COLUMNS} FROM ({DOCUMENT_SOURCES[kind]}) AS docs "
+            "WHERE docs.ref_id IN :ref_ids"
+        ).bindparams(bindparam("ref_ids", expanding=True)),
+        {"ref_ids": list(ref_ids)},
+    )
+
+
+async def index_document(db: AsyncSession, kind: str, ref_id: int):
+    await index_documents(db, kind, [ref_id])
+
+
+async def remove_documents(db: AsyncSession, kind: str, ref_ids: List[int]):
+    await db.execute(
+        text(f"DELETE FROM search_index WHERE {_id_column(db)} IN :doc_ids")
+        .bindparams(bindparam("doc_ids", expanding=True)),
+        {"doc_ids": [ref_id * 4 + KIND_CODES[kind] for ref_id in ref_ids]},
+    )
+
+
+async def remove_document(db: AsyncSession, kind: str, ref_id: int):
+    await remove_documents(db, kind, [ref_id])
+
+
+async def remove_project_documents(db: AsyncSession, project_id: int):
+    """Remove a project and all of its issues from the index."""
+    await db.execute(
+        text("DELETE FROM search_index WHERE project_id = :project_id"),
+        {"project_id": project_id},
+    )
+
+
+async def index_issue(db: AsyncSession, issue: Issue):
+    await db.flush()
+    await index_document(db, "issue", issue.id)
+
+
+async def index_trade_issues(db: AsyncSession, trade_id: int):
+    """Reindex the issues filed under a trade (their documents include its name)."""
+    await db.flush()
+    issue_ids = await db.scalars(select(Issue.id).where(Issue.trade_id == trade_id))
+    await index_documents(db, "issue", list(issue_ids))
+
+
+async def index_project(db: AsyncSession, project: Project):
+    await db.flush()
+    await index_document(db, "project", project.id)
+
+
+async def index_contractor(db: AsyncSession, contractor: Contractor):
+    await db.flush()
+    await index_document(db, "contractor", contractor.id)
+
+
+async def rebuild_search_index(db: AsyncSession) -> int:
+    """Re-create every document from the source tables.
+
+    Returns the number of indexed documents. The caller commits.
+    """
+    id_column = _id_column(db)
+    await db.execute(text("DELETE FROM search_index"))
+    total = 0
+    for source in DOCUMENT_SOURCES.values():
+        result = await db.execute(text(
+            f"INSERT INTO search_index ({id_column}, {DOCUMENT_COLUMNS}) "
+            f"SELECT doc_id, {DOCUMENT_COLUMNS} FROM ({source}) AS docs"
+        ))
+        total += result.rowcount
+    return total
+
+
+async def search(
+    db: AsyncSession,
+    q: str,
+    kinds: Optional[List[str]] = None,
+    project_id: Optional[int] = None,
+    limit: int = 20
+) -> List[dict]:
+    """Ranked matches for all words of `q` (each word also matches as a prefix).
+
+    Snippets come from the document body with matched words wrapped in **.
+    """
+    terms = build_query_terms(q)
+    if not terms:
+        return []
+
+    id_column = _id_column(db)
+    params = {"limit": limit}
+    filters = []
+    if kinds:
+        filters.append("kind IN :kinds")
+        params["kinds"] = list(kinds)
+    if project_id is not None:
+        filters.append("project_id = :project_id")
+        params["project_id"] = project_id
+
+    if id_column == "rowid":
+        # FTS5: implicit AND of prefix phrases, bm25 with the title weighted up
+        params["query"] = " ".join(f'"{term}"*' for term in terms)
+        where = " AND ".join(["search_index MATCH :query", *filters])
+        sql = (
+            "SELECT kind, ref_id, project_id, title, "
+            "snippet(search_index, 4, '**', '**', '…', 16) AS snippet, "
+            "-bm25(search_index, 0, 0, 0, 5.0, 1.0) AS score "
+            f"FROM search_index WHERE {where} ORDER BY score DESC LIMIT :limit"
+        )
+    else:
+        params["query"] = " & ".join(f"{term}:*" for term in terms)
+        where = " AND ".join(["document @@ query", *filters])
+        sql = (
+            "SELECT kind, ref_id, project_id, title, "
+            "ts_headline('simple', body, query, 'StartSel=**, StopSel=**, MaxWords=24, MinWords=8') AS snippet, "
+            "ts_rank(document, query) AS score "
+            "FROM search_index, to_tsquery('simple', :query) AS query "
+            f"WHERE {where} ORDER BY score DESC LIMIT :limit"
+        )
+
+    statement = text(sql)
+    if kinds:
+        statement = statement.bindparams(bindparam("kinds", expanding=True))
+    result = await db.execute(statement, params)
+    return [
+        {
+            "kind": row.kind,
+            "id": row.ref_id,
+            "project_id": row.project_id,
+            "title": row.title,
+            "snippet": row.snippet,
+            "rank": float(row.score),
+        }
+        for row in result
+    ]
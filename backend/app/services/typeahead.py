@@ -0,0 +1,139 @@
+import unicodedata
+from bisect import bisect_left
+from typing import Collection, FrozenSet, Iterable, List, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..config import get_settings
+from ..models.area import Area
+from ..models.contractor import Contractor, ProjectContractor
+from ..models.issue import DEFAULT_CATEGORIES
+from .ref_cache import GenerationCache, ScopedGenerationCache
+
+settings = get_settings()
+
+
+def normalize(value: str) -> str:
+    """Case- and accent-insensitive form used for keys and prefixes."""
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.casefold().split())
+
+
+class PrefixIndex:
+    """Sorted word-start keys over a fixed set of entries, searched with bisect.
+    
+    Every word of every indexed text starts a key, so "smi" finds
+    "Joe Smith" and "joe sm" does too.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[dict, Iterable[str]]]):
+        self._entries: List[dict] = []
+        keys = []
+        for position, (entry, texts) in enumerate(entries):
+            self._entries.append(entry)
+            for value in texts:
+                words = normalize(value or "").split()
+                keys.extend((" ".join(words[i:]), position) for i in range(len(words)))
+        keys.sort()
+        self._keys = keys
+
+    def search(self, prefix: str, limit: int, ids: Optional[Collection[int]] = None) -> List[dict]:
+        """Entries with a word starting with `prefix`, optionally only those whose id is in `ids`."""
+        prefix = normalize(prefix)
+        if not prefix:
+            entries = self._entries if ids is None else [e for e in self._entries if e["id"] in ids]
+            return entries[:limit]
+        found = {}
+        i = bisect_left(self._keys, (prefix,))
+        while i < len(self._keys) and len(found) < limit:
+            key, position = self._keys[i]
+            if not key.startswith(prefix):
+                break
+            if ids is None or self._entries[position]["id"] in ids:
+                found.setdefault(position, self._entries[position])
+            i += 1
+        return list(found.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Built indexes are cached per worker: the contractor index is dropped when
+# contractors change, a project's areas and contractor assignments only when
+# that project's do
+contractor_typeahead_cache = GenerationCache(
+    "typeahead_contractors",
+    ttl=settings.ref_cache_ttl_seconds,
+    max_entries=settings.ref_cache_max_entries,
+    check_interval=settings.ref_cache_generation_check_seconds,
+)
+project_typeahead_cache = ScopedGenerationCache(
+    "typeahead_projects",
+    ttl=settings.ref_cache_ttl_seconds,
+    max_entries=settings.ref_cache_max_entries,
+    check_interval=settings.ref_cache_generation_check_seconds,
+)
+
+CATEGORY_INDEX = PrefixIndex(
+    ({"kind": "category", "id": None, "label": category, "detail": None}, [category])
+    for category in DEFAULT_CATEGORIES
+)
+
+
+async def contractor_index(db: AsyncSession) -> PrefixIndex:
+    async def load(db: AsyncSession) -> PrefixIndex:
+        result = await db.execute(
+            select(Contractor.id, Contractor.company, Contractor.contact_name)
+            .where(Contractor.is_active == 1)
+            .order_by(Contractor.company)
+        )
+        return PrefixIndex(
+            ({"kind": "contractor", "id": id, "label": company, "detail": contact_name}, [company, contact_name])
+            for id, company, contact_name in result.all()
+        )
+    return await contractor_typeahead_cache.get_or_load(db, "contractors", load)
+
+
+async def area_index(db: AsyncSession, project_id: int) -> PrefixIndex:
+    async def load(db: AsyncSession) -> PrefixIndex:
+        result = await db.execute(
+            select(Area.id, Area.name).where(Area.project_id == project_id).order_by(Area.order)
+        )
+        return PrefixIndex(
+            ({"kind": "area", "id": id, "label": name, "detail": None}, [name])
+            for id, name in result.all()
+        )
+    return await project_typeahead_cache.get_or_load(db, project_id, "areas", load)
+
+
+async def project_contractor_ids(db: AsyncSession, project_id: int) -> FrozenSet[int]:
+    """Ids of the contractors assigned to a project."""
+    async def load(db: AsyncSession) -> FrozenSet[int]:
+        result = await db.scalars(
+            select(ProjectContractor.contractor_id).where(ProjectContractor.project_id == project_id)
+        )
+        return frozenset(result.all())
+    return await project_typeahead_cache.get_or_load(db, project_id, "contractors", load)
+
+
+async def suggest(
+    db: AsyncSession,
+    q: str,
+    kinds: List[str],
+    project_id: Optional[int] = None,
+    limit: int = 10
+) -> List[dict]:
+    """Up to `limit` suggestions per kind whose words start with `q`.
+    
+    With a project, contractor suggestions are limited to its assignments.
+    """
+    items = []
+    if "contractor" in kinds:
+        # Within a project, only the contractors assigned to it
+        ids = await project_contractor_ids(db, project_id) if project_id is not None else None
+        items += (await contractor_index(db)).search(q, limit, ids)
+    if "area" in kinds and project_id is not None:
+        items += (await area_index(db, project_id)).search(q, limit)
+    if "category" in kinds:
+        items += CATEGORY_INDEX.search(q, limit)
+    return items
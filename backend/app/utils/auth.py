@@ -1,28 +1,68 @@
+import asyncio
+import hashlib
+import secrets
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
 from ..config import get_settings
-from ..database import get_db
-from ..models.user import User, UserRole
+from ..database import get_read_db
+from ..models.user import User, UserRole, RefreshToken
 from ..schemas.user import TokenData
+from ..services.ref_cache import GenerationCache
 
 settings = get_settings()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.bcrypt_rounds)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# Users behind bearer tokens, keyed by user id and token. Invalidated whenever
+# a user is changed or deleted, so role and active checks stay current.
+principal_cache = GenerationCache(
+    "principals",
+    ttl=settings.principal_cache_ttl_seconds,
+    max_entries=settings.principal_cache_max_entries,
+    check_interval=settings.ref_cache_generation_check_seconds,
+)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+
+# bcrypt runs on its own threads (it releases the GIL) so the event loop and
+# the default thread pool stay free. Beyond the pending limit, requests get a
+# 503 instead of queueing behind a login rush.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers, thread_name_prefix="password-hash"
+)
+_hash_slots = asyncio.Semaphore(settings.password_hash_workers + settings.password_hash_max_pending)
+
+
+async def _run_hash(func, *args):
+    if _hash_slots.locked():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent logins, try again",
+            headers={"Retry-After": "1"},
+        )
+    async with _hash_slots:
+        return await asyncio.get_running_loop().run_in_executor(_hash_executor, func, *args)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return await _run_hash(pwd_context.verify, plain_password, hashed_password)
+
 
+async def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Verify a password; also returns a new hash when the stored one uses an outdated work factor."""
+    return await _run_hash(pwd_context.verify_and_update, plain_password, hashed_password)
 
-def get_password_hash(password: str) -> str:
+
+async def get_password_hash(password: str) -> str:
     """Hash a password."""
-    return pwd_context.hash(password)
+    return await _run_hash(pwd_context.hash, password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -37,6 +77,36 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
+def hash_refresh_token(token: str) -> str:
+    """Refresh tokens are random, so a fast hash is enough to keep them out of the database."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def create_refresh_token(db: AsyncSession, user_id: int, family_id: Optional[str] = None) -> str:
+    """Add a new refresh token for the user to the session and return it.
+    
+    Pass the family of the token being replaced when rotating. The caller commits.
+    """
+    token = secrets.token_urlsafe(32)
+    db.add(RefreshToken(
+        user_id=user_id,
+        token_hash=hash_refresh_token(token),
+        family_id=family_id or secrets.token_hex(16),
+        expires_at=datetime.utcnow() + timedelta(days=settings.refresh_token_expire_days),
+    ))
+    return token
+
+
+async def revoke_refresh_tokens(db: AsyncSession, user_id: Optional[int] = None, family_id: Optional[str] = None):
+    """Revoke all live refresh tokens of a user or of one token family. The caller commits."""
+    query = update(RefreshToken).where(RefreshToken.revoked_at.is_(None))
+    if user_id is not None:
+        query = query.where(RefreshToken.user_id == user_id)
+    if family_id is not None:
+        query = query.where(RefreshToken.family_id == family_id)
+    await db.execute(query.values(revoked_at=datetime.utcnow()))
+
+
 def decode_token(token: str) -> Optional[TokenData]:
     """Decode and validate a JWT token."""
     try:
@@ -56,9 +126,13 @@ def decode_token(token: str) -> Optional[TokenData]:
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ) -> User:
-    """Get the current authenticated user from the token."""
+    """Get the current authenticated user from the token.
+    
+    The user comes from the principal cache and is detached: read its
+    attributes, but load the user in your own session to modify it.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -69,7 +143,14 @@ async def get_current_user(
     if token_data is None:
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == token_data.user_id).first()
+    async def load(db: AsyncSession) -> Optional[User]:
+        user = await db.get(User, token_data.user_id)
+        if user is not None:
+            # Shared between requests - detach it from this request's session
+            db.expunge(user)
+        return user
+    
+    user = await principal_cache.get_or_load(db, f"{token_data.user_id}:{token}", load)
     if user is None:
         raise credentials_exception
     if not user.is_active:
@@ -0,0 +1,28 @@
+from typing import Optional
+from fastapi import Request, Response
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of the request's If-None-Match against `etag`."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+def set_etag(response: Response, etag: str):
+    response.headers["ETag"] = etag
+    # Authenticated data: browsers may keep it, but must revalidate every time
+    response.headers["Cache-Control"] = "private, no-cache"
+
+
+def not_modified(request: Request, etag: Optional[str]) -> Optional[Response]:
+    """Empty 304 response when the client already has `etag`, else None."""
+    if etag is None or not etag_matches(request, etag):
+        return None
+    response = Response(status_code=304)
+    set_etag(response, etag)
+    return response
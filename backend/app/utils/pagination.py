@@ -0,0 +1,95 @@
+import base64
+import enum
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+from fastapi import HTTPException
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+
+# Largest page the list endpoints return (the `limit` query parameter's maximum)
+MAX_PAGE_SIZE = 500
+
+
+class TotalMode(str, enum.Enum):
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
+class ExplainJSON(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a query, keeping its bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, query: Select):
+        self.query = query
+
+
+@compiles(ExplainJSON, "postgresql")
+def _compile_explain_json(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.query, **kw)
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    """Opaque cursor pointing just past the row (created_at, id)."""
+    raw = json.dumps({"c": created_at.isoformat(), "i": id}).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        return datetime.fromisoformat(data["c"]), int(data["i"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def order_newest_first(query: Select, model) -> Select:
+    return query.order_by(model.created_at.desc(), model.id.desc())
+
+
+def apply_cursor(query: Select, model, cursor: str, db: AsyncSession) -> Select:
+    """Restrict a newest-first query to rows after the cursor (keyset pagination)."""
+    created_at, id = decode_cursor(cursor)
+    value = created_at
+    if db.get_bind().dialect.name == "sqlite":
+        # SQLite stores CURRENT_TIMESTAMP as 'YYYY-MM-DD HH:MM:SS' text; normalize
+        # the bound value to the same format so equal timestamps compare equal
+        value = func.datetime(created_at)
+    return query.where(tuple_(model.created_at, model.id) < tuple_(value, id))
+
+
+async def page_results(db: AsyncSession, query: Select, limit: int):
+    """Fetch one page plus one row to find out if there is a next page.
+
+    Returns (rows, next_cursor).
+    """
+    result = await db.execute(query.limit(limit + 1))
+    rows = result.scalars().unique().all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(last.created_at, last.id)
+
+
+async def count_total(db: AsyncSession, query: Select, mode: TotalMode) -> Optional[int]:
+    """Total rows matching a filtered (unordered, unpaginated) query.
+
+    Estimated totals use the PostgreSQL planner's row estimate; other
+    databases fall back to an exact count.
+    """
+    if mode == TotalMode.NONE:
+        return None
+    dialect = db.get_bind().dialect
+    if mode == TotalMode.ESTIMATED and dialect.name == "postgresql":
+        plan = await db.scalar(ExplainJSON(query))
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    return await db.scalar(select(func.count()).select_from(query.subquery()))
@@ -0,0 +1,21 @@
+"""
+Recompute project_issue_counters from the issues table.
+Usage: python rebuild_issue_counters.py [project_id]
+"""
+import asyncio
+import sys
+
+from app.database import AsyncSessionLocal
+from app.services.issue_counters import rebuild_issue_counters
+
+
+async def rebuild(project_id=None):
+    async with AsyncSessionLocal() as db:
+        rows = await rebuild_issue_counters(db, project_id)
+        await db.commit()
+    scope = f"project {project_id}" if project_id is not None else "all projects"
+    print(f"✅ Rebuilt issue counters for {scope} ({rows} counter rows).")
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild(int(sys.argv[1]) if len(sys.argv) > 1 else None))
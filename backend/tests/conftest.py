@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Settings are read once at import time, so the test database has to be
+# configured before anything from the app is imported
+_data_dir = tempfile.mkdtemp(prefix="blue_tape_tests_")
+DATABASE_PATH = f"{_data_dir}/test.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{DATABASE_PATH}"
+os.environ["UPLOAD_DIR"] = f"{_data_dir}/uploads"
+os.environ["BCRYPT_ROUNDS"] = "4"
+os.environ["LOG_LEVEL"] = "WARNING"
+# Caches re-read their generation only after local invalidations, so query
+# counts don't depend on timing
+os.environ["REF_CACHE_GENERATION_CHECK_SECONDS"] = "3600"
+sys.path.insert(0, str(BACKEND_DIR))
+
+subprocess.run(
+    [sys.executable, "-m", "alembic", "upgrade", "head"],
+    cwd=BACKEND_DIR, env=os.environ, check=True, capture_output=True,
+)
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.main import app  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def admin_headers(client):
+    client.post("/api/auth/register", json={
+        "email": "admin@example.com", "name": "Admin", "password": "password", "role": "admin"
+    })
+    response = client.post("/api/auth/login", data={"username": "admin@example.com", "password": "password"})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+def project(client, admin_headers):
+    response = client.post("/api/projects/", json={"name": "Test Project", "address": "1 Main St"}, headers=admin_headers)
+    assert response.status_code == 201
+    return response.json()
+
+
+def query_count(response) -> int:
+    """SQL statements reported in the Server-Timing header of a response."""
+    timing = response.headers["server-timing"]
+    return int(timing.split('desc="')[1].split(" queries")[0])
+
+
+def first_area_id(client, headers, project_id: int) -> int:
+    return client.get(f"/api/projects/{project_id}/areas/", headers=headers).json()[0]["id"]
+
+
+def create_issue(client, headers, project_id: int, **fields) -> dict:
+    """Create an issue in the project's first area."""
+    response = client.post(f"/api/projects/{project_id}/issues/", json={
+        "area_id": first_area_id(client, headers, project_id), "category": "Other", **fields
+    }, headers=headers)
+    assert response.status_code == 201
+    return response.json()
@@ -0,0 +1,63 @@
+from conftest import create_issue
+
+
+def _areas(client, headers, project_id):
+    response = client.get(f"/api/projects/{project_id}/areas/", headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def _bulk(client, headers, project_id, operation, expected_status=200):
+    response = client.post(f"/api/projects/{project_id}/areas/bulk", json=operation, headers=headers)
+    assert response.status_code == expected_status
+    return response.json()
+
+
+def test_bulk_operation_deletes_renames_reorders_and_creates(client, admin_headers, project):
+    first, second, third, *rest = _areas(client, admin_headers, project["id"])
+    issue = create_issue(client, admin_headers, project["id"])
+    assert issue["area_id"] == first["id"]
+
+    areas = _bulk(client, admin_headers, project["id"], {
+        "delete": [first["id"]],
+        "rename": [{"id": third["id"], "name": "Bonus Room"}],
+        "order": [third["id"], second["id"]] + [area["id"] for area in rest],
+        "create": [{"name": "Wine Cellar"}, {"name": "Sauna"}],
+    })
+
+    assert [area["name"] for area in areas[:2]] == ["Bonus Room", second["name"]]
+    assert [area["name"] for area in areas[-2:]] == ["Wine Cellar", "Sauna"]
+    assert first["id"] not in {area["id"] for area in areas}
+    assert [area["order"] for area in areas] == sorted(area["order"] for area in areas)
+    assert areas == _areas(client, admin_headers, project["id"])
+
+    # Issues in deleted areas are kept without an area
+    issue = client.get(f"/api/projects/{project['id']}/issues/{issue['id']}", headers=admin_headers).json()
+    assert issue["area_id"] is None
+
+
+def test_invalid_bulk_operations_change_nothing(client, admin_headers, project):
+    other = client.post("/api/projects/", json={"name": "Other Project", "address": "2 Main St"}, headers=admin_headers).json()
+    foreign = _areas(client, admin_headers, other["id"])[0]
+    before = _areas(client, admin_headers, project["id"])
+    own = before[0]
+
+    _bulk(client, admin_headers, project["id"], {
+        "rename": [{"id": own["id"], "name": "Changed"}], "delete": [foreign["id"]],
+    }, expected_status=400)
+    _bulk(client, admin_headers, project["id"], {
+        "delete": [own["id"]], "order": [own["id"]],
+    }, expected_status=400)
+    _bulk(client, admin_headers, project["id"], {"create": [{"name": "Porch"}], "order": [999999]}, expected_status=400)
+
+    assert _areas(client, admin_headers, project["id"]) == before
+    assert _areas(client, admin_headers, other["id"])[0] == foreign
+
+
+def test_reorder_endpoint_sets_positions(client, admin_headers, project):
+    area_ids = [area["id"] for area in _areas(client, admin_headers, project["id"])]
+    response = client.post(
+        f"/api/projects/{project['id']}/areas/reorder", json=list(reversed(area_ids)), headers=admin_headers
+    )
+    assert response.status_code == 200
+    assert [area["id"] for area in response.json()] == list(reversed(area_ids))
@@ -0,0 +1,147 @@
+from io import BytesIO
+
+from PIL import Image
+
+from conftest import create_issue, first_area_id, query_count
+
+
+def _bulk_create(client, headers, project_id, items):
+    response = client.post(f"/api/projects/{project_id}/issues/bulk", json={"items": items}, headers=headers)
+    assert response.status_code == 200
+    return response
+
+
+def _contractor_id(client, headers):
+    response = client.post("/api/contractors", json={"company": "Bulk Issue Co"}, headers=headers)
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_bulk_create_reports_invalid_items_and_creates_the_rest(client, admin_headers, project):
+    other = client.post("/api/projects/", json={"name": "Other Project", "address": "2 Main St"}, headers=admin_headers).json()
+    area_id = first_area_id(client, admin_headers, project["id"])
+    contractor_id = _contractor_id(client, admin_headers)
+
+    items = [
+        {"area_id": area_id, "category": "Other", "description": "first"},
+        {"area_id": first_area_id(client, admin_headers, other["id"]), "category": "Other"},
+        {"area_id": area_id, "category": "Other", "contractor_id": 999999},
+        {"area_id": area_id, "category": "Other", "trade_id": 999999},
+        {"area_id": area_id, "category": "Other", "description": "last", "contractor_id": contractor_id},
+    ]
+    body = _bulk_create(client, admin_headers, project["id"], items).json()
+
+    assert body["created"] == 2
+    assert body["failed"] == 3
+    assert [result["index"] for result in body["results"]] == list(range(len(items)))
+    assert [result["error"] for result in body["results"][1:4]] == [
+        "Invalid area for this project", "Contractor not found", "Trade not found"
+    ]
+
+    first = client.get(f"/api/projects/{project['id']}/issues/{body['results'][0]['id']}", headers=admin_headers).json()
+    last = client.get(f"/api/projects/{project['id']}/issues/{body['results'][4]['id']}", headers=admin_headers).json()
+    assert (first["description"], first["status"]) == ("first", "open")
+    assert (last["description"], last["status"]) == ("last", "assigned")
+
+    dashboard = client.get(f"/api/projects/{project['id']}/dashboard", headers=admin_headers).json()
+    assert (dashboard["total_issues"], dashboard["open_issues"], dashboard["assigned_issues"]) == (2, 1, 1)
+
+
+def test_bulk_create_query_count_does_not_grow_with_items(client, admin_headers, project):
+    area_id = first_area_id(client, admin_headers, project["id"])
+
+    def items(count):
+        return [{"area_id": area_id, "category": "Other", "description": f"walkthrough {i}"} for i in range(count)]
+
+    few = _bulk_create(client, admin_headers, project["id"], items(2))
+    many = _bulk_create(client, admin_headers, project["id"], items(40))
+
+    assert many.json()["created"] == 40
+    assert query_count(many) == query_count(few)
+
+
+def _bulk_update(client, headers, project_id, action, payload, expected_status=200):
+    response = client.patch(f"/api/projects/{project_id}/issues/bulk/{action}", json=payload, headers=headers)
+    assert response.status_code == expected_status
+    return response.json()
+
+
+def _upload_after_photo(client, headers, project_id, issue_id):
+    image = BytesIO()
+    Image.new("RGB", (8, 8), "blue").save(image, "PNG")
+    response = client.post(
+        f"/api/projects/{project_id}/issues/{issue_id}/photos",
+        params={"photo_type": "after"},
+        files={"file": ("after.png", image.getvalue(), "image/png")},
+        headers=headers,
+    )
+    assert response.status_code == 201
+
+
+def _statuses(client, headers, project_id):
+    items = client.get(f"/api/projects/{project_id}/issues/", headers=headers).json()["items"]
+    return {issue["id"]: issue["status"] for issue in items}
+
+
+def test_bulk_status_by_ids_skips_issues_without_after_photos(client, admin_headers, project):
+    photographed, bare = (create_issue(client, admin_headers, project["id"])["id"] for _ in range(2))
+    _upload_after_photo(client, admin_headers, project["id"], photographed)
+
+    body = _bulk_update(client, admin_headers, project["id"], "status", {
+        "issue_ids": [photographed, bare, 999999], "status": "closed", "notes": "Walked and verified",
+    })
+
+    assert (body["matched"], body["updated"], body["not_found"]) == (2, 1, [999999])
+    assert [skipped["id"] for skipped in body["skipped"]] == [bare]
+    assert _statuses(client, admin_headers, project["id"]) == {photographed: "closed", bare: "open"}
+    closed = client.get(f"/api/projects/{project['id']}/issues/{photographed}", headers=admin_headers).json()
+    assert closed["resolution_notes"] == "Walked and verified"
+    assert closed["closed_at"] is not None
+
+    dashboard = client.get(f"/api/projects/{project['id']}/dashboard", headers=admin_headers).json()
+    assert (dashboard["open_issues"], dashboard["closed_issues"]) == (1, 1)
+
+
+def test_bulk_status_by_filter(client, admin_headers, project):
+    high = create_issue(client, admin_headers, project["id"], priority="high")["id"]
+    low = create_issue(client, admin_headers, project["id"], priority="low")["id"]
+
+    body = _bulk_update(client, admin_headers, project["id"], "status", {
+        "filter": {"priority": "high"}, "status": "in_progress",
+    })
+
+    assert (body["matched"], body["updated"]) == (1, 1)
+    assert _statuses(client, admin_headers, project["id"]) == {high: "in_progress", low: "open"}
+
+
+def test_bulk_selection_needs_exactly_one_of_ids_or_filter(client, admin_headers, project):
+    issue_id = create_issue(client, admin_headers, project["id"])["id"]
+    _bulk_update(client, admin_headers, project["id"], "status", {"status": "closed"}, expected_status=400)
+    _bulk_update(client, admin_headers, project["id"], "assign", {
+        "issue_ids": [issue_id], "filter": {"status": "open"},
+    }, expected_status=400)
+
+
+def test_bulk_assign_and_unassign(client, admin_headers, project):
+    contractor_id = _contractor_id(client, admin_headers)
+    issue_ids = [create_issue(client, admin_headers, project["id"])["id"] for _ in range(3)]
+
+    _bulk_update(client, admin_headers, project["id"], "assign", {
+        "issue_ids": issue_ids, "contractor_id": 999999,
+    }, expected_status=400)
+
+    body = _bulk_update(client, admin_headers, project["id"], "assign", {
+        "issue_ids": issue_ids[:2], "contractor_id": contractor_id,
+    })
+    assert body["updated"] == 2
+    assigned = client.get(
+        f"/api/projects/{project['id']}/issues/", params={"contractor_id": contractor_id}, headers=admin_headers
+    ).json()["items"]
+    assert {issue["id"] for issue in assigned} == set(issue_ids[:2])
+
+    body = _bulk_update(client, admin_headers, project["id"], "assign", {
+        "filter": {"contractor_id": contractor_id}, "contractor_id": None,
+    })
+    assert body["updated"] == 2
+    items = client.get(f"/api/projects/{project['id']}/issues/", headers=admin_headers).json()["items"]
+    assert all(issue["contractor_id"] is None for issue in items)
@@ -0,0 +1,85 @@
+import os
+
+import pytest
+
+from app.config import get_settings
+from app.services import pdf_service
+
+
+@pytest.fixture
+def issue_list_url(client, admin_headers, project):
+    areas = client.get(f"/api/projects/{project['id']}/areas/", headers=admin_headers).json()
+    client.post(f"/api/projects/{project['id']}/issues/bulk", json={"items": [
+        {"area_id": areas[0]["id"], "category": "Paint", "description": f"Scuff on wall near window {i}"}
+        for i in range(40)
+    ]}, headers=admin_headers)
+    return f"/api/projects/{project['id']}/issues/"
+
+
+def test_large_json_is_gzipped(client, admin_headers, issue_list_url):
+    response = client.get(issue_list_url, headers={**admin_headers, "Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert "content-length" not in response.headers
+    assert response.num_bytes_downloaded < len(response.content)
+    assert len(response.json()["items"]) == 40
+
+
+def test_brotli_is_preferred_when_accepted(client, admin_headers, issue_list_url):
+    pytest.importorskip("brotli")
+
+    response = client.get(issue_list_url, headers={**admin_headers, "Accept-Encoding": "gzip, br"})
+
+    assert response.headers["content-encoding"] == "br"
+    assert len(response.json()["items"]) == 40
+
+
+def test_identity_and_refused_codings_are_not_compressed(client, admin_headers, issue_list_url):
+    for accept_encoding in ("identity", "gzip;q=0, br;q=0"):
+        response = client.get(issue_list_url, headers={**admin_headers, "Accept-Encoding": accept_encoding})
+
+        assert "content-encoding" not in response.headers
+        assert response.headers["vary"] == "Accept-Encoding"
+
+
+def test_small_responses_are_sent_as_is(client):
+    response = client.get("/api/health", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+
+
+def test_not_modified_responses_are_untouched(client, admin_headers, issue_list_url):
+    etag = client.get(issue_list_url, headers=admin_headers).headers["etag"]
+
+    response = client.get(issue_list_url, headers={
+        **admin_headers, "Accept-Encoding": "gzip", "If-None-Match": etag
+    })
+
+    assert response.status_code == 304
+    assert "content-encoding" not in response.headers
+
+
+def test_photos_are_not_recompressed(client):
+    path = os.path.join(get_settings().upload_dir, "compression-test.jpg")
+    with open(path, "wb") as f:
+        f.write(b"\xff\xd8\xff\xe0" + bytes(4096))
+
+    response = client.get("/uploads/compression-test.jpg", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/jpeg"
+    assert "content-encoding" not in response.headers
+
+
+@pytest.mark.skipif(pdf_service.WEASYPRINT_AVAILABLE, reason="reports are PDFs with WeasyPrint")
+def test_html_report_fallback_is_labelled_and_compressed(client, admin_headers, project, issue_list_url):
+    response = client.get(
+        f"/api/projects/{project['id']}/reports/punch-list",
+        headers={**admin_headers, "Accept-Encoding": "gzip"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert response.headers["content-disposition"].endswith(".html")
+    assert response.headers["content-encoding"] == "gzip"
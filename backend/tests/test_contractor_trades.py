@@ -0,0 +1,62 @@
+import pytest
+
+
+@pytest.fixture(scope="module")
+def trades(client, admin_headers):
+    created = []
+    for name in ("Association Tile", "Association Grout", "Association Caulk"):
+        response = client.post("/api/trades", json={"name": name}, headers=admin_headers)
+        assert response.status_code == 201
+        created.append(response.json())
+    return created
+
+
+def _contractor_ids(client, headers, trade_id):
+    response = client.get("/api/contractors", params={"trade_id": trade_id}, headers=headers)
+    assert response.status_code == 200
+    return {contractor["id"] for contractor in response.json()}
+
+
+def test_trade_ids_link_primary_and_secondary_trades(client, admin_headers, trades):
+    tile, grout, _ = trades
+    response = client.post("/api/contractors", json={
+        "company": "Two Trade Co", "trade_ids": [grout["id"], tile["id"], grout["id"]],
+    }, headers=admin_headers)
+    assert response.status_code == 201
+    contractor = response.json()
+
+    assert contractor["trade_ids"] == [grout["id"], tile["id"]]
+    assert contractor["trades"] == [grout["name"], tile["name"]]
+    assert contractor["trade_id"] == grout["id"]
+    assert contractor["trade"]["name"] == grout["name"]
+
+
+def test_legacy_trade_names_resolve_to_links(client, admin_headers, trades):
+    tile, _, caulk = trades
+    response = client.post("/api/contractors", json={
+        "company": "Named Trade Co", "trades": [caulk["name"], "No Such Trade", tile["name"]],
+    }, headers=admin_headers)
+    assert response.status_code == 201
+    assert response.json()["trade_ids"] == [caulk["id"], tile["id"]]
+
+
+def test_filter_and_counts_use_every_linked_trade(client, admin_headers, trades):
+    tile, grout, caulk = trades
+    contractor = client.post("/api/contractors", json={
+        "company": "Filtered Co", "trade_ids": [tile["id"], grout["id"]],
+    }, headers=admin_headers).json()
+
+    assert contractor["id"] in _contractor_ids(client, admin_headers, tile["id"])
+    assert contractor["id"] in _contractor_ids(client, admin_headers, grout["id"])
+    assert contractor["id"] not in _contractor_ids(client, admin_headers, caulk["id"])
+
+    detail = client.get(f"/api/trades/{grout['id']}", headers=admin_headers).json()
+    assert contractor["id"] in {c["id"] for c in detail["contractors"]}
+    counts = {t["id"]: t["contractor_count"] for t in client.get("/api/trades", headers=admin_headers).json()}
+    assert counts[grout["id"]] == detail["contractor_count"]
+
+    response = client.patch(f"/api/contractors/{contractor['id']}", json={"trade_ids": [caulk["id"]]}, headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json()["trade_ids"] == [caulk["id"]]
+    assert contractor["id"] not in _contractor_ids(client, admin_headers, tile["id"])
+    assert contractor["id"] in _contractor_ids(client, admin_headers, caulk["id"])
@@ -0,0 +1,59 @@
+import io
+
+from PIL import Image
+
+from conftest import create_issue, query_count
+
+
+def _dashboard(client, headers, project_id):
+    response = client.get(f"/api/projects/{project_id}/dashboard", headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    data.pop("project")
+    return data
+
+
+def test_dashboard_counts_follow_issue_changes(client, admin_headers, project):
+    pid = project["id"]
+    issues = [create_issue(client, admin_headers, pid, priority=priority) for priority in ("low", "medium", "high", "high")]
+    client.patch(f"/api/projects/{pid}/issues/{issues[0]['id']}", json={"priority": "high"}, headers=admin_headers)
+    client.patch(f"/api/projects/{pid}/issues/{issues[1]['id']}/status", json={"status": "in_progress"}, headers=admin_headers)
+    photo = io.BytesIO()
+    Image.new("RGB", (10, 10)).save(photo, "JPEG")
+    client.post(
+        f"/api/projects/{pid}/issues/{issues[2]['id']}/photos", params={"photo_type": "after"},
+        files={"file": ("after.jpg", photo.getvalue(), "image/jpeg")}, headers=admin_headers
+    )
+    client.patch(f"/api/projects/{pid}/issues/{issues[2]['id']}/status", json={"status": "closed"}, headers=admin_headers)
+    client.delete(f"/api/projects/{pid}/issues/{issues[3]['id']}", headers=admin_headers)
+
+    dashboard = _dashboard(client, admin_headers, pid)
+
+    assert dashboard["total_issues"] == 3
+    assert dashboard["open_issues"] == 1
+    assert dashboard["in_progress_issues"] == 1
+    assert dashboard["closed_issues"] == 1
+    assert dashboard["high_priority_open"] == 1
+
+
+def test_counter_rebuild_keeps_dashboard(client, admin_headers, project):
+    for priority in ("low", "high"):
+        create_issue(client, admin_headers, project["id"], priority=priority)
+    before = _dashboard(client, admin_headers, project["id"])
+
+    response = client.post(
+        "/api/admin/issue-counters/rebuild", params={"project_id": project["id"]}, headers=admin_headers
+    )
+
+    assert response.status_code == 200
+    assert _dashboard(client, admin_headers, project["id"]) == before
+
+
+def test_dashboard_query_count_does_not_grow_with_issues(client, admin_headers, project):
+    url = f"/api/projects/{project['id']}/dashboard"
+    create_issue(client, admin_headers, project["id"])
+    few = query_count(client.get(url, headers=admin_headers))
+    for _ in range(10):
+        create_issue(client, admin_headers, project["id"])
+
+    assert query_count(client.get(url, headers=admin_headers)) == few
@@ -0,0 +1,29 @@
+def test_pool_stats_count_checkouts_per_engine(client, admin_headers, project):
+    assert client.post("/api/admin/db-pool/reset", headers=admin_headers).status_code == 204
+    client.get(f"/api/projects/{project['id']}", headers=admin_headers)
+    client.patch(f"/api/projects/{project['id']}", json={"notes": "pool"}, headers=admin_headers)
+
+    response = client.get("/api/admin/db-pool", headers=admin_headers)
+    assert response.status_code == 200
+    stats = response.json()
+
+    assert {"primary", "read"} <= set(stats)
+    for name in ("primary", "read"):
+        assert stats[name]["checkouts"] >= 1
+        assert stats[name]["timeouts"] == 0
+        assert stats[name]["wait_ms_max"] >= stats[name]["wait_ms_avg"] >= 0
+
+    client.post("/api/admin/db-pool/reset", headers=admin_headers)
+    stats = client.get("/api/admin/db-pool", headers=admin_headers).json()
+    assert stats["primary"]["checkouts"] == 0
+
+
+def test_pool_stats_are_admin_only(client, admin_headers):
+    client.post("/api/users/", json={
+        "email": "pool-viewer@example.com", "name": "Viewer", "password": "password", "role": "viewer"
+    }, headers=admin_headers)
+    login = client.post("/api/auth/login", data={"username": "pool-viewer@example.com", "password": "password"})
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    assert client.get("/api/admin/db-pool", headers=headers).status_code == 403
+    assert client.post("/api/admin/db-pool/reset", headers=headers).status_code == 403
@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+
+from conftest import BACKEND_DIR
+
+
+def test_unchanged_issue_list_is_not_modified(client, admin_headers, project):
+    url = f"/api/projects/{project['id']}/issues/"
+    etag = client.get(url, headers=admin_headers).headers["etag"]
+
+    response = client.get(url, headers={**admin_headers, "If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_issue_write_changes_issue_list_etag(client, admin_headers, project):
+    url = f"/api/projects/{project['id']}/issues/"
+    etag = client.get(url, headers=admin_headers).headers["etag"]
+    areas = client.get(f"/api/projects/{project['id']}/areas/", headers=admin_headers).json()
+    client.post(url, json={"area_id": areas[0]["id"], "category": "Paint"}, headers=admin_headers)
+
+    response = client.get(url, headers={**admin_headers, "If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_counter_rebuild_script_changes_dashboard_etag(client, admin_headers, project):
+    url = f"/api/projects/{project['id']}/dashboard"
+    etag = client.get(url, headers=admin_headers).headers["etag"]
+
+    subprocess.run(
+        [sys.executable, "rebuild_issue_counters.py", str(project["id"])],
+        cwd=BACKEND_DIR, env=os.environ, check=True, capture_output=True,
+    )
+
+    response = client.get(url, headers={**admin_headers, "If-None-Match": etag})
+    assert response.status_code == 200
@@ -0,0 +1,51 @@
+import pytest
+from sqlalchemy import text
+
+from app import database
+
+# Hot queries of the issue list, area list and assignment checks, and the
+# composite index each should be served from
+HOT_QUERIES = [
+    (
+        "SELECT id FROM issues WHERE project_id = 1 ORDER BY created_at DESC LIMIT 50",
+        "ix_issues_project_created_at_id",
+    ),
+    (
+        "SELECT id FROM issues WHERE project_id = 1 AND status = 'OPEN' ORDER BY created_at DESC LIMIT 50",
+        "ix_issues_project_status_created_at_id",
+    ),
+    (
+        "SELECT id FROM issues WHERE project_id = 1 AND trade_id = 2 ORDER BY created_at DESC LIMIT 50",
+        "ix_issues_project_trade_created_at_id",
+    ),
+    (
+        # A later keyset page seeks past the cursor
+        "SELECT id FROM issues WHERE project_id = 1 AND (created_at, id) < ('2026-01-01 00:00:00', 500) "
+        "ORDER BY created_at DESC, id DESC LIMIT 50",
+        "ix_issues_project_created_at_id",
+    ),
+    (
+        "SELECT id FROM issues WHERE contractor_id = 1 ORDER BY created_at DESC LIMIT 50",
+        "ix_issues_contractor_created_at_id",
+    ),
+    (
+        'SELECT id FROM areas WHERE project_id = 1 ORDER BY "order"',
+        "ix_areas_project_order",
+    ),
+    (
+        "SELECT id FROM project_contractors WHERE project_id = 1 AND contractor_id = 2",
+        "ix_project_contractors_project_contractor",
+    ),
+    (
+        "SELECT contractor_id FROM contractor_trades WHERE trade_id = 1",
+        "ix_contractor_trades_trade_contractor",
+    ),
+]
+
+
+@pytest.mark.parametrize("sql, index", HOT_QUERIES)
+def test_hot_queries_use_their_composite_index(sql, index):
+    with database.engine.connect() as conn:
+        plan = " ".join(row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+    assert index in plan
+    assert "TEMP B-TREE" not in plan
@@ -0,0 +1,45 @@
+from conftest import create_issue, first_area_id
+
+
+def _issue_ids(client, headers, project_id, **params):
+    response = client.get(f"/api/projects/{project_id}/issues/", params=params, headers=headers)
+    assert response.status_code == 200
+    return {issue["id"] for issue in response.json()["items"]}
+
+
+def test_trade_names_resolve_to_trade_ids(client, admin_headers, project):
+    trade = client.post("/api/trades", json={"name": "Issue FK Paint"}, headers=admin_headers).json()
+
+    by_name = create_issue(client, admin_headers, project["id"], trade="issue fk paint")
+    assert by_name["trade_id"] == trade["id"]
+    assert by_name["trade"] == "Issue FK Paint"
+
+    by_id = create_issue(client, admin_headers, project["id"], trade_id=trade["id"])
+    assert by_id["trade"] == "Issue FK Paint"
+
+    free_text = create_issue(client, admin_headers, project["id"], trade="Someone's cousin")
+    assert free_text["trade_id"] is None
+    assert free_text["trade"] == "Someone's cousin"
+
+
+def test_unknown_trade_id_is_rejected(client, admin_headers, project):
+    response = client.post(f"/api/projects/{project['id']}/issues/", json={
+        "area_id": first_area_id(client, admin_headers, project["id"]),
+        "category": "Other",
+        "trade_id": 999999,
+    }, headers=admin_headers)
+    assert response.status_code == 400
+
+
+def test_trade_filters_follow_renames(client, admin_headers, project):
+    trade = client.post("/api/trades", json={"name": "Issue FK Drywall"}, headers=admin_headers).json()
+    linked = create_issue(client, admin_headers, project["id"], trade_id=trade["id"])
+    other = create_issue(client, admin_headers, project["id"], trade="Unlisted Trade")
+
+    assert _issue_ids(client, admin_headers, project["id"], trade_id=trade["id"]) == {linked["id"]}
+    assert _issue_ids(client, admin_headers, project["id"], trade="Unlisted Trade") == {other["id"]}
+
+    client.patch(f"/api/trades/{trade['id']}", json={"name": "Issue FK Gypsum"}, headers=admin_headers)
+    assert _issue_ids(client, admin_headers, project["id"], trade="Issue FK Gypsum") == {linked["id"]}
+    issue = client.get(f"/api/projects/{project['id']}/issues/{linked['id']}", headers=admin_headers).json()
+    assert issue["trade"] == "Issue FK Gypsum"
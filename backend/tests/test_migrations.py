@@ -0,0 +1,24 @@
+import os
+import subprocess
+import sys
+
+from conftest import BACKEND_DIR
+
+
+def test_models_match_migrations():
+    """`alembic check` finds nothing to autogenerate (search index tables included)."""
+    result = subprocess.run(
+        [sys.executable, "-m", "alembic", "check"],
+        cwd=BACKEND_DIR, env=os.environ, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_migrations_downgrade_and_upgrade_again(tmp_path):
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{tmp_path}/roundtrip.db"}
+    for args in (["upgrade", "head"], ["downgrade", "base"], ["upgrade", "head"]):
+        result = subprocess.run(
+            [sys.executable, "-m", "alembic", *args],
+            cwd=BACKEND_DIR, env=env, capture_output=True, text=True,
+        )
+        assert result.returncode == 0, result.stderr
@@ -0,0 +1,77 @@
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models import Issue
+from app.utils.pagination import MAX_PAGE_SIZE, ExplainJSON
+
+from conftest import create_issue
+
+
+def test_explain_keeps_bound_parameters():
+    query = select(Issue).where(Issue.description.ilike("%4:B%"), Issue.project_id == 3)
+
+    compiled = ExplainJSON(query).compile(dialect=postgresql.dialect())
+
+    assert str(compiled).startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "4:B" not in str(compiled)
+    assert "%4:B%" in compiled.params.values()
+
+
+def test_estimated_total_falls_back_to_exact_count(client, admin_headers, project):
+    areas = client.get(f"/api/projects/{project['id']}/areas/", headers=admin_headers).json()
+    client.post(f"/api/projects/{project['id']}/issues/bulk", json={"items": [
+        {"area_id": areas[0]["id"], "category": "Paint", "description": f"Crack 4:B {i}"} for i in range(3)
+    ]}, headers=admin_headers)
+
+    response = client.get(
+        f"/api/projects/{project['id']}/issues/", params={"total": "estimated", "limit": 1},
+        headers=admin_headers
+    )
+
+    assert response.status_code == 200
+    assert response.json()["total"] == 3
+
+
+def test_cursor_pages_cover_every_issue_once_newest_first(client, admin_headers, project):
+    created = [create_issue(client, admin_headers, project["id"], description=f"Issue {i}")["id"] for i in range(12)]
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        params = {"limit": 5, **({"cursor": cursor} if cursor else {})}
+        page = client.get(f"/api/projects/{project['id']}/issues/", params=params, headers=admin_headers).json()
+        seen += [issue["id"] for issue in page["items"]]
+        pages += 1
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert pages == 3
+    assert seen == sorted(created, reverse=True)
+    assert page["total"] == 12
+
+
+def test_total_can_be_skipped(client, admin_headers, project):
+    create_issue(client, admin_headers, project["id"])
+
+    page = client.get(
+        f"/api/projects/{project['id']}/issues/", params={"total": "none"}, headers=admin_headers
+    ).json()
+
+    assert page["total"] is None
+    assert len(page["items"]) == 1
+
+
+def test_invalid_cursor_is_rejected(client, admin_headers, project):
+    response = client.get(
+        f"/api/projects/{project['id']}/issues/", params={"cursor": "zzz"}, headers=admin_headers
+    )
+
+    assert response.status_code == 400
+
+
+def test_page_size_is_bounded(client, admin_headers, project):
+    for url in (f"/api/projects/{project['id']}/issues/", "/api/projects/"):
+        for limit in (0, MAX_PAGE_SIZE + 1):
+            response = client.get(url, params={"limit": limit}, headers=admin_headers)
+            assert response.status_code == 422
+        assert client.get(url, params={"limit": MAX_PAGE_SIZE}, headers=admin_headers).status_code == 200
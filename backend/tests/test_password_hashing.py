@@ -0,0 +1,60 @@
+import asyncio
+import sqlite3
+import threading
+
+from passlib.hash import bcrypt
+
+from app.utils import auth
+
+from conftest import DATABASE_PATH
+
+
+def _register(client, email):
+    response = client.post("/api/auth/register", json={"email": email, "name": "Hasher", "password": "password"})
+    assert response.status_code == 201
+
+
+def _login(client, email):
+    return client.post("/api/auth/login", data={"username": email, "password": "password"})
+
+
+def _stored_hash(email):
+    with sqlite3.connect(DATABASE_PATH) as conn:
+        return conn.execute("SELECT password_hash FROM users WHERE email = ?", (email,)).fetchone()[0]
+
+
+def test_login_upgrades_hashes_with_an_outdated_work_factor(client):
+    _register(client, "rehash@example.com")
+    with sqlite3.connect(DATABASE_PATH) as conn:
+        conn.execute(
+            "UPDATE users SET password_hash = ? WHERE email = ?",
+            (bcrypt.using(rounds=5).hash("password"), "rehash@example.com"),
+        )
+
+    assert _login(client, "rehash@example.com").status_code == 200
+    assert _stored_hash("rehash@example.com").startswith("$2b$04$")
+    assert _login(client, "rehash@example.com").status_code == 200
+
+
+def test_hashing_runs_on_the_hash_threads(client, monkeypatch):
+    _register(client, "threads@example.com")
+    threads = []
+    verify_and_update = auth.pwd_context.verify_and_update
+
+    def recording_verify(*args):
+        threads.append(threading.current_thread().name)
+        return verify_and_update(*args)
+
+    monkeypatch.setattr(auth.pwd_context, "verify_and_update", recording_verify)
+    assert _login(client, "threads@example.com").status_code == 200
+    assert len(threads) == 1
+    assert threads[0].startswith("password-hash")
+
+
+def test_logins_beyond_the_pending_limit_get_503(client, monkeypatch):
+    _register(client, "saturated@example.com")
+    monkeypatch.setattr(auth, "_hash_slots", asyncio.Semaphore(0))
+
+    response = _login(client, "saturated@example.com")
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
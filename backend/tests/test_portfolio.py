@@ -0,0 +1,31 @@
+from conftest import create_issue, query_count
+
+
+def _portfolio_item(client, headers, project_id, **params):
+    response = client.get("/api/projects/portfolio", params=params, headers=headers)
+    assert response.status_code == 200
+    return next(item for item in response.json()["items"] if item["id"] == project_id)
+
+
+def test_portfolio_reports_issue_and_manual_stats(client, admin_headers, project):
+    for priority in ("high", "high", "low"):
+        create_issue(client, admin_headers, project["id"], priority=priority)
+    client.get(f"/api/projects/{project['id']}/manual", headers=admin_headers)
+    client.put(f"/api/projects/{project['id']}/manual", json={
+        "fields": {"contacts": {"builder": {"name": "ABC Homes"}}}
+    }, headers=admin_headers)
+
+    item = _portfolio_item(client, admin_headers, project["id"])
+
+    assert (item["total_issues"], item["open_issues"], item["high_priority_open"]) == (3, 3, 2)
+    assert item["manual_sections_completed"] == 1
+    assert item["last_activity_at"] is not None
+
+
+def test_portfolio_query_count_does_not_grow_with_projects(client, admin_headers):
+    few = query_count(client.get("/api/projects/portfolio", headers=admin_headers))
+    for i in range(5):
+        project = client.post("/api/projects/", json={"name": f"Portfolio {i}", "address": "x"}, headers=admin_headers).json()
+        create_issue(client, admin_headers, project["id"])
+
+    assert query_count(client.get("/api/projects/portfolio", headers=admin_headers)) == few
@@ -0,0 +1,47 @@
+from app.utils.auth import principal_cache
+
+from conftest import query_count
+
+
+def _user_headers(client, admin_headers, email, role="project_manager"):
+    response = client.post("/api/users/", json={
+        "email": email, "name": "Cached User", "password": "password", "role": role
+    }, headers=admin_headers)
+    assert response.status_code == 201
+    login = client.post("/api/auth/login", data={"username": email, "password": "password"})
+    return response.json()["id"], {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+
+def test_repeat_requests_skip_the_user_lookup(client, admin_headers):
+    principal_cache.clear()
+    cold = client.get("/api/auth/me", headers=admin_headers)
+    hits = principal_cache.hits
+    warm = client.get("/api/auth/me", headers=admin_headers)
+
+    assert principal_cache.hits == hits + 1
+    assert query_count(warm) < query_count(cold)
+
+
+def test_role_change_applies_to_cached_users(client, admin_headers):
+    user_id, headers = _user_headers(client, admin_headers, "demoted@example.com")
+    new_project = {"name": "Role Check", "address": "5 Main St"}
+    assert client.post("/api/projects/", json=new_project, headers=headers).status_code == 201
+
+    response = client.patch(f"/api/users/{user_id}", json={"role": "viewer"}, headers=admin_headers)
+    assert response.status_code == 200
+
+    assert client.get("/api/auth/me", headers=headers).json()["role"] == "viewer"
+    assert client.post("/api/projects/", json=new_project, headers=headers).status_code == 403
+
+
+def test_deactivated_and_deleted_users_lose_access(client, admin_headers):
+    deactivated_id, deactivated = _user_headers(client, admin_headers, "deactivated@example.com")
+    deleted_id, deleted = _user_headers(client, admin_headers, "deleted@example.com")
+    assert client.get("/api/auth/me", headers=deactivated).status_code == 200
+    assert client.get("/api/auth/me", headers=deleted).status_code == 200
+
+    client.patch(f"/api/users/{deactivated_id}", json={"is_active": 0}, headers=admin_headers)
+    assert client.delete(f"/api/users/{deleted_id}", headers=admin_headers).status_code == 204
+
+    assert client.get("/api/auth/me", headers=deactivated).status_code == 403
+    assert client.get("/api/auth/me", headers=deleted).status_code == 401
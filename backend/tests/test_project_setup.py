@@ -0,0 +1,123 @@
+from conftest import query_count
+
+
+def _area_names(client, headers, project_id):
+    return [area["name"] for area in client.get(f"/api/projects/{project_id}/areas/", headers=headers).json()]
+
+
+def _contractor_ids(client, headers, project_id):
+    assignments = client.get(f"/api/projects/{project_id}/contractors", headers=headers).json()
+    return sorted(assignment["contractor_id"] for assignment in assignments)
+
+
+def _new_contractor(client, headers, company):
+    response = client.post("/api/contractors", json={"company": company}, headers=headers)
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_template_sets_up_areas_contractors_and_manual(client, admin_headers):
+    contractor_id = _new_contractor(client, admin_headers, "Template Framing")
+    response = client.post("/api/project-templates/", json={
+        "name": "Two Room Plan",
+        "areas": ["Great Room", "Loft"],
+        "contractor_ids": [contractor_id],
+        "manual_fields": {"builder_name": "Acme Homes"},
+    }, headers=admin_headers)
+    assert response.status_code == 201
+    template_id = response.json()["id"]
+
+    response = client.post("/api/projects/", params={"template_id": template_id},
+                           json={"name": "From Template", "address": "3 Main St"}, headers=admin_headers)
+    assert response.status_code == 201
+    project_id = response.json()["id"]
+
+    assert _area_names(client, admin_headers, project_id) == ["Great Room", "Loft"]
+    assert _contractor_ids(client, admin_headers, project_id) == [contractor_id]
+    manual = client.get(f"/api/projects/{project_id}/manual", headers=admin_headers).json()
+    assert manual["fields"] == {"builder_name": "Acme Homes"}
+
+
+def test_clone_copies_the_source_project_setup(client, admin_headers, project):
+    response = client.post("/api/projects/", params={"clone_from": project["id"]},
+                           json={"name": "Clone", "address": "4 Main St"}, headers=admin_headers)
+    assert response.status_code == 201
+    clone_id = response.json()["id"]
+
+    assert _area_names(client, admin_headers, clone_id) == _area_names(client, admin_headers, project["id"])
+    assert _contractor_ids(client, admin_headers, clone_id) == _contractor_ids(client, admin_headers, project["id"])
+
+
+def _assignment_trades(client, headers, project_id, contractor_id):
+    assignments = client.get(f"/api/projects/{project_id}/contractors", headers=headers).json()
+    assignment = next(a for a in assignments if a["contractor_id"] == contractor_id)
+    return assignment["trade_ids"], assignment["trades"]
+
+
+def test_assigned_trades_follow_trade_renames(client, admin_headers):
+    trade = client.post("/api/trades", json={"name": "Setup Stucco"}, headers=admin_headers).json()
+    contractor_id = client.post("/api/contractors", json={
+        "company": "Stucco Pros", "trade_ids": [trade["id"]],
+    }, headers=admin_headers).json()["id"]
+
+    # Auto-assign links the contractor's trades; a clone copies the links
+    project_id = client.post("/api/projects/", json={"name": "Stucco Job", "address": "5 Main St"},
+                             headers=admin_headers).json()["id"]
+    clone_id = client.post("/api/projects/", params={"clone_from": project_id},
+                           json={"name": "Stucco Clone", "address": "6 Main St"}, headers=admin_headers).json()["id"]
+    for pid in (project_id, clone_id):
+        assert _assignment_trades(client, admin_headers, pid, contractor_id) == ([trade["id"]], ["Setup Stucco"])
+
+    response = client.patch(f"/api/trades/{trade['id']}", json={"name": "Setup Plaster"}, headers=admin_headers)
+    assert response.status_code == 200
+    for pid in (project_id, clone_id):
+        assert _assignment_trades(client, admin_headers, pid, contractor_id) == ([trade["id"]], ["Setup Plaster"])
+
+
+def test_assignment_trades_by_id_or_name(client, admin_headers, project):
+    drywall = client.post("/api/trades", json={"name": "Setup Drywall"}, headers=admin_headers).json()
+    tape = client.post("/api/trades", json={"name": "Setup Tape"}, headers=admin_headers).json()
+    contractor_id = _new_contractor(client, admin_headers, "Assigned Drywall")
+    url = f"/api/projects/{project['id']}/contractors"
+
+    response = client.post(url, json={
+        "contractor_id": contractor_id, "trades": ["Setup Tape", "No Such Trade"],
+    }, headers=admin_headers)
+    assert response.status_code == 201
+    assert response.json()["trade_ids"] == [tape["id"]]
+
+    response = client.patch(f"{url}/{response.json()['id']}", json={
+        "contractor_id": contractor_id, "trade_ids": [drywall["id"], tape["id"]],
+    }, headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json()["trades"] == ["Setup Drywall", "Setup Tape"]
+
+
+def test_invalid_setup_options_are_rejected(client, admin_headers, project):
+    template_id = client.post("/api/project-templates/", json={"name": "Rejected Options"}, headers=admin_headers).json()["id"]
+    for params in (
+        {"template_id": 999999},
+        {"clone_from": 999999},
+        {"template_id": template_id, "clone_from": project["id"]},
+    ):
+        response = client.post("/api/projects/", params=params, json={"name": "Nope", "address": "x"}, headers=admin_headers)
+        assert response.status_code == 400
+
+
+def test_bulk_create_sets_up_every_project_with_fixed_query_count(client, admin_headers):
+    def bulk_create(count):
+        response = client.post("/api/projects/bulk", json={
+            "projects": [{"name": f"Lot {i}", "address": f"{i} Subdivision Way"} for i in range(count)],
+        }, headers=admin_headers)
+        assert response.status_code == 201
+        return response
+
+    few = bulk_create(2)
+    many = bulk_create(25)
+    projects = many.json()
+
+    assert [project["name"] for project in projects] == [f"Lot {i}" for i in range(25)]
+    default_areas = _area_names(client, admin_headers, few.json()[0]["id"])
+    assert default_areas
+    assert all(_area_names(client, admin_headers, project["id"]) == default_areas for project in projects)
+    assert query_count(many) == query_count(few)
@@ -0,0 +1,35 @@
+from app.services.ref_cache import reference_cache
+from app.utils.auth import principal_cache
+
+from conftest import query_count
+
+
+def _cold_query_count(client, url, headers) -> int:
+    # Start from empty caches so every request does the same lookups
+    reference_cache.clear()
+    principal_cache.clear()
+    response = client.get(url, headers=headers)
+    assert response.status_code == 200
+    return query_count(response)
+
+
+def _add_contractors(client, headers, count, trades):
+    for i in range(count):
+        response = client.post("/api/contractors", json={
+            "company": f"Contractor {i}",
+            "trade_ids": [trades[i % len(trades)]["id"], trades[(i + 1) % len(trades)]["id"]],
+        }, headers=headers)
+        assert response.status_code == 201
+
+
+def test_contractor_and_trade_lists_use_fixed_query_counts(client, admin_headers):
+    trades = client.get("/api/trades", headers=admin_headers).json()
+    urls = ["/api/contractors", "/api/trades"]
+
+    _add_contractors(client, admin_headers, 3, trades)
+    few = [_cold_query_count(client, url, admin_headers) for url in urls]
+    _add_contractors(client, admin_headers, 27, trades)
+    many = [_cold_query_count(client, url, admin_headers) for url in urls]
+
+    assert len(client.get("/api/contractors", headers=admin_headers).json()) >= 30
+    assert few == many
@@ -0,0 +1,38 @@
+import json
+import logging
+
+from app.services import query_stats
+
+from conftest import query_count
+
+
+def test_server_timing_reports_queries_and_durations(client, admin_headers, project):
+    response = client.get(f"/api/projects/{project['id']}", headers=admin_headers)
+    assert response.status_code == 200
+
+    timing = response.headers["server-timing"]
+    assert timing.startswith("db;dur=")
+    assert ", app;dur=" in timing
+    assert query_count(response) > 0
+
+
+def test_requests_without_sql_report_zero_queries(client):
+    response = client.get("/api/health")
+    assert response.status_code == 200
+    assert query_count(response) == 0
+
+
+def test_threshold_warning_lists_statements(client, admin_headers, project, caplog, monkeypatch):
+    monkeypatch.setattr(query_stats.settings, "sql_query_warn_threshold", 1)
+
+    with caplog.at_level(logging.WARNING, logger="blue_tape.sql"):
+        response = client.get(f"/api/projects/{project['id']}/issues/", headers=admin_headers)
+    assert response.status_code == 200
+
+    warnings = [r for r in caplog.records if r.name == "blue_tape.sql" and r.levelno == logging.WARNING]
+    assert warnings
+    record = json.loads(warnings[-1].getMessage().split(" ", 4)[-1])
+    assert record["path"] == f"/api/projects/{project['id']}/issues/"
+    assert record["queries"] == query_count(response)
+    assert len(record["statements"]) == record["queries"]
+    assert all(statement["sql"] for statement in record["statements"])
@@ -0,0 +1,94 @@
+import itertools
+import time
+
+import pytest
+
+from app import database
+
+from conftest import first_area_id
+
+
+def _last_write(response):
+    value = response.headers.get("x-last-write")
+    return int(value) / 1000 if value is not None else None
+
+
+@pytest.fixture
+def replica_sessions(monkeypatch):
+    """Route replica reads to the read pool, counting how many requests take a replica."""
+    used = []
+
+    def replica_session():
+        used.append(True)
+        return database.ReadSessionLocal()
+
+    monkeypatch.setattr(database, "_replica_cycle", itertools.cycle([replica_session]))
+    return used
+
+
+def test_bulk_issue_create_reports_the_write(client, admin_headers, project):
+    response = client.post(f"/api/projects/{project['id']}/issues/bulk", json={"items": [
+        {"area_id": first_area_id(client, admin_headers, project["id"]), "category": "Paint", "description": f"Scuff {i}"}
+        for i in range(3)
+    ]}, headers=admin_headers)
+
+    assert response.status_code == 200
+    assert abs(_last_write(response) - time.time()) < 5
+    assert response.cookies.get("last_write") == response.headers["x-last-write"]
+
+
+def test_area_reorder_reports_the_write(client, admin_headers, project):
+    areas = client.get(f"/api/projects/{project['id']}/areas/", headers=admin_headers).json()
+
+    response = client.post(
+        f"/api/projects/{project['id']}/areas/reorder",
+        json=[area["id"] for area in reversed(areas)], headers=admin_headers
+    )
+
+    assert response.status_code == 200
+    assert _last_write(response) is not None
+
+
+def test_reads_and_failed_writes_do_not_report_a_write(client, admin_headers, project):
+    assert _last_write(client.get(f"/api/projects/{project['id']}/issues/", headers=admin_headers)) is None
+    response = client.post(f"/api/projects/{project['id']}/areas/bulk", json={"delete": [999999]}, headers=admin_headers)
+    assert response.status_code == 400
+    assert _last_write(response) is None
+
+
+def test_reads_after_a_write_stay_on_the_primary(client, admin_headers, project, replica_sessions):
+    url = f"/api/projects/{project['id']}"
+    write = client.patch(url, json={"notes": "fresh"}, headers=admin_headers)
+    last_write = write.headers["x-last-write"]
+    # Cookies would make every request below look like it followed the write
+    client.cookies.clear()
+
+    client.get(url, headers=admin_headers)
+    assert len(replica_sessions) == 1
+
+    # Any worker can tell from the header alone
+    response = client.get(url, headers={**admin_headers, "X-Last-Write": last_write})
+    assert response.json()["notes"] == "fresh"
+    assert len(replica_sessions) == 1
+
+    stale = str(int((time.time() - 3600) * 1000))
+    client.get(url, headers={**admin_headers, "X-Last-Write": stale})
+    assert len(replica_sessions) == 2
+
+
+def test_client_supplied_write_times_only_choose_the_pool(client, admin_headers, project, replica_sessions):
+    url = f"/api/projects/{project['id']}"
+    client.cookies.clear()
+
+    for value in ("garbage", "nan", "inf", "-1"):
+        assert client.get(url, headers={**admin_headers, "X-Last-Write": value}).status_code == 200
+    assert len(replica_sessions) == 4
+
+    # A far-future time counts for no more than a stale one
+    future = str(int((time.time() + 3600) * 1000))
+    client.get(url, headers={**admin_headers, "X-Last-Write": future})
+    assert len(replica_sessions) == 5
+
+    # Without a valid token the request still fails authentication
+    response = client.get(url, headers={"Authorization": "Bearer forged", "X-Last-Write": str(int(time.time() * 1000))})
+    assert response.status_code == 401
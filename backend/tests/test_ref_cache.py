@@ -0,0 +1,59 @@
+import sqlite3
+
+from app.services.ref_cache import reference_cache
+
+from conftest import DATABASE_PATH, query_count
+
+
+def _trade_names(client, headers):
+    response = client.get("/api/trades", headers=headers)
+    assert response.status_code == 200
+    return response, {trade["name"] for trade in response.json()}
+
+
+def _bump_generation_elsewhere():
+    """What another worker's committed invalidation looks like from here."""
+    with sqlite3.connect(DATABASE_PATH) as conn:
+        conn.execute("UPDATE cache_generations SET generation = generation + 1 WHERE name = 'reference'")
+
+
+def test_trade_list_is_served_from_cache(client, admin_headers):
+    reference_cache.clear()
+    cold, _ = _trade_names(client, admin_headers)
+    hits = reference_cache.hits
+    warm, _ = _trade_names(client, admin_headers)
+
+    assert reference_cache.hits == hits + 1
+    assert query_count(warm) < query_count(cold)
+
+
+def test_trade_writes_invalidate_the_cache(client, admin_headers):
+    _trade_names(client, admin_headers)
+    response = client.post("/api/trades", json={"name": "Cached Trade"}, headers=admin_headers)
+    assert response.status_code == 201
+    trade_id = response.json()["id"]
+
+    _, names = _trade_names(client, admin_headers)
+    assert "Cached Trade" in names
+
+    response = client.patch(f"/api/trades/{trade_id}", json={"name": "Renamed Cached Trade"}, headers=admin_headers)
+    assert response.status_code == 200
+    _, names = _trade_names(client, admin_headers)
+    assert "Renamed Cached Trade" in names
+    assert "Cached Trade" not in names
+
+    assert client.delete(f"/api/trades/{trade_id}", headers=admin_headers).status_code == 204
+    _, names = _trade_names(client, admin_headers)
+    assert "Renamed Cached Trade" not in names
+
+
+def test_generation_bump_from_another_worker_drops_entries(client, admin_headers, monkeypatch):
+    _trade_names(client, admin_headers)
+    monkeypatch.setattr(reference_cache, "check_interval", 0)
+    _trade_names(client, admin_headers)
+    misses = reference_cache.misses
+
+    _bump_generation_elsewhere()
+    _trade_names(client, admin_headers)
+
+    assert reference_cache.misses == misses + 1
@@ -0,0 +1,75 @@
+import sqlite3
+
+from app.utils import auth
+
+from conftest import DATABASE_PATH
+
+
+def _login(client, email, password="password"):
+    response = client.post("/api/auth/login", data={"username": email, "password": password})
+    assert response.status_code == 200
+    return response.json()
+
+
+def _register_and_login(client, email):
+    client.post("/api/auth/register", json={"email": email, "name": "Refresher", "password": "password"})
+    return _login(client, email)
+
+
+def _refresh(client, refresh_token):
+    return client.post("/api/auth/refresh", json={"refresh_token": refresh_token})
+
+
+def test_refresh_rotates_tokens_without_hashing_a_password(client, monkeypatch):
+    tokens = _register_and_login(client, "rotate@example.com")
+
+    async def no_hashing(*args):
+        raise AssertionError("refresh must not run bcrypt")
+
+    monkeypatch.setattr(auth, "_run_hash", no_hashing)
+    response = _refresh(client, tokens["refresh_token"])
+    assert response.status_code == 200
+    rotated = response.json()
+
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+    me = client.get("/api/auth/me", headers={"Authorization": f"Bearer {rotated['access_token']}"})
+    assert me.json()["email"] == "rotate@example.com"
+    assert _refresh(client, rotated["refresh_token"]).status_code == 200
+
+
+def test_reusing_a_refresh_token_revokes_its_family(client):
+    tokens = _register_and_login(client, "reuse@example.com")
+    other_login = _login(client, "reuse@example.com")
+    rotated = _refresh(client, tokens["refresh_token"]).json()
+
+    assert _refresh(client, tokens["refresh_token"]).status_code == 401
+    assert _refresh(client, rotated["refresh_token"]).status_code == 401
+    assert _refresh(client, other_login["refresh_token"]).status_code == 200
+
+
+def test_logout_and_password_change_revoke_refresh_tokens(client):
+    first = _register_and_login(client, "logout@example.com")
+    second = _login(client, "logout@example.com")
+
+    assert client.post("/api/auth/logout", json={"refresh_token": first["refresh_token"]}).status_code == 204
+    assert _refresh(client, first["refresh_token"]).status_code == 401
+    # Unknown tokens log out quietly
+    assert client.post("/api/auth/logout", json={"refresh_token": "unknown"}).status_code == 204
+
+    response = client.put("/api/auth/me/password", json={
+        "current_password": "password", "new_password": "new-password"
+    }, headers={"Authorization": f"Bearer {second['access_token']}"})
+    assert response.status_code == 200
+    assert _refresh(client, second["refresh_token"]).status_code == 401
+
+
+def test_expired_and_unknown_refresh_tokens_are_rejected(client):
+    tokens = _register_and_login(client, "expired@example.com")
+    with sqlite3.connect(DATABASE_PATH) as conn:
+        conn.execute(
+            "UPDATE refresh_tokens SET expires_at = '2000-01-01 00:00:00' "
+            "WHERE user_id = (SELECT id FROM users WHERE email = 'expired@example.com')"
+        )
+
+    assert _refresh(client, tokens["refresh_token"]).status_code == 401
+    assert _refresh(client, "not-a-token").status_code == 401
@@ -0,0 +1,34 @@
+def _search_issue_ids(client, headers, q):
+    response = client.get("/api/search/", params={"q": q, "kind": "issue"}, headers=headers)
+    assert response.status_code == 200
+    return {item["id"] for item in response.json()["items"]}
+
+
+def _create_issue(client, headers, project, **fields):
+    areas = client.get(f"/api/projects/{project['id']}/areas/", headers=headers).json()
+    response = client.post(f"/api/projects/{project['id']}/issues/", json={
+        "area_id": areas[0]["id"], "category": "Finish", **fields
+    }, headers=headers)
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_issues_are_found_by_words_in_their_description(client, admin_headers, project):
+    issue = _create_issue(client, admin_headers, project, description="Grout missing behind vanity")
+
+    assert issue["id"] in _search_issue_ids(client, admin_headers, "vanit grout")
+    assert issue["id"] not in _search_issue_ids(client, admin_headers, "grout chandelier")
+
+
+def test_issue_documents_follow_trade_renames(client, admin_headers, project):
+    trade = client.post("/api/trades", json={"name": "Quartzwork"}, headers=admin_headers).json()
+    issue = _create_issue(
+        client, admin_headers, project, description="Seam visible", trade="stone", trade_id=trade["id"]
+    )
+    assert issue["id"] in _search_issue_ids(client, admin_headers, "quartzwork")
+
+    response = client.patch(f"/api/trades/{trade['id']}", json={"name": "Zebrawood"}, headers=admin_headers)
+    assert response.status_code == 200
+
+    assert issue["id"] in _search_issue_ids(client, admin_headers, "zebrawood")
+    assert issue["id"] not in _search_issue_ids(client, admin_headers, "quartzwork")
@@ -0,0 +1,51 @@
+import sqlite3
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app import database
+
+
+def _pragma(conn, name):
+    return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_writer_connections_use_the_wal_profile():
+    with database.engine.connect() as conn:
+        assert _pragma(conn, "journal_mode") == "wal"
+        assert _pragma(conn, "synchronous") == 1  # NORMAL
+        assert _pragma(conn, "busy_timeout") == database.settings.sqlite_busy_timeout_ms
+        assert _pragma(conn, "cache_size") == database.settings.sqlite_cache_size
+        assert _pragma(conn, "mmap_size") == database.settings.sqlite_mmap_size
+        assert _pragma(conn, "query_only") == 0
+
+
+def test_read_pool_connections_are_query_only(client):
+    settings = database.settings
+
+    def check(conn):
+        assert _pragma(conn, "query_only") == 1
+        assert _pragma(conn, "mmap_size") == settings.sqlite_mmap_size
+        assert _pragma(conn, "busy_timeout") == settings.sqlite_busy_timeout_ms
+        assert conn.execute(text("SELECT count(*) FROM users")).scalar() >= 0
+        with pytest.raises(OperationalError, match="readonly"):
+            conn.execute(text("DELETE FROM users"))
+
+    async def check_read_engine():
+        # run_sync hands over the read_engine.sync_engine connection behind the async one
+        async with database.read_engine.connect() as conn:
+            await conn.run_sync(check)
+
+    # On the app's event loop, where the read pool's aiosqlite connections live
+    client.portal.call(check_read_engine)
+
+
+def test_invalid_synchronous_mode_is_rejected(monkeypatch):
+    monkeypatch.setattr(database.settings, "sqlite_synchronous", "SOMETIMES")
+    conn = sqlite3.connect(":memory:")
+    try:
+        with pytest.raises(ValueError):
+            database.apply_sqlite_pragmas(conn)
+    finally:
+        conn.close()
@@ -0,0 +1,16 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app import database
+
+
+def test_supported_database_passes():
+    database.verify_database_dialect()
+
+
+def test_unsupported_database_is_rejected(monkeypatch):
+    monkeypatch.setattr(database, "engine", SimpleNamespace(dialect=SimpleNamespace(name="mysql")))
+
+    with pytest.raises(RuntimeError, match="Unsupported database 'mysql'"):
+        database.verify_database_dialect()
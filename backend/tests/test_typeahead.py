@@ -0,0 +1,75 @@
+import pytest
+
+from app.services.typeahead import project_typeahead_cache, contractor_typeahead_cache
+
+
+def _suggest(client, headers, project_id, kind, q=""):
+    params = {"q": q, "kind": kind}
+    if project_id is not None:
+        params["project_id"] = project_id
+    response = client.get("/api/typeahead/", params=params, headers=headers)
+    assert response.status_code == 200
+    return response.json()["items"]
+
+
+@pytest.fixture
+def always_check_generations(monkeypatch):
+    """Re-read generations on every lookup, as another worker would after the check interval."""
+    monkeypatch.setattr(project_typeahead_cache, "check_interval", 0)
+    monkeypatch.setattr(contractor_typeahead_cache, "check_interval", 0)
+
+
+def test_area_suggestions_match_word_prefixes(client, admin_headers, project):
+    labels = [item["label"] for item in _suggest(client, admin_headers, project["id"], "area", "bed")]
+
+    assert labels and all("bed" in label.lower() for label in labels)
+
+
+def test_area_change_only_drops_that_projects_index(client, admin_headers, always_check_generations):
+    first, second = (
+        client.post("/api/projects/", json={"name": name, "address": "1 Main St"}, headers=admin_headers).json()
+        for name in ("First", "Second")
+    )
+    for project in (first, second):
+        _suggest(client, admin_headers, project["id"], "area")
+    _suggest(client, admin_headers, None, "contractor")
+
+    area = _suggest(client, admin_headers, first["id"], "area")[0]
+    response = client.patch(
+        f"/api/projects/{first['id']}/areas/{area['id']}", json={"name": "Sunroom"}, headers=admin_headers
+    )
+    assert response.status_code == 200
+
+    project_misses, contractor_misses = project_typeahead_cache.misses, contractor_typeahead_cache.misses
+    _suggest(client, admin_headers, second["id"], "area")
+    _suggest(client, admin_headers, None, "contractor")
+    assert (project_typeahead_cache.misses, contractor_typeahead_cache.misses) == (project_misses, contractor_misses)
+
+    labels = [item["label"] for item in _suggest(client, admin_headers, first["id"], "area", "sun")]
+    assert labels == ["Sunroom"]
+    assert project_typeahead_cache.misses == project_misses + 1
+
+
+def test_contractor_suggestions_within_a_project_are_its_assignments(client, admin_headers):
+    assigned, unassigned = (
+        client.post("/api/contractors", json={"company": company}, headers=admin_headers).json()
+        for company in ("Harbor Plumbing", "Harbor Roofing")
+    )
+    project = client.post(
+        "/api/projects/", params={"assign_all_contractors": False},
+        json={"name": "Harbor", "address": "1 Main St"}, headers=admin_headers
+    ).json()
+    response = client.post(
+        f"/api/projects/{project['id']}/contractors", json={"contractor_id": assigned["id"]}, headers=admin_headers
+    )
+    assert response.status_code == 201
+
+    in_project = {item["id"] for item in _suggest(client, admin_headers, project["id"], "contractor", "harbor")}
+    everywhere = {item["id"] for item in _suggest(client, admin_headers, None, "contractor", "harbor")}
+
+    assert in_project == {assigned["id"]}
+    assert everywhere >= {assigned["id"], unassigned["id"]}
+
+    assignment_id = response.json()["id"]
+    client.delete(f"/api/projects/{project['id']}/contractors/{assignment_id}", headers=admin_headers)
+    assert _suggest(client, admin_headers, project["id"], "contractor", "harbor") == []
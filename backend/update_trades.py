@@ -1,7 +1,10 @@
 """
-Script to update trades with comprehensive list for new construction
+Script to update trades with comprehensive list for new construction.
+Runs against DATABASE_URL; the schema must be migrated (alembic upgrade head).
 """
-import sqlite3
+from sqlalchemy import text
+
+from app.database import engine
 
 # New comprehensive trades for new construction
 NEW_TRADES = [
@@ -51,28 +54,43 @@ NEW_TRADES = [
 
 
 def update_trades():
-    conn = sqlite3.connect('blue_tape.db')
-    cursor = conn.cursor()
+    with engine.begin() as conn:
+        existing = dict(conn.execute(text('SELECT name, id FROM trades')).fetchall())
 
-    # Clear existing trades (keeping contractors linked)
-    cursor.execute('DELETE FROM trades')
+        # Update trades in place so contractor links (contractor_trades) survive
+        updated = [trade for trade in NEW_TRADES if trade['name'] in existing]
+        if updated:
+            conn.execute(
+                text('UPDATE trades SET icon = :icon, "order" = :order, description = :description, '
+                     'is_active = 1 WHERE name = :name'),
+                updated
+            )
+        new_trades = [trade for trade in NEW_TRADES if trade['name'] not in existing]
+        if new_trades:
+            conn.execute(
+                text('INSERT INTO trades (name, icon, "order", description, is_active) '
+                     'VALUES (:name, :icon, :order, :description, 1)'),
+                new_trades
+            )
 
-    # Insert new trades
-    for trade in NEW_TRADES:
-        cursor.execute(
-            'INSERT INTO trades (name, icon, "order", description, is_active) VALUES (?, ?, ?, ?, 1)',
-            (trade['name'], trade['icon'], trade['order'], trade['description'])
-        )
+        # Trades that are no longer in the list are deactivated, not deleted
+        names = {trade['name'] for trade in NEW_TRADES}
+        retired = [{'id': id} for name, id in existing.items() if name not in names]
+        if retired:
+            conn.execute(text('UPDATE trades SET is_active = 0 WHERE id = :id'), retired)
 
-    conn.commit()
-    print(f'✅ Insertadas {len(NEW_TRADES)} categorías de construcción nueva')
+        # Make every running worker drop its cached trades
+        conn.execute(text(
+            "UPDATE cache_generations SET generation = generation + 1 WHERE name = 'reference'"
+        ))
 
-    # Show the result
-    cursor.execute('SELECT id, icon, name, description FROM trades ORDER BY "order"')
-    for row in cursor.fetchall():
-        print(f'  {row[1]} {row[2]}: {row[3]}')
+    print(f'✅ Actualizadas {len(NEW_TRADES)} categorías de construcción nueva ({len(new_trades)} nuevas, {len(retired)} desactivadas)')
 
-    conn.close()
+    # Show the result
+    with engine.connect() as conn:
+        rows = conn.execute(text('SELECT id, icon, name, description FROM trades ORDER BY "order"'))
+        for row in rows:
+            print(f'  {row[1]} {row[2]}: {row[3]}')
 
 
 if __name__ == "__main__":
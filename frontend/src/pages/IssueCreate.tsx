@@ -9,6 +9,7 @@ import {
     Button,
     TextField,
     MenuItem,
+    Autocomplete,
     Stepper,
     Step,
     StepLabel,
@@ -19,11 +20,11 @@ import {
 
 import { useDropzone } from 'react-dropzone';
 import { CloudUpload as UploadIcon, Delete as DeleteIcon } from '@mui/icons-material';
-import type { Area, IssueCreate, IssuePriority, ProjectContractor } from '../types';
+import type { Area, IssueCreate, IssuePriority, TypeaheadItem } from '../types';
 import { areasService } from '../services/areas';
-import { contractorsService } from '../services/contractors';
 import { issuesService } from '../services/issues';
 import { projectsService } from '../services/projects';
+import { typeaheadService } from '../services/typeahead';
 
 const steps = ['Select Area', 'Add Photos', 'Issue Details', 'Assign'];
 
@@ -42,7 +43,9 @@ const IssueCreate: React.FC = () => {
     const [activeStep, setActiveStep] = useState(0);
     const [projectName, setProjectName] = useState('');
     const [areas, setAreas] = useState<Area[]>([]);
-    const [contractors, setContractors] = useState<ProjectContractor[]>([]);
+    const [contractorQuery, setContractorQuery] = useState('');
+    const [contractorOptions, setContractorOptions] = useState<TypeaheadItem[]>([]);
+    const [selectedContractor, setSelectedContractor] = useState<TypeaheadItem | null>(null);
     const [photos, setPhotos] = useState<File[]>([]);
     const [photoPreview, setPhotoPreview] = useState<string[]>([]);
 
@@ -62,14 +65,12 @@ const IssueCreate: React.FC = () => {
 
     const loadData = async () => {
         try {
-            const [project, areasData, contractorsData] = await Promise.all([
+            const [project, areasData] = await Promise.all([
                 projectsService.get(Number(projectId)),
                 areasService.list(Number(projectId)),
-                contractorsService.listProjectContractors(Number(projectId)),
             ]);
             setProjectName(project.name);
             setAreas(areasData);
-            setContractors(contractorsData);
         } catch (error) {
             console.error('Failed to load data:', error);
         } finally {
@@ -77,6 +78,25 @@ const IssueCreate: React.FC = () => {
         }
     };
 
+    // Suggestions for the project's assigned contractors, fetched as the user types
+    useEffect(() => {
+        if (activeStep !== 3) return;
+        const timer = setTimeout(async () => {
+            try {
+                setContractorOptions(
+                    await typeaheadService.suggest(contractorQuery, {
+                        kind: ['contractor'],
+                        project_id: Number(projectId),
+                        limit: 20,
+                    })
+                );
+            } catch (error) {
+                console.error('Failed to load contractors:', error);
+            }
+        }, 200);
+        return () => clearTimeout(timer);
+    }, [contractorQuery, activeStep, projectId]);
+
     const onDrop = useCallback((acceptedFiles: File[]) => {
         const newPhotos = [...photos, ...acceptedFiles].slice(0, 10);
         setPhotos(newPhotos);
@@ -298,21 +318,34 @@ const IssueCreate: React.FC = () => {
                     {activeStep === 3 && (
                         <Box>
                             <Typography variant="h6" sx={{ mb: 2 }}>Assign to Contractor</Typography>
-                            <TextField
-                                select
-                                fullWidth
-                                label="Contractor (optional)"
-                                value={formData.contractor_id || ''}
-                                onChange={(e) => setFormData({ ...formData, contractor_id: Number(e.target.value) || undefined })}
+                            <Autocomplete
+                                options={contractorOptions}
+                                filterOptions={(options) => options}
+                                getOptionLabel={(option) => option.label}
+                                isOptionEqualToValue={(option, value) => option.id === value.id}
+                                value={selectedContractor}
+                                onChange={(_, value) => {
+                                    setSelectedContractor(value);
+                                    setFormData({ ...formData, contractor_id: value?.id ?? undefined });
+                                }}
+                                onInputChange={(_, value) => setContractorQuery(value)}
+                                renderOption={(props, option) => (
+                                    <li {...props} key={option.id}>
+                                        <Box>
+                                            <Typography>{option.label}</Typography>
+                                            {option.detail && (
+                                                <Typography variant="caption" color="text.secondary">
+                                                    {option.detail}
+                                                </Typography>
+                                            )}
+                                        </Box>
+                                    </li>
+                                )}
+                                renderInput={(params) => (
+                                    <TextField {...params} label="Contractor (optional)" placeholder="Type to search..." />
+                                )}
                                 sx={{ mb: 2 }}
-                            >
-                                <MenuItem value="">No assignment</MenuItem>
-                                {contractors.map((pc) => (
-                                    <MenuItem key={pc.id} value={pc.contractor.id}>
-                                        {pc.contractor.company}
-                                    </MenuItem>
-                                ))}
-                            </TextField>
+                            />
                             <Typography variant="caption" color="text.secondary">
                                 Leave empty to assign later
                             </Typography>
@@ -86,12 +86,12 @@ const ProjectDetail: React.FC = () => {
         try {
             const [dashboardData, issuesData, areasData, contractorsData] = await Promise.all([
                 projectsService.getDashboard(Number(id)),
-                issuesService.list(Number(id)),
+                issuesService.listAll(Number(id)),
                 areasService.list(Number(id)),
                 contractorsService.listProjectContractors(Number(id)),
             ]);
             setDashboard(dashboardData);
-            setIssues(issuesData.items);
+            setIssues(issuesData);
             setAreas(areasData);
             setContractors(contractorsData);
         } catch (error) {
@@ -29,7 +29,7 @@ import {
     MoreVert as MoreIcon,
     LocationOn as LocationIcon,
 } from '@mui/icons-material';
-import type { Project, ProjectCreate, ProjectStatus } from '../types';
+import type { Project, ProjectCreate, ProjectPortfolioItem, ProjectStatus } from '../types';
 import { projectsService } from '../services/projects';
 
 const statusColors: Record<ProjectStatus, 'success' | 'warning' | 'default'> = {
@@ -40,7 +40,7 @@ const statusColors: Record<ProjectStatus, 'success' | 'warning' | 'default'> = {
 
 const Projects: React.FC = () => {
     const navigate = useNavigate();
-    const [projects, setProjects] = useState<Project[]>([]);
+    const [projects, setProjects] = useState<ProjectPortfolioItem[]>([]);
     const [loading, setLoading] = useState(true);
     const [search, setSearch] = useState('');
     const [createDialogOpen, setCreateDialogOpen] = useState(false);
@@ -68,8 +68,7 @@ const Projects: React.FC = () => {
 
     const loadProjects = async () => {
         try {
-            const response = await projectsService.list();
-            setProjects(response.items);
+            setProjects(await projectsService.portfolio());
         } catch (error) {
             console.error('Failed to load projects:', error);
         } finally {
@@ -83,7 +82,17 @@ const Projects: React.FC = () => {
         setCreating(true);
         try {
             const created = await projectsService.create(newProject, true);
-            setProjects([created, ...projects]);
+            setProjects([{
+                ...created,
+                total_issues: 0,
+                open_issues: 0,
+                high_priority_open: 0,
+                ready_for_reinspect: 0,
+                closed_issues: 0,
+                manual_sections_completed: 0,
+                manual_sections_total: 0,
+                manual_completion: 0,
+            }, ...projects]);
             setCreateDialogOpen(false);
             setNewProject({ name: '', address: '', unit: '', notes: '' });
             navigate(`/projects/${created.id}`);
@@ -133,7 +142,7 @@ const Projects: React.FC = () => {
         setSaving(true);
         try {
             const updated = await projectsService.update(selectedProject.id, editProject);
-            setProjects(projects.map(p => p.id === updated.id ? updated : p));
+            setProjects(projects.map(p => p.id === updated.id ? { ...p, ...updated } : p));
             setEditDialogOpen(false);
             setSelectedProject(null);
         } catch (error) {
@@ -232,6 +241,20 @@ const Projects: React.FC = () => {
                                             {project.unit && ` • ${project.unit}`}
                                         </Typography>
                                     </Box>
+                                    <Box sx={{ display: 'flex', flexWrap: 'wrap', gap: 1, mt: 2 }}>
+                                        <Chip label={`${project.open_issues} open`} size="small" variant="outlined" />
+                                        {project.high_priority_open > 0 && (
+                                            <Chip label={`${project.high_priority_open} high priority`} size="small" color="error" variant="outlined" />
+                                        )}
+                                        {project.ready_for_reinspect > 0 && (
+                                            <Chip label={`${project.ready_for_reinspect} reinspect`} size="small" color="info" variant="outlined" />
+                                        )}
+                                        <Chip
+                                            label={`Manual ${Math.round(project.manual_completion * 100)}%`}
+                                            size="small"
+                                            variant="outlined"
+                                        />
+                                    </Box>
                                 </CardContent>
                             </CardActionArea>
                         </Card>
@@ -1,4 +1,5 @@
-import axios from 'axios';
+import axios, { type InternalAxiosRequestConfig } from 'axios';
+import type { Token } from '../types';
 
 const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
@@ -9,24 +10,79 @@ const api = axios.create({
     },
 });
 
+// Time of this client's last write, echoed back so reads right after a write
+// aren't sent to a read replica that hasn't caught up yet
+const LAST_WRITE_HEADER = 'X-Last-Write';
+
 // Add auth token to requests
 api.interceptors.request.use((config) => {
     const token = localStorage.getItem('token');
     if (token) {
         config.headers.Authorization = `Bearer ${token}`;
     }
+    const lastWrite = localStorage.getItem('last_write');
+    if (lastWrite) {
+        config.headers[LAST_WRITE_HEADER] = lastWrite;
+    }
     return config;
 });
 
-// Handle auth errors
+// Refresh tokens are single-use, so concurrent 401s share one refresh request
+let refreshing: Promise<string | null> | null = null;
+
+export const refreshAccessToken = (): Promise<string | null> => {
+    const refreshToken = localStorage.getItem('refresh_token');
+    if (!refreshToken) {
+        return Promise.resolve(null);
+    }
+    if (!refreshing) {
+        refreshing = axios
+            .post<Token>(`${API_URL}/api/auth/refresh`, { refresh_token: refreshToken })
+            .then((response) => {
+                localStorage.setItem('token', response.data.access_token);
+                localStorage.setItem('refresh_token', response.data.refresh_token ?? '');
+                localStorage.setItem('user', JSON.stringify(response.data.user));
+                return response.data.access_token;
+            })
+            .catch(() => {
+                localStorage.removeItem('token');
+                localStorage.removeItem('refresh_token');
+                localStorage.removeItem('user');
+                return null;
+            })
+            .finally(() => {
+                refreshing = null;
+            });
+    }
+    return refreshing;
+};
+
+// Remember the last write time and handle auth errors
 api.interceptors.response.use(
-    (response) => response,
-    (error) => {
+    (response) => {
+        const lastWrite = response.headers[LAST_WRITE_HEADER.toLowerCase()];
+        if (lastWrite) {
+            localStorage.setItem('last_write', lastWrite);
+        }
+        return response;
+    },
+    async (error) => {
         // Only handle 401 for non-auth endpoints
         // This prevents logout during login flow race conditions
         const isAuthEndpoint = error.config?.url?.includes('/auth/');
+        const original = error.config as (InternalAxiosRequestConfig & { _retried?: boolean }) | undefined;
 
         if (error.response?.status === 401 && !isAuthEndpoint) {
+            // Expired access token - swap the refresh token and retry once
+            if (original && !original._retried) {
+                const token = await refreshAccessToken();
+                if (token) {
+                    original._retried = true;
+                    original.headers.Authorization = `Bearer ${token}`;
+                    return api(original);
+                }
+            }
+
             // Verify token is actually missing or invalid, not just a race condition
             const token = localStorage.getItem('token');
             if (!token) {
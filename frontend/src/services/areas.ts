@@ -1,5 +1,5 @@
 import api from './api';
-import type { Area, AreaCreate } from '../types';
+import type { Area, AreaBulkOperation, AreaCreate } from '../types';
 
 export const areasService = {
     async list(projectId: number): Promise<Area[]> {
@@ -25,4 +25,9 @@ export const areasService = {
         const response = await api.post<Area[]>(`/api/projects/${projectId}/areas/reorder`, areaIds);
         return response.data;
     },
+
+    async bulk(projectId: number, operation: AreaBulkOperation): Promise<Area[]> {
+        const response = await api.post<Area[]>(`/api/projects/${projectId}/areas/bulk`, operation);
+        return response.data;
+    },
 };
@@ -13,6 +13,7 @@ export const authService = {
 
         // Store token and user
         localStorage.setItem('token', response.data.access_token);
+        localStorage.setItem('refresh_token', response.data.refresh_token ?? '');
         localStorage.setItem('user', JSON.stringify(response.data.user));
 
         return response.data;
@@ -29,7 +30,13 @@ export const authService = {
     },
 
     logout() {
+        const refreshToken = localStorage.getItem('refresh_token');
+        if (refreshToken) {
+            // Best effort - the tokens are dropped locally either way
+            api.post('/api/auth/logout', { refresh_token: refreshToken }).catch(() => undefined);
+        }
         localStorage.removeItem('token');
+        localStorage.removeItem('refresh_token');
         localStorage.removeItem('user');
     },
 
@@ -58,5 +65,10 @@ export const authService = {
             current_password: currentPassword,
             new_password: newPassword,
         });
+        // The change revokes every refresh token, this session's included
+        const user = this.getUser();
+        if (user) {
+            await this.login(user.email, newPassword);
+        }
     },
 };
@@ -1,14 +1,20 @@
 import api from './api';
-import type { Issue, IssueCreate, IssueUpdate, IssueStatusUpdate, IssuePhoto, ListResponse } from '../types';
+import type {
+    Issue, IssueCreate, IssueUpdate, IssueStatusUpdate, IssuePhoto, ListResponse, PageParams,
+    IssueBulkCreateResult, IssueBulkSelection, IssueBulkUpdateResult, IssueStatus
+} from '../types';
+
+type IssueFilters = {
+    status?: string;
+    priority?: string;
+    area_id?: number;
+    contractor_id?: number;
+    trade_id?: number;
+    trade?: string;
+};
 
 export const issuesService = {
-    async list(projectId: number, params?: {
-        status?: string;
-        priority?: string;
-        area_id?: number;
-        contractor_id?: number;
-        trade?: string;
-    }): Promise<ListResponse<Issue>> {
+    async list(projectId: number, params?: IssueFilters & PageParams): Promise<ListResponse<Issue>> {
         const response = await api.get<ListResponse<Issue>>(
             `/api/projects/${projectId}/issues`,
             { params }
@@ -16,6 +22,18 @@ export const issuesService = {
         return response.data;
     },
 
+    // Follows next_cursor until every matching issue is loaded
+    async listAll(projectId: number, params?: IssueFilters): Promise<Issue[]> {
+        const issues: Issue[] = [];
+        let cursor: string | undefined;
+        do {
+            const page = await this.list(projectId, { ...params, cursor, limit: 500, total: 'none' });
+            issues.push(...page.items);
+            cursor = page.next_cursor ?? undefined;
+        } while (cursor);
+        return issues;
+    },
+
     async get(projectId: number, issueId: number): Promise<Issue> {
         const response = await api.get<Issue>(`/api/projects/${projectId}/issues/${issueId}`);
         return response.data;
@@ -31,6 +49,42 @@ export const issuesService = {
         return response.data;
     },
 
+    // Up to 500 issues in one transaction; invalid items are reported per index
+    async bulkCreate(projectId: number, items: IssueCreate[]): Promise<IssueBulkCreateResult> {
+        const response = await api.post<IssueBulkCreateResult>(
+            `/api/projects/${projectId}/issues/bulk`,
+            { items }
+        );
+        return response.data;
+    },
+
+    // Issues that can't be closed (no "after" photo) are returned in `skipped`
+    async bulkUpdateStatus(
+        projectId: number,
+        selection: IssueBulkSelection,
+        status: IssueStatus,
+        notes?: string
+    ): Promise<IssueBulkUpdateResult> {
+        const response = await api.patch<IssueBulkUpdateResult>(
+            `/api/projects/${projectId}/issues/bulk/status`,
+            { ...selection, status, notes }
+        );
+        return response.data;
+    },
+
+    // contractorId null unassigns
+    async bulkAssign(
+        projectId: number,
+        selection: IssueBulkSelection,
+        contractorId: number | null
+    ): Promise<IssueBulkUpdateResult> {
+        const response = await api.patch<IssueBulkUpdateResult>(
+            `/api/projects/${projectId}/issues/bulk/assign`,
+            { ...selection, contractor_id: contractorId }
+        );
+        return response.data;
+    },
+
     async update(projectId: number, issueId: number, data: IssueUpdate): Promise<Issue> {
         const response = await api.patch<Issue>(
             `/api/projects/${projectId}/issues/${issueId}`,
@@ -0,0 +1,34 @@
+import api from './api';
+import type { ProjectTemplate, ProjectTemplateCreate } from '../types';
+
+export const projectTemplatesService = {
+    async list(): Promise<ProjectTemplate[]> {
+        const response = await api.get<ProjectTemplate[]>('/api/project-templates/');
+        return response.data;
+    },
+
+    async get(id: number): Promise<ProjectTemplate> {
+        const response = await api.get<ProjectTemplate>(`/api/project-templates/${id}`);
+        return response.data;
+    },
+
+    async create(data: ProjectTemplateCreate): Promise<ProjectTemplate> {
+        const response = await api.post<ProjectTemplate>('/api/project-templates/', data);
+        return response.data;
+    },
+
+    // Save a project's areas, contractors and manual values as a template
+    async createFromProject(projectId: number, data: { name: string; description?: string }): Promise<ProjectTemplate> {
+        const response = await api.post<ProjectTemplate>(`/api/project-templates/from-project/${projectId}`, data);
+        return response.data;
+    },
+
+    async update(id: number, data: Partial<ProjectTemplateCreate>): Promise<ProjectTemplate> {
+        const response = await api.patch<ProjectTemplate>(`/api/project-templates/${id}`, data);
+        return response.data;
+    },
+
+    async delete(id: number): Promise<void> {
+        await api.delete(`/api/project-templates/${id}`);
+    },
+};
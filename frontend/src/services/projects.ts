@@ -1,12 +1,24 @@
 import api from './api';
-import type { Project, ProjectCreate, ProjectDashboard, ListResponse } from '../types';
+import type {
+    Project, ProjectBulkCreate, ProjectCreate, ProjectDashboard, ProjectSetupOptions,
+    ProjectPortfolioItem, ListResponse, PageParams,
+} from '../types';
 
 export const projectsService = {
-    async list(params?: { status?: string; search?: string }): Promise<ListResponse<Project>> {
+    async list(params?: { status?: string; search?: string } & PageParams): Promise<ListResponse<Project>> {
         const response = await api.get<ListResponse<Project>>('/api/projects/', { params });
         return response.data;
     },
 
+    // Every project with issue counts and manual progress in one request
+    async portfolio(params?: { status?: string; search?: string }): Promise<ProjectPortfolioItem[]> {
+        const response = await api.get<{ items: ProjectPortfolioItem[]; total: number }>(
+            '/api/projects/portfolio',
+            { params }
+        );
+        return response.data.items;
+    },
+
     async get(id: number): Promise<Project> {
         const response = await api.get<Project>(`/api/projects/${id}`);
         return response.data;
@@ -17,13 +29,19 @@ export const projectsService = {
         return response.data;
     },
 
-    async create(data: ProjectCreate, createDefaultAreas = true): Promise<Project> {
+    async create(data: ProjectCreate, createDefaultAreas = true, setup: ProjectSetupOptions = {}): Promise<Project> {
         const response = await api.post<Project>('/api/projects/', data, {
-            params: { create_default_areas: createDefaultAreas },
+            params: { create_default_areas: createDefaultAreas, ...setup },
         });
         return response.data;
     },
 
+    // Many projects with the same setup (e.g. all units of a subdivision) in one transaction
+    async bulkCreate(data: ProjectBulkCreate): Promise<Project[]> {
+        const response = await api.post<Project[]>('/api/projects/bulk', data);
+        return response.data;
+    },
+
     async update(id: number, data: Partial<ProjectCreate>): Promise<Project> {
         const response = await api.patch<Project>(`/api/projects/${id}`, data);
         return response.data;
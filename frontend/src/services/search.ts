@@ -0,0 +1,16 @@
+import api from './api';
+import type { SearchKind, SearchResult } from '../types';
+
+export const searchService = {
+    async search(
+        q: string,
+        params?: { kind?: SearchKind[]; project_id?: number; limit?: number }
+    ): Promise<SearchResult[]> {
+        const response = await api.get<{ items: SearchResult[] }>('/api/search/', {
+            params: { q, ...params },
+            // Repeat list params as kind=a&kind=b (the API doesn't read kind[]=)
+            paramsSerializer: { indexes: null },
+        });
+        return response.data.items;
+    },
+};
@@ -0,0 +1,16 @@
+import api from './api';
+import type { TypeaheadItem, TypeaheadKind } from '../types';
+
+export const typeaheadService = {
+    // Prefix suggestions served from in-memory indexes - cheap enough to call per keystroke
+    async suggest(
+        q: string,
+        params?: { kind?: TypeaheadKind[]; project_id?: number; limit?: number }
+    ): Promise<TypeaheadItem[]> {
+        const response = await api.get<{ items: TypeaheadItem[] }>('/api/typeahead/', {
+            params: { q, ...params },
+            paramsSerializer: { indexes: null },
+        });
+        return response.data.items;
+    },
+};
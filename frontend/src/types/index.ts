@@ -29,6 +29,7 @@ export interface UserCreate {
 export interface Token {
     access_token: string;
     token_type: string;
+    refresh_token?: string;
     user: User;
 }
 
@@ -55,6 +56,45 @@ export interface ProjectCreate {
     notes?: string;
 }
 
+// How new projects are populated; template_id and clone_from are mutually exclusive
+export interface ProjectSetupOptions {
+    create_default_areas?: boolean;
+    assign_all_contractors?: boolean;
+    template_id?: number;
+    clone_from?: number;
+}
+
+export interface ProjectBulkCreate extends ProjectSetupOptions {
+    projects: ProjectCreate[];
+}
+
+export interface ProjectTemplate {
+    id: number;
+    name: string;
+    description?: string;
+    areas: string[];
+    contractor_ids?: number[] | null; // null = all active contractors
+    manual_template_id?: number;
+    manual_fields?: Record<string, unknown>;
+    created_by?: number;
+    created_at?: string;
+    updated_at?: string;
+}
+
+export type ProjectTemplateCreate = Omit<ProjectTemplate, 'id' | 'created_by' | 'created_at' | 'updated_at'>;
+
+export interface ProjectPortfolioItem extends Project {
+    total_issues: number;
+    open_issues: number;
+    high_priority_open: number;
+    ready_for_reinspect: number;
+    closed_issues: number;
+    last_activity_at?: string;
+    manual_sections_completed: number;
+    manual_sections_total: number;
+    manual_completion: number; // 0-1
+}
+
 export interface ProjectDashboard {
     project: Project;
     total_issues: number;
@@ -81,6 +121,13 @@ export interface AreaCreate {
     order?: number;
 }
 
+export interface AreaBulkOperation {
+    create?: AreaCreate[];
+    rename?: { id: number; name: string }[];
+    delete?: number[];
+    order?: number[];
+}
+
 // Contractor
 export interface Contractor {
     id: number;
@@ -114,6 +161,7 @@ export interface ProjectContractor {
     project_id: number;
     contractor_id: number;
     contractor: Contractor;
+    trade_ids: number[];
     trades: string[];
     notes?: string;
     created_at?: string;
@@ -121,7 +169,8 @@ export interface ProjectContractor {
 
 export interface ProjectContractorCreate {
     contractor_id: number;
-    trades?: string[];
+    trade_ids?: number[];
+    trades?: string[];  // Trade names (older clients)
     notes?: string;
 }
 
@@ -162,13 +211,14 @@ export interface IssuePhoto {
 export interface Issue {
     id: number;
     project_id: number;
-    area_id: number;
+    area_id?: number;
     category: string;
     subcategory?: string;
     description?: string;
     priority: IssuePriority;
     status: IssueStatus;
     trade?: string;
+    trade_id?: number;
     contractor_id?: number;
     due_date?: string;
     created_by?: number;
@@ -190,6 +240,7 @@ export interface IssueCreate {
     description?: string;
     priority?: IssuePriority;
     trade?: string;
+    trade_id?: number;
     contractor_id?: number;
     due_date?: string;
 }
@@ -201,6 +252,7 @@ export interface IssueUpdate {
     description?: string;
     priority?: IssuePriority;
     trade?: string;
+    trade_id?: number;
     contractor_id?: number;
     due_date?: string;
 }
@@ -210,6 +262,37 @@ export interface IssueStatusUpdate {
     notes?: string;
 }
 
+export interface IssueBulkItemResult {
+    index: number; // position in the request's items
+    id: number | null; // set when created
+    error: string | null;
+}
+
+export interface IssueBulkCreateResult {
+    created: number;
+    failed: number;
+    results: IssueBulkItemResult[];
+}
+
+// Bulk updates pick issues by id or with the issue list filters
+export interface IssueBulkSelection {
+    issue_ids?: number[];
+    filter?: {
+        status?: IssueStatus;
+        priority?: IssuePriority;
+        area_id?: number;
+        contractor_id?: number;
+        trade_id?: number;
+    };
+}
+
+export interface IssueBulkUpdateResult {
+    matched: number;
+    updated: number;
+    skipped: { id: number; error: string }[];
+    not_found: number[];
+}
+
 // Manual
 export interface ManualInstance {
     id: number;
@@ -231,5 +314,34 @@ export interface ManualAttachment {
 // List responses
 export interface ListResponse<T> {
     items: T[];
-    total: number;
+    total: number | null; // null when requested with total: 'none'
+    next_cursor: string | null;
+}
+
+export interface PageParams {
+    cursor?: string;
+    limit?: number;
+    total?: 'exact' | 'estimated' | 'none';
+}
+
+// Search
+export type SearchKind = 'project' | 'issue' | 'contractor';
+
+export interface SearchResult {
+    kind: SearchKind;
+    id: number;
+    project_id: number | null; // null for contractors
+    title: string;
+    snippet: string | null; // matched words wrapped in **
+    rank: number;
+}
+
+// Typeahead
+export type TypeaheadKind = 'contractor' | 'area' | 'category';
+
+export interface TypeaheadItem {
+    kind: TypeaheadKind;
+    id: number | null; // null for categories
+    label: string;
+    detail: string | null; // contact name for contractors
 }